@@ -0,0 +1,54 @@
+"""Add document_embeddings table for precomputed resume / job vectors.
+
+Revision ID: 003_document_embeddings
+Revises: 002_job_enhanced
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "003_document_embeddings"
+down_revision: Union[str, None] = "002_job_enhanced"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "document_embeddings",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("resume_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("job_description_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("model_name", sa.String(255), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("vector", postgresql.JSONB(), nullable=False),
+        sa.Column("chunk_vectors", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["job_description_id"], ["job_descriptions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("resume_id", "model_name", name="uq_document_embedding_resume_model"),
+        sa.UniqueConstraint(
+            "job_description_id", "model_name", name="uq_document_embedding_job_model"
+        ),
+        sa.CheckConstraint(
+            "(resume_id IS NULL) <> (job_description_id IS NULL)",
+            name="ck_document_embedding_single_owner",
+        ),
+    )
+    op.create_index("ix_document_embeddings_resume_id", "document_embeddings", ["resume_id"])
+    op.create_index(
+        "ix_document_embeddings_job_description_id",
+        "document_embeddings",
+        ["job_description_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_embeddings_job_description_id", "document_embeddings")
+    op.drop_index("ix_document_embeddings_resume_id", "document_embeddings")
+    op.drop_table("document_embeddings")
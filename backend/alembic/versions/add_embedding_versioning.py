@@ -0,0 +1,80 @@
+"""Tag document embeddings with model version / dimension and track the active model.
+
+Revision ID: 004_embedding_versions
+Revises: 003_document_embeddings
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004_embedding_versions"
+down_revision: Union[str, None] = "003_document_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_embeddings",
+        sa.Column("model_version", sa.String(64), nullable=False, server_default="1"),
+    )
+    op.add_column("document_embeddings", sa.Column("dimension", sa.Integer(), nullable=True))
+    op.execute("UPDATE document_embeddings SET dimension = jsonb_array_length(vector)")
+    op.alter_column("document_embeddings", "dimension", nullable=False)
+
+    op.drop_constraint("uq_document_embedding_resume_model", "document_embeddings", type_="unique")
+    op.drop_constraint("uq_document_embedding_job_model", "document_embeddings", type_="unique")
+    op.create_unique_constraint(
+        "uq_document_embedding_resume_model",
+        "document_embeddings",
+        ["resume_id", "model_name", "model_version"],
+    )
+    op.create_unique_constraint(
+        "uq_document_embedding_job_model",
+        "document_embeddings",
+        ["job_description_id", "model_name", "model_version"],
+    )
+
+    op.create_table(
+        "embedding_model_versions",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("model_name", sa.String(255), nullable=False),
+        sa.Column("model_version", sa.String(64), nullable=False),
+        sa.Column("dimension", sa.Integer(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("activated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("model_name", "model_version", name="uq_embedding_model_version"),
+    )
+    op.create_index(
+        "uq_embedding_model_versions_active",
+        "embedding_model_versions",
+        ["is_active"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_embedding_model_versions_active", "embedding_model_versions")
+    op.drop_table("embedding_model_versions")
+
+    op.drop_constraint("uq_document_embedding_job_model", "document_embeddings", type_="unique")
+    op.drop_constraint("uq_document_embedding_resume_model", "document_embeddings", type_="unique")
+    op.execute("DELETE FROM document_embeddings WHERE model_version <> '1'")
+    op.create_unique_constraint(
+        "uq_document_embedding_resume_model",
+        "document_embeddings",
+        ["resume_id", "model_name"],
+    )
+    op.create_unique_constraint(
+        "uq_document_embedding_job_model",
+        "document_embeddings",
+        ["job_description_id", "model_name"],
+    )
+    op.drop_column("document_embeddings", "dimension")
+    op.drop_column("document_embeddings", "model_version")
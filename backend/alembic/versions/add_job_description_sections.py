@@ -0,0 +1,27 @@
+"""Store section spans of job descriptions.
+
+Rows created before this revision stay NULL and are segmented when their
+skills are next extracted.
+
+Revision ID: 008_job_description_sections
+Revises: 007_skills_taxonomy_version
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008_job_description_sections"
+down_revision: Union[str, None] = "007_skills_taxonomy_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("job_descriptions", sa.Column("sections", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_descriptions", "sections")
@@ -0,0 +1,68 @@
+"""Store normalized text and a content hash on resumes and job descriptions.
+
+Existing rows are backfilled in batches.
+
+Revision ID: 009_normalized_document_text
+Revises: 008_job_description_sections
+Create Date: 2026-10-16
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "009_normalized_document_text"
+down_revision: Union[str, None] = "008_job_description_sections"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH = 500
+# Must match app.services.ai.text (normalize_text, content_hash).
+_DISALLOWED = re.compile(r"[^a-z0-9\s\+\#\.]")
+_WHITESPACE = re.compile(r"\s+")
+
+_TABLES = (("resumes", "extracted_text"), ("job_descriptions", "description_text"))
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_DISALLOWED.sub(" ", text.lower()).split())
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(_WHITESPACE.sub(" ", text).strip().encode("utf-8")).hexdigest()
+
+
+def _backfill(conn, table: str, column: str) -> None:
+    last_id = None
+    while True:
+        query = f"SELECT id, {column} AS text FROM {table} WHERE {column} IS NOT NULL"
+        params: dict = {"limit": _BATCH}
+        if last_id is not None:
+            query += " AND id > :last_id"
+            params["last_id"] = last_id
+        query += " ORDER BY id LIMIT :limit"
+        rows = conn.execute(sa.text(query), params).all()
+        if not rows:
+            break
+        conn.execute(
+            sa.text(f"UPDATE {table} SET normalized_text = :normalized, content_hash = :hash WHERE id = :id"),
+            [{"id": row.id, "normalized": _normalize(row.text), "hash": _hash(row.text)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, column in _TABLES:
+        op.add_column(table, sa.Column("normalized_text", sa.Text(), nullable=True))
+        op.add_column(table, sa.Column("content_hash", sa.String(64), nullable=True))
+        _backfill(conn, table, column)
+
+
+def downgrade() -> None:
+    for table, _ in reversed(_TABLES):
+        op.drop_column(table, "content_hash")
+        op.drop_column(table, "normalized_text")
@@ -0,0 +1,37 @@
+"""Add skill_aliases for canonical skill names.
+
+Revision ID: 006_skill_aliases
+Revises: 005_compact_embeddings
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "006_skill_aliases"
+down_revision: Union[str, None] = "005_compact_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "skill_aliases",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("alias", sa.String(255), nullable=False),
+        sa.Column("skill_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("match_in_text", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["skill_id"], ["skills.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("alias"),
+    )
+    op.create_index("ix_skill_aliases_skill_id", "skill_aliases", ["skill_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_skill_aliases_skill_id", table_name="skill_aliases")
+    op.drop_table("skill_aliases")
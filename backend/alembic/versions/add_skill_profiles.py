@@ -0,0 +1,84 @@
+"""Dense skill ordinals and bitset skill profiles on resumes and job descriptions.
+
+Existing skills are numbered by the identity column; profiles of already
+extracted documents are backfilled from their join rows in batches.
+
+Revision ID: 010_skill_profiles
+Revises: 009_normalized_document_text
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "010_skill_profiles"
+down_revision: Union[str, None] = "009_normalized_document_text"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH = 500
+# (document table, join table, join column)
+_TABLES = (
+    ("resumes", "resume_skills", "resume_id"),
+    ("job_descriptions", "job_skills", "job_description_id"),
+)
+
+
+def _profile_bytes(ordinals: list[int]) -> bytes:
+    # Must match app.services.ai.skill_profiles.profile_to_bytes.
+    profile = 0
+    for ordinal in ordinals:
+        profile |= 1 << ordinal
+    return profile.to_bytes((profile.bit_length() + 63) // 64 * 8, "little")
+
+
+def _backfill(conn, table: str, join_table: str, column: str) -> None:
+    last_id = None
+    while True:
+        query = f"SELECT id FROM {table} WHERE skills_taxonomy_version IS NOT NULL"
+        params: dict = {"limit": _BATCH}
+        if last_id is not None:
+            query += " AND id > :last_id"
+            params["last_id"] = last_id
+        query += " ORDER BY id LIMIT :limit"
+        ids = conn.execute(sa.text(query), params).scalars().all()
+        if not ids:
+            break
+        ordinals: dict = {doc_id: [] for doc_id in ids}
+        rows = conn.execute(
+            sa.text(
+                f"SELECT j.{column} AS owner_id, s.ordinal FROM {join_table} j "
+                f"JOIN skills s ON s.id = j.skill_id WHERE j.{column} = ANY(:ids)"
+            ),
+            {"ids": list(ids)},
+        )
+        for owner_id, ordinal in rows:
+            ordinals[owner_id].append(ordinal)
+        conn.execute(
+            sa.text(f"UPDATE {table} SET skill_profile = :profile WHERE id = :id"),
+            [{"id": doc_id, "profile": _profile_bytes(found)} for doc_id, found in ordinals.items()],
+        )
+        last_id = ids[-1]
+
+
+def upgrade() -> None:
+    # Adding an identity column numbers the existing rows.
+    op.add_column(
+        "skills",
+        sa.Column("ordinal", sa.Integer(), sa.Identity(start=0, minvalue=0), nullable=False),
+    )
+    op.create_unique_constraint("skills_ordinal_key", "skills", ["ordinal"])
+
+    conn = op.get_bind()
+    for table, join_table, column in _TABLES:
+        op.add_column(table, sa.Column("skill_profile", sa.LargeBinary(), nullable=True))
+        _backfill(conn, table, join_table, column)
+
+
+def downgrade() -> None:
+    for table, _, _ in reversed(_TABLES):
+        op.drop_column(table, "skill_profile")
+    op.drop_constraint("skills_ordinal_key", "skills", type_="unique")
+    op.drop_column("skills", "ordinal")
@@ -0,0 +1,28 @@
+"""Stamp resumes and job descriptions with the taxonomy version of their stored skills.
+
+Existing rows stay NULL, so their skills are re-extracted on next analysis.
+
+Revision ID: 007_skills_taxonomy_version
+Revises: 006_skill_aliases
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007_skills_taxonomy_version"
+down_revision: Union[str, None] = "006_skill_aliases"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("resumes", sa.Column("skills_taxonomy_version", sa.String(32), nullable=True))
+    op.add_column("job_descriptions", sa.Column("skills_taxonomy_version", sa.String(32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_descriptions", "skills_taxonomy_version")
+    op.drop_column("resumes", "skills_taxonomy_version")
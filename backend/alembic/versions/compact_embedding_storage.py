@@ -0,0 +1,102 @@
+"""Store document embeddings as compact binary (bytea) instead of JSONB float lists.
+
+Existing rows are re-encoded as normalized float16 in batches.
+
+Revision ID: 005_compact_embeddings
+Revises: 004_embedding_versions
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "005_compact_embeddings"
+down_revision: Union[str, None] = "004_embedding_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH = 500
+# Header matches app.services.ai.quantization: code 1 = f16, 3 reserved bytes.
+_F16_HEADER = bytes([1, 0, 0, 0])
+
+
+def _unit(arr: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(arr, axis=-1, keepdims=True)
+    return arr / np.where(norm == 0, 1.0, norm)
+
+
+def _encode_vector(values: list) -> bytes:
+    vec = _unit(np.asarray(values, dtype=np.float32))
+    return _F16_HEADER + vec.astype(np.float16).tobytes()
+
+
+def _encode_matrix(values: list | None) -> bytes | None:
+    if values is None:
+        return None
+    mat = np.asarray(values, dtype=np.float32)
+    if mat.size == 0:
+        return _F16_HEADER + np.uint32(0).tobytes()
+    mat = _unit(mat.reshape(len(values), -1))
+    return _F16_HEADER + np.uint32(mat.shape[0]).tobytes() + mat.astype(np.float16).tobytes()
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_embeddings",
+        sa.Column("encoding", sa.String(8), nullable=False, server_default="f16"),
+    )
+    op.add_column("document_embeddings", sa.Column("vector_bin", sa.LargeBinary(), nullable=True))
+    op.add_column("document_embeddings", sa.Column("chunk_vectors_bin", sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    last_id = None
+    while True:
+        query = "SELECT id, vector, chunk_vectors FROM document_embeddings"
+        params: dict = {"limit": _BATCH}
+        if last_id is not None:
+            query += " WHERE id > :last_id"
+            params["last_id"] = last_id
+        query += " ORDER BY id LIMIT :limit"
+        rows = conn.execute(sa.text(query), params).all()
+        if not rows:
+            break
+        conn.execute(
+            sa.text(
+                "UPDATE document_embeddings SET vector_bin = :vector, "
+                "chunk_vectors_bin = :chunks WHERE id = :id"
+            ),
+            [
+                {
+                    "id": row.id,
+                    "vector": _encode_vector(row.vector),
+                    "chunks": _encode_matrix(row.chunk_vectors),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.drop_column("document_embeddings", "chunk_vectors")
+    op.drop_column("document_embeddings", "vector")
+    op.alter_column("document_embeddings", "vector_bin", new_column_name="vector", nullable=False)
+    op.alter_column("document_embeddings", "chunk_vectors_bin", new_column_name="chunk_vectors")
+
+
+def downgrade() -> None:
+    # Binary vectors are not converted back; they are recomputed on demand.
+    op.execute("DELETE FROM document_embeddings")
+    op.drop_column("document_embeddings", "chunk_vectors")
+    op.drop_column("document_embeddings", "vector")
+    op.drop_column("document_embeddings", "encoding")
+    op.add_column(
+        "document_embeddings",
+        sa.Column("vector", postgresql.JSONB(), nullable=False),
+    )
+    op.add_column(
+        "document_embeddings",
+        sa.Column("chunk_vectors", postgresql.JSONB(), nullable=True),
+    )
@@ -43,6 +43,60 @@ class Settings(BaseSettings):
     # LLM (profile extraction)
     openai_api_key: str | None = None
 
+    # Embeddings
+    embedding_model_name: str = "all-MiniLM-L6-v2"
+    embedding_device: str = "cpu"
+    embedding_warmup: bool = True
+    # Bump when the weights behind embedding_model_name change, so cached vectors are not reused.
+    embedding_model_version: str = "1"
+    # How long workers trust their cached view of the active embedding model version
+    embedding_version_refresh_seconds: float = 30.0
+    embedding_cache_size: int = 4096
+    # Binary format for stored / cached vectors: f32, f16 or int8 with per-vector scale
+    embedding_storage_encoding: Literal["f32", "f16", "i8"] = "f16"
+    embedding_cache_dir: str | None = "storage/embeddings/cache"
+    # Memory-mapped segments of job vectors shared by the workers on a host (unset disables)
+    vector_store_dir: str | None = "storage/embeddings/segments"
+    vector_store_dtype: Literal["f16", "f32"] = "f16"
+    vector_store_segment_rows: int = 65536
+    embedding_batching_enabled: bool = True
+    embedding_batch_window_ms: float = 10.0
+    embedding_batch_max_size: int = 64
+    # Long documents are split into overlapping word windows before encoding
+    embedding_chunking_enabled: bool = True
+    embedding_chunk_words: int = 180
+    embedding_chunk_overlap_words: int = 40
+    # Inference engine: PyTorch sentence-transformers, or an exported ONNX model on onnxruntime
+    embedding_backend: Literal["sentence-transformers", "onnx"] = "sentence-transformers"
+    onnx_model_dir: str = "storage/models/all-MiniLM-L6-v2-onnx"
+    onnx_quantized: bool = True
+    onnx_max_length: int = 256
+    # 0 lets onnxruntime pick (one thread per physical core)
+    onnx_intra_op_threads: int = 0
+
+    # Skill taxonomy: built-in skills plus the skills table ("database") or a JSON data file ("file")
+    skill_taxonomy_source: Literal["builtin", "database", "file"] = "database"
+    skill_taxonomy_file: str | None = None
+    skill_taxonomy_refresh_seconds: float = 60.0
+    skill_taxonomy_snapshot_dir: str = "storage/taxonomy"
+    # Second matching stage for misspelled / split skills ("Kubernets", "Postgre SQL")
+    skill_fuzzy_matching: bool = False
+    skill_fuzzy_min_confidence: float = 0.85
+
+    # Job ranking index: exact search per user up to ivf_min_jobs jobs, inverted file above
+    job_index_ivf_min_jobs: int = 5000
+    # IVF lists probed per query: the smallest of min_nprobe, 2 * min_nprobe, ... that
+    # reaches recall_target (recall@10 against exact search) on sample queries
+    job_index_min_nprobe: int = 8
+    job_index_recall_target: float = 0.95
+    job_index_max_users: int = 256
+    # Candidates fetched per requested result when re-ranking by skill coverage
+    job_index_rerank_factor: int = 4
+
+    # AI executors (0 process workers runs CPU-bound work on the thread pool instead)
+    ai_thread_pool_workers: int = 4
+    ai_process_pool_workers: int = 2
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
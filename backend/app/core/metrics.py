@@ -0,0 +1,82 @@
+"""
+Lightweight in-process metrics.
+
+These primitives are intentionally minimal: they keep counts in memory
+and expose plain dict snapshots that the /health endpoints serialize.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Any, Sequence
+
+
+class Counter:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; `buckets` are inclusive upper bounds.
+    """
+
+    def __init__(self, name: str, buckets: Sequence[float]) -> None:
+        self.name = name
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Upper bound of the bucket containing the q-th observation.
+        """
+        with self._lock:
+            if not self._count:
+                return None
+            rank = q * self._count
+            seen = 0
+            for idx, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank and n:
+                    return self.buckets[idx] if idx < len(self.buckets) else self._max
+            return self._max
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            count = self._count
+            total = self._sum
+            maximum = self._max
+            counts = list(self._counts)
+        labels = [f"le_{b:g}" for b in self.buckets] + ["le_inf"]
+        return {
+            "count": count,
+            "sum": round(total, 6),
+            "mean": round(total / count, 6) if count else None,
+            "max": round(maximum, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip(labels, counts)),
+        }
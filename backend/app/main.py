@@ -9,6 +9,19 @@ from .core.config import settings
 from .core.database import Base, engine
 from .core.errors import init_error_handlers
 from .routers import admin, analysis, auth, jobs, profile, resumes
+from .services.ai.batching import close_batchers, get_batcher_stats
+from .services.ai.embedding_cache import embedding_cache
+from .services.ai.embeddings import get_embedding_model_stats, warm_default_embedding_model
+from .services.ai.executors import (
+    get_executor_stats,
+    run_in_thread,
+    shutdown_executors,
+    warm_executors,
+)
+from .services.ai.job_index import job_indexes
+from .services.ai.taxonomy import taxonomy_registry
+from .services.ai.vector_store import vector_store
+from .services.skill_taxonomy import start_skill_taxonomy_refresher, stop_skill_taxonomy_refresher
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +52,33 @@ def create_app() -> FastAPI:
                 await conn.execute(text("CREATE SCHEMA public"))
             await conn.run_sync(Base.metadata.create_all)
 
+    @app.on_event("startup")
+    async def warm_ai_models() -> None:
+        await warm_executors()
+        if not settings.embedding_warmup:
+            return
+        # Load the embedding model before the first request so the first
+        # analysis after a deploy pays no cold-start penalty.
+        try:
+            loaded = await run_in_thread(warm_default_embedding_model)
+            logger.info(
+                "Embedding model warm model=%s load_seconds=%.2f",
+                loaded.model_name,
+                loaded.load_seconds,
+            )
+        except Exception:
+            logger.exception("Embedding model warm-up failed; it will load on first use")
+
+    @app.on_event("startup")
+    async def load_skill_taxonomy() -> None:
+        await start_skill_taxonomy_refresher()
+
+    @app.on_event("shutdown")
+    async def shutdown_ai_services() -> None:
+        await stop_skill_taxonomy_refresher()
+        await close_batchers()
+        shutdown_executors()
+
     # CORS
     origins: list[str] = []
     if settings.frontend_origin:
@@ -80,6 +120,18 @@ def create_app() -> FastAPI:
     async def health_check() -> dict:
         return {"status": "ok"}
 
+    @app.get("/health/ai", tags=["system"])
+    async def ai_health_check() -> dict:
+        return {
+            "embedding_models": get_embedding_model_stats(),
+            "embedding_cache": embedding_cache.stats(),
+            "embedding_batchers": get_batcher_stats(),
+            "executors": get_executor_stats(),
+            "skill_taxonomy": taxonomy_registry.stats(),
+            "job_indexes": job_indexes.stats(),
+            "vector_store": vector_store.stats() if vector_store is not None else None,
+        }
+
     return app
 
 
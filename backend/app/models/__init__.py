@@ -2,5 +2,5 @@
 SQLAlchemy ORM models.
 """
 
-from . import activity_log, analysis, job, profile, resume, skill, user  # noqa: F401
+from . import activity_log, analysis, embedding, job, profile, resume, skill, user  # noqa: F401
 
@@ -0,0 +1,107 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base
+
+
+class DocumentEmbedding(Base):
+    """
+    Precomputed embedding for exactly one resume or job description.
+    """
+
+    __tablename__ = "document_embeddings"
+    __table_args__ = (
+        UniqueConstraint(
+            "resume_id",
+            "model_name",
+            "model_version",
+            name="uq_document_embedding_resume_model",
+        ),
+        UniqueConstraint(
+            "job_description_id",
+            "model_name",
+            "model_version",
+            name="uq_document_embedding_job_model",
+        ),
+        CheckConstraint(
+            "(resume_id IS NULL) <> (job_description_id IS NULL)",
+            name="ck_document_embedding_single_owner",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    resume_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    job_description_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("job_descriptions.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    model_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    model_version: Mapped[str] = mapped_column(String(64), nullable=False, default="1")
+    dimension: Mapped[int] = mapped_column(Integer, nullable=False)
+    # sha256 of the normalized source text; a mismatch marks the vector stale.
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Encoded with services.ai.quantization; `encoding` mirrors the payload header.
+    encoding: Mapped[str] = mapped_column(String(8), nullable=False, default="f16")
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    chunk_vectors: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+class EmbeddingModelVersion(Base):
+    """
+    Registered embedding model versions; exactly one row is active.
+
+    Stored vectors are only compared when they share the active version,
+    so switching models is a single-row flip once re-embedding is done.
+    """
+
+    __tablename__ = "embedding_model_versions"
+    __table_args__ = (
+        UniqueConstraint("model_name", "model_version", name="uq_embedding_model_version"),
+        Index(
+            "uq_embedding_model_versions_active",
+            "is_active",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    model_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    model_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    dimension: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    activated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
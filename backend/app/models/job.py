@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Integer
+from sqlalchemy import DateTime, ForeignKey, Index, LargeBinary, String, Text, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,8 +33,17 @@ class JobDescription(Base):
     salary_range: Mapped[str | None] = mapped_column(String(100), nullable=True)
     tech_stack: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string array
     description_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # description_text as the skill matcher sees it, and its content hash
+    normalized_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     word_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     keywords: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string array
+    # JSON [[section, start, end], ...] over the normalized description text
+    sections: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Skill taxonomy version the stored job_skills rows were extracted with
+    skills_taxonomy_version: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    # Bitset of stored skill ordinals (little-endian uint64 words), written with them
+    skill_profile: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -1,7 +1,17 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Float, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +30,10 @@ class Skill(Base):
         default=uuid.uuid4,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    # Dense integer id; bit position in resume / job skill profiles
+    ordinal: Mapped[int] = mapped_column(
+        Integer, Identity(start=0, minvalue=0), nullable=False, unique=True
+    )
     category: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -39,6 +53,44 @@ class Skill(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+    aliases = relationship(
+        "SkillAlias",
+        back_populates="skill",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class SkillAlias(Base):
+    """
+    Alternative spelling of a skill ("reactjs" -> "react").
+
+    Aliases are compiled into the skill matcher; `match_in_text=False`
+    keeps an ambiguous spelling out of text matching so it only
+    canonicalizes names that were already extracted.
+    """
+
+    __tablename__ = "skill_aliases"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    alias: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    skill_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("skills.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    match_in_text: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    skill = relationship("Skill", back_populates="aliases")
 
 
 class ResumeSkill(Base):
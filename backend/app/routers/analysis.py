@@ -1,8 +1,18 @@
-from fastapi import APIRouter
+from uuid import UUID
+
+from fastapi import APIRouter, Query
 
 from ..core.deps import DBSessionDep, UserDep
-from ..schemas.analysis import AnalysisDashboardResponse, AnalysisResultRead, AnalysisRunRequest
-from ..services.analysis import list_analyses_for_user, run_analysis
+from ..schemas.analysis import (
+    AnalysisBatchRequest,
+    AnalysisBatchResponse,
+    AnalysisDashboardResponse,
+    AnalysisResultRead,
+    AnalysisRunRequest,
+    JobMatchResponse,
+)
+from ..services.analysis import list_analyses_for_user, run_analysis, run_batch_analysis
+from ..services.job_ranking import rank_jobs_for_resume
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
@@ -32,6 +42,59 @@ async def run_analysis_endpoint(
     )
 
 
+@router.post(
+    "/batch",
+    response_model=AnalysisBatchResponse,
+)
+async def run_batch_analysis_endpoint(
+    payload: AnalysisBatchRequest,
+    db: DBSessionDep,
+    current_user: UserDep,
+) -> AnalysisBatchResponse:
+    """
+    Score one resume against up to 100 job descriptions and return them
+    ranked by ATS score (best fit first).
+
+    Existing analyses are reused unless `force=true`.
+    """
+    return await run_batch_analysis(
+        db,
+        user=current_user,
+        resume_id=payload.resume_id,
+        job_description_ids=payload.job_description_ids,
+        force=payload.force,
+    )
+
+
+@router.get(
+    "/top-jobs",
+    response_model=JobMatchResponse,
+)
+async def get_top_jobs(
+    db: DBSessionDep,
+    current_user: UserDep,
+    resume_id: UUID,
+    k: int = Query(10, ge=1, le=100),
+    rerank: bool = False,
+) -> JobMatchResponse:
+    """
+    Return the user's k job descriptions most similar to a resume, best
+    first, from an in-memory index over their stored job embeddings.
+
+    With `rerank=true` a larger candidate set is re-ordered by embedding
+    similarity blended with skill coverage. No analyses are stored.
+    For users with many jobs the index is approximate: `approximate` and
+    `expected_recall` in the response say how much to trust the top-k.
+    """
+    return await rank_jobs_for_resume(
+        db,
+        user=current_user,
+        resume_id=resume_id,
+        k=k,
+        rerank=rerank,
+    )
+
+
 @router.get(
     "/history",
     response_model=list[AnalysisResultRead],
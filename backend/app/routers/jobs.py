@@ -1,7 +1,7 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 
 from ..core.deps import DBSessionDep, UserDep
 from ..schemas.job import (
@@ -10,6 +10,8 @@ from ..schemas.job import (
     JobDescriptionCreateResponse
 )
 from ..services import jobs as job_service
+from ..services.document_embeddings import precompute_job_embedding
+from ..services.document_skills import precompute_job_skills
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -26,6 +28,7 @@ async def create_job_description(
     payload: JobDescriptionCreate,
     db: DBSessionDep,
     current_user: UserDep,
+    background_tasks: BackgroundTasks,
 ) -> JobDescriptionCreateResponse:
     """
     Create a new job description for the authenticated user.
@@ -60,6 +63,10 @@ async def create_job_description(
             )
         
         logger.info(f"Successfully created job description {job.id} for user {current_user.id}")
+
+        # Extract skills and precompute the JD embedding once the response has been sent
+        background_tasks.add_task(precompute_job_skills, job.id)
+        background_tasks.add_task(precompute_job_embedding, job.id)
         
         # Return success response
         return JobDescriptionCreateResponse(
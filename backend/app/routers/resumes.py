@@ -1,7 +1,7 @@
 import os
 from uuid import UUID
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse
 
 from ..core.deps import DBSessionDep, UserDep
@@ -11,6 +11,8 @@ from ..schemas.resume import (
     ResumeRead,
 )
 from ..services import resumes as resume_service
+from ..services.document_embeddings import precompute_resume_embedding
+from ..services.document_skills import precompute_resume_skills
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
@@ -97,6 +99,7 @@ async def delete_resume(
     status_code=status.HTTP_201_CREATED,
 )
 async def upload_resume(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     title: str | None = Form(None),
     db: DBSessionDep = None,
@@ -116,6 +119,9 @@ async def upload_resume(
         filename=file.filename,
         title=title,
     )
+    # Extract skills and embed after the response is sent so "Analyze" is a pure lookup later.
+    background_tasks.add_task(precompute_resume_skills, resume.id)
+    background_tasks.add_task(precompute_resume_embedding, resume.id)
 
     return ResumeRead.model_validate(resume)
 
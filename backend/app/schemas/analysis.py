@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class AnalysisRunRequest(BaseModel):
@@ -10,6 +10,12 @@ class AnalysisRunRequest(BaseModel):
     force: bool = False
 
 
+class AnalysisBatchRequest(BaseModel):
+    resume_id: UUID
+    job_description_ids: list[UUID] = Field(..., min_length=1, max_length=100)
+    force: bool = False
+
+
 class AnalysisResultRead(BaseModel):
     id: UUID
     user_id: int
@@ -85,3 +91,43 @@ class AnalysisDashboardResponse(BaseModel):
     soft_skills: SoftSkills
     ai_recommendations: list[str]
 
+
+
+class AnalysisBatchItem(BaseModel):
+    rank: int
+    analysis_id: UUID
+    job_description_id: UUID
+    job_title: str
+    company: str | None = None
+    ats_score: float
+    similarity_score: float
+    matched_skills: list[str]
+    missing_skills: list[str]
+    cached: bool
+
+
+class AnalysisBatchResponse(BaseModel):
+    resume_id: UUID
+    items: list[AnalysisBatchItem]
+
+
+class JobMatchItem(BaseModel):
+    rank: int
+    job_description_id: UUID
+    job_title: str
+    company: str | None = None
+    similarity_score: float
+    # Share of the job's skills the resume has; only set when re-ranking.
+    skill_coverage: float | None = None
+    score: float
+
+
+class JobMatchResponse(BaseModel):
+    resume_id: UUID
+    index: str
+    indexed_jobs: int
+    # True when the index is an inverted file: a true top-k job may be missing.
+    approximate: bool = False
+    # Recall@10 of the index estimated when it was built; None for exact search.
+    expected_recall: float | None = None
+    items: list[JobMatchItem]
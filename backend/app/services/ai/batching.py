@@ -0,0 +1,183 @@
+"""
+Asyncio micro-batching in front of an embedding backend.
+
+Concurrent analyses each submit a handful of texts. Rather than calling
+`encode` once per request, pending texts are gathered for a short window
+(or until a maximum batch size is reached) and encoded in a single call;
+the resulting vectors are then fanned back out to the waiting callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from ...core.config import settings
+from ...core.metrics import Histogram
+from .executors import run_in_thread
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    texts: list[str]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class EmbeddingMicroBatcher:
+    def __init__(
+        self,
+        backend: Any,
+        *,
+        window_ms: float,
+        max_batch_size: int,
+    ) -> None:
+        self.backend = backend
+        self.window_s = max(0.0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self._queue: asyncio.Queue[_PendingRequest] | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.batch_size = Histogram(
+            "embedding_batch_size",
+            buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+        )
+        self.queue_wait_ms = Histogram(
+            "embedding_queue_wait_ms",
+            buckets=[1, 2, 5, 10, 20, 50, 100, 250, 500, 1000],
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self.backend.model_name
+
+    @property
+    def model_version(self) -> str:
+        return self.backend.model_version
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        # Synchronous callers (scripts, CLIs) bypass the batching queue.
+        return self.backend.embed(texts)
+
+    async def aembed(self, texts: Sequence[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        self._ensure_worker()
+        assert self._queue is not None
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(
+            _PendingRequest(texts=list(texts), future=future, enqueued_at=time.perf_counter())
+        )
+        return await future
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "window_ms": self.window_s * 1000.0,
+            "max_batch_size": self.max_batch_size,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batch_size": self.batch_size.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+        }
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _collect(self, first: _PendingRequest) -> list[_PendingRequest]:
+        assert self._queue is not None
+        batch = [first]
+        size = len(first.texts)
+        deadline = time.perf_counter() + self.window_s
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                nxt = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(nxt)
+            size += len(nxt.texts)
+        return batch
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            first = await self._queue.get()
+            batch = await self._collect(first)
+
+            started = time.perf_counter()
+            texts: list[str] = []
+            for req in batch:
+                self.queue_wait_ms.observe((started - req.enqueued_at) * 1000.0)
+                texts.extend(req.texts)
+            self.batch_size.observe(len(texts))
+
+            try:
+                vectors = await run_in_thread(self.backend.embed, texts)
+            except Exception as exc:
+                logger.warning("Batched embedding of %s texts failed: %r", len(texts), exc)
+                for req in batch:
+                    if not req.future.done():
+                        req.future.set_exception(exc)
+                continue
+
+            offset = 0
+            for req in batch:
+                n = len(req.texts)
+                if not req.future.done():
+                    req.future.set_result(vectors[offset : offset + n])
+                offset += n
+
+
+_batchers: dict[tuple[str, str], EmbeddingMicroBatcher] = {}
+
+
+def get_embedding_batcher(backend: Any) -> EmbeddingMicroBatcher:
+    """
+    Return the process-wide batcher for the backend's model.
+
+    One queue per model keeps batches homogeneous; backends for the same
+    model share the registry-held weights, so any instance can serve it.
+    """
+    key = (backend.model_name, backend.model_version)
+    batcher = _batchers.get(key)
+    if batcher is None:
+        batcher = EmbeddingMicroBatcher(
+            backend,
+            window_ms=settings.embedding_batch_window_ms,
+            max_batch_size=settings.embedding_batch_max_size,
+        )
+        _batchers[key] = batcher
+    return batcher
+
+
+def get_batcher_stats() -> list[dict[str, Any]]:
+    return [
+        {"model_name": name, "model_version": version, **b.stats()}
+        for (name, version), b in _batchers.items()
+    ]
+
+
+async def close_batchers() -> None:
+    for batcher in _batchers.values():
+        await batcher.close()
@@ -0,0 +1,113 @@
+"""
+Chunked embeddings for long documents.
+
+MiniLM-style encoders truncate input at their token limit, so a long
+resume would otherwise be compared using only its opening paragraphs.
+Documents are split into overlapping word windows; every chunk of every
+document is encoded in one batched call, and each document gets a
+pooled vector alongside its per-chunk vectors.
+
+Chunk texts go through the content-addressed embedding cache, so a
+re-analysis of an unchanged document does not re-encode anything.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from ...core.config import settings
+from .embeddings import AsyncEmbeddingBackend
+
+
+@dataclass
+class TextChunk:
+    index: int
+    start_word: int
+    end_word: int
+    text: str
+
+
+@dataclass
+class DocumentEmbedding:
+    vector: np.ndarray
+    chunk_vectors: np.ndarray
+    chunks: list[TextChunk]
+
+
+def chunk_text(text: str, *, window_words: int, overlap_words: int) -> list[TextChunk]:
+    words = (text or "").split()
+    if not words:
+        return []
+
+    window = max(1, window_words)
+    step = max(1, window - max(0, overlap_words))
+    chunks: list[TextChunk] = []
+    start = 0
+    while True:
+        end = min(len(words), start + window)
+        chunks.append(
+            TextChunk(
+                index=len(chunks),
+                start_word=start,
+                end_word=end,
+                text=" ".join(words[start:end]),
+            )
+        )
+        if end >= len(words):
+            break
+        start += step
+    return chunks
+
+
+def pool_chunk_vectors(chunk_vectors: np.ndarray, chunks: Sequence[TextChunk]) -> np.ndarray:
+    """
+    Word-count-weighted mean of L2-normalized chunk vectors, re-normalized.
+    """
+    if chunk_vectors.size == 0:
+        return chunk_vectors.reshape(-1)
+    norms = np.linalg.norm(chunk_vectors, axis=1, keepdims=True)
+    unit = chunk_vectors / np.where(norms == 0, 1.0, norms)
+    weights = np.asarray([c.end_word - c.start_word for c in chunks], dtype=np.float64)
+    pooled = (unit * weights[:, None]).sum(axis=0) / max(1.0, weights.sum())
+    norm = np.linalg.norm(pooled)
+    return pooled / norm if norm else pooled
+
+
+async def aembed_documents(
+    backend: AsyncEmbeddingBackend,
+    texts: Sequence[str],
+    *,
+    window_words: int | None = None,
+    overlap_words: int | None = None,
+) -> list[DocumentEmbedding]:
+    window = window_words or settings.embedding_chunk_words
+    overlap = settings.embedding_chunk_overlap_words if overlap_words is None else overlap_words
+
+    if not settings.embedding_chunking_enabled:
+        # One chunk per document; the encoder truncates as it always did.
+        per_doc = [
+            [TextChunk(index=0, start_word=0, end_word=len(t.split()), text=t)] if t.strip() else []
+            for t in texts
+        ]
+    else:
+        per_doc = [chunk_text(t, window_words=window, overlap_words=overlap) for t in texts]
+
+    flat = [c.text for chunks in per_doc for c in chunks]
+    vectors = np.asarray(await backend.aembed(flat), dtype=np.float64) if flat else np.zeros((0, 0))
+
+    results: list[DocumentEmbedding] = []
+    offset = 0
+    for chunks in per_doc:
+        chunk_vectors = vectors[offset : offset + len(chunks)]
+        offset += len(chunks)
+        results.append(
+            DocumentEmbedding(
+                vector=pool_chunk_vectors(chunk_vectors, chunks),
+                chunk_vectors=chunk_vectors,
+                chunks=chunks,
+            )
+        )
+    return results
@@ -0,0 +1,230 @@
+"""
+Content-addressed embedding cache.
+
+Vectors are keyed by (model name, model version, sha256 of the
+normalized text), so the same resume scored against many jobs, or a
+forced re-run of the same pair, never re-encodes identical text.
+
+Two tiers are used:
+- an in-process LRU holding recently used vectors;
+- a durable on-disk store shared by all workers on the host.
+
+Both tiers hold compactly encoded, L2-normalized vectors (see
+`quantization`), so every vector handed out by the cache is unit length.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+
+from ...core.config import settings
+from ...core.metrics import Counter
+from ...utils.storage import BASE_DIR
+from .executors import run_in_thread
+from .quantization import Encoding, decode_vector, encode_vector
+from .text import content_hash
+
+if TYPE_CHECKING:
+    from .embeddings import AsyncEmbeddingBackend, EmbeddingBackend
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+CacheKey = tuple[str, str, str]
+
+
+def normalize_for_embedding(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+def text_hash(text: str) -> str:
+    return content_hash(text)
+
+
+class EmbeddingCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        disk_dir: Path | None,
+        encoding: Encoding = "f16",
+    ) -> None:
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.encoding = encoding
+        self._lru: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = Counter("embedding_cache_memory_hits")
+        self.disk_hits = Counter("embedding_cache_disk_hits")
+        self.misses = Counter("embedding_cache_misses")
+
+    def get(self, key: CacheKey) -> np.ndarray | None:
+        with self._lock:
+            vec = self._lru.get(key)
+            if vec is not None:
+                self._lru.move_to_end(key)
+        if vec is not None:
+            self.memory_hits.inc()
+            return vec
+
+        vec = self._read_disk(key)
+        if vec is not None:
+            self.disk_hits.inc()
+            self._remember(key, vec)
+            return vec
+
+        self.misses.inc()
+        return None
+
+    def put(self, key: CacheKey, vec: np.ndarray) -> np.ndarray:
+        """
+        Store a vector and return the (normalized, decoded) form that was cached.
+        """
+        payload = encode_vector(vec, self.encoding)
+        decoded = decode_vector(payload)
+        self._remember(key, decoded)
+        self._write_disk(key, payload)
+        return decoded
+
+    def stats(self) -> dict[str, Any]:
+        memory_hits = self.memory_hits.value
+        disk_hits = self.disk_hits.value
+        misses = self.misses.value
+        lookups = memory_hits + disk_hits + misses
+        return {
+            "entries": len(self._lru),
+            "max_entries": self.max_entries,
+            "disk_enabled": self.disk_dir is not None,
+            "encoding": self.encoding,
+            "memory_hits": memory_hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_ratio": round((memory_hits + disk_hits) / lookups, 4) if lookups else None,
+        }
+
+    def _remember(self, key: CacheKey, vec: np.ndarray) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._lru[key] = vec
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def _path_for(self, key: CacheKey) -> Path:
+        assert self.disk_dir is not None
+        model_name, model_version, digest = key
+        safe_model = model_name.replace("/", "__")
+        return self.disk_dir / safe_model / model_version / digest[:2] / f"{digest}.vec"
+
+    def _read_disk(self, key: CacheKey) -> np.ndarray | None:
+        if self.disk_dir is None:
+            return None
+        path = self._path_for(key)
+        try:
+            return decode_vector(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, IndexError):
+            logger.warning("Discarding unreadable embedding cache entry %s", path)
+            return None
+
+    def _write_disk(self, key: CacheKey, payload: bytes) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Failed to persist embedding cache entry %s", path)
+
+
+class CachedEmbeddingBackend:
+    """
+    EmbeddingBackend wrapper that only sends cache misses to the encoder.
+    """
+
+    def __init__(self, backend: Any, cache: EmbeddingCache) -> None:
+        self.backend = backend
+        self.cache = cache
+
+    @property
+    def model_name(self) -> str:
+        return self.backend.model_name
+
+    @property
+    def model_version(self) -> str:
+        return self.backend.model_version
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        keys, vectors, pending = self._lookup(texts)
+        if pending:
+            computed = self.backend.embed(list(pending.values()))
+            vectors = self._fill(keys, vectors, pending, computed)
+        return [np.asarray(v, dtype=float).tolist() for v in vectors]
+
+    async def aembed(self, texts: Sequence[str]) -> list[list[float]]:
+        keys, vectors, pending = self._lookup(texts)
+        if pending:
+            miss_texts = list(pending.values())
+            if hasattr(self.backend, "aembed"):
+                computed = await self.backend.aembed(miss_texts)
+            else:
+                computed = await run_in_thread(self.backend.embed, miss_texts)
+            vectors = self._fill(keys, vectors, pending, computed)
+        return [np.asarray(v, dtype=float).tolist() for v in vectors]
+
+    def _lookup(
+        self, texts: Sequence[str]
+    ) -> tuple[list[CacheKey], list[np.ndarray | None], dict[CacheKey, str]]:
+        keys = [(self.model_name, self.model_version, text_hash(t)) for t in texts]
+        vectors: list[np.ndarray | None] = [self.cache.get(k) for k in keys]
+
+        # Deduplicate misses so repeated texts in one batch are encoded once.
+        pending: dict[CacheKey, str] = {}
+        for key, text, vec in zip(keys, texts, vectors):
+            if vec is None and key not in pending:
+                pending[key] = text
+        return keys, vectors, pending
+
+    def _fill(
+        self,
+        keys: list[CacheKey],
+        vectors: list[np.ndarray | None],
+        pending: dict[CacheKey, str],
+        computed: Sequence[Sequence[float]],
+    ) -> list[np.ndarray | None]:
+        fresh = {
+            key: self.cache.put(key, np.asarray(vec, dtype=np.float32))
+            for key, vec in zip(pending.keys(), computed)
+        }
+        return [fresh.get(k) if v is None else v for k, v in zip(keys, vectors)]
+
+
+def _default_disk_dir() -> Path | None:
+    if not settings.embedding_cache_dir:
+        return None
+    return BASE_DIR / settings.embedding_cache_dir
+
+
+embedding_cache = EmbeddingCache(
+    max_entries=settings.embedding_cache_size,
+    disk_dir=_default_disk_dir(),
+    encoding=settings.embedding_storage_encoding,
+)
+
+
+def get_cached_backend(backend: EmbeddingBackend) -> AsyncEmbeddingBackend:
+    return CachedEmbeddingBackend(backend, embedding_cache)
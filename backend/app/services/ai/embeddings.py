@@ -1,49 +1,276 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Protocol, Sequence
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Protocol, Sequence
 
 import numpy as np
 
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingBackend(Protocol):
     def embed(self, texts: Sequence[str]) -> list[list[float]]:  # pragma: no cover - interface
         ...
 
 
+class AsyncEmbeddingBackend(EmbeddingBackend, Protocol):
+    async def aembed(self, texts: Sequence[str]) -> list[list[float]]:  # pragma: no cover - interface
+        ...
+
+
+def _current_rss_bytes() -> int | None:
+    """
+    Resident set size of this process, or None where /proc is unavailable.
+    """
+    try:
+        import resource
+
+        with open("/proc/self/statm", "rb") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * resource.getpagesize()
+    except (OSError, ValueError, IndexError, ImportError):
+        return None
+
+
+def _parameter_bytes(model: Any) -> int | None:
+    try:
+        return int(sum(p.numel() * p.element_size() for p in model.parameters()))
+    except Exception:
+        return getattr(model, "parameter_bytes", None)
+
+
+@dataclass
+class LoadedModel:
+    model_name: str
+    device: str
+    model: Any
+    load_seconds: float
+    parameter_bytes: int | None
+    rss_delta_bytes: int | None
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class EmbeddingModelRegistry:
+    """
+    Process-wide registry of loaded embedding models.
+
+    Each (model_name, device) pair is loaded exactly once per process and
+    shared by every backend instance, so request handlers can construct
+    backends cheaply without touching the disk. Models are loaded with
+    sentence-transformers unless the caller supplies its own loader; any
+    loaded object must expose a sentence-transformers style `encode`.
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[tuple[str, str], LoadedModel] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        model_name: str,
+        device: str,
+        loader: Callable[[], Any] | None = None,
+    ) -> Any:
+        key = (model_name, device)
+        loaded = self._models.get(key)
+        if loaded is not None:
+            return loaded.model
+
+        with self._lock:
+            loaded = self._models.get(key)
+            if loaded is None:
+                loaded = self._load(model_name, device, loader)
+                self._models[key] = loaded
+        return loaded.model
+
+    def warm(
+        self,
+        model_name: str,
+        device: str,
+        loader: Callable[[], Any] | None = None,
+    ) -> LoadedModel:
+        """
+        Load the model (if needed) and run one encode so lazy kernels are initialised.
+        """
+        model = self.get(model_name, device, loader)
+        model.encode(["warmup"], convert_to_numpy=True)
+        return self._models[(model_name, device)]
+
+    def is_warm(self, model_name: str, device: str) -> bool:
+        return (model_name, device) in self._models
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "model_name": m.model_name,
+                "device": m.device,
+                "state": "warm",
+                "load_seconds": round(m.load_seconds, 3),
+                "parameter_bytes": m.parameter_bytes,
+                "rss_delta_bytes": m.rss_delta_bytes,
+                "loaded_at": m.loaded_at.isoformat(),
+            }
+            for m in self._models.values()
+        ]
+
+    def _load(
+        self,
+        model_name: str,
+        device: str,
+        loader: Callable[[], Any] | None,
+    ) -> LoadedModel:
+        if loader is None:
+            from sentence_transformers import SentenceTransformer  # type: ignore[import]
+
+            def loader() -> Any:
+                return SentenceTransformer(model_name, device=device)
+
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+        model = loader()
+        elapsed = time.perf_counter() - started
+        rss_after = _current_rss_bytes()
+
+        rss_delta = None
+        if rss_before is not None and rss_after is not None:
+            rss_delta = max(0, rss_after - rss_before)
+
+        logger.info("Loaded embedding model=%s device=%s in %.2fs", model_name, device, elapsed)
+        return LoadedModel(
+            model_name=model_name,
+            device=device,
+            model=model,
+            load_seconds=elapsed,
+            parameter_bytes=_parameter_bytes(model),
+            rss_delta_bytes=rss_delta,
+        )
+
+
+model_registry = EmbeddingModelRegistry()
+
+
 class SentenceTransformerBackend:
     """
     Local embedding backend using sentence-transformers.
 
     This backend can be swapped out for a remote service (e.g. OpenAI)
-    while preserving the same EmbeddingBackend interface.
+    while preserving the same EmbeddingBackend interface. The underlying
+    model is owned by the process-wide registry, not by the backend.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
-        self.model_name = model_name
-        self._model = None
+    def __init__(
+        self,
+        model_name: str | None = None,
+        device: str | None = None,
+        model_version: str | None = None,
+        batch_size: int = 32,
+    ) -> None:
+        self.model_name = model_name or settings.embedding_model_name
+        self.model_version = model_version or settings.embedding_model_version
+        self.device = device or settings.embedding_device
+        self.batch_size = batch_size
 
-    @lru_cache(maxsize=1)
-    def _load_model(self):
-        from sentence_transformers import SentenceTransformer  # type: ignore[import]
+    @property
+    def model_id(self) -> str:
+        return f"{self.model_name}@{self.model_version}"
+
+    @property
+    def registry_key(self) -> tuple[str, str]:
+        return self.model_name, self.device
 
-        return SentenceTransformer(self.model_name)
+    def _load_model(self):
+        return model_registry.get(self.model_name, self.device)
 
     def embed(self, texts: Sequence[str]) -> list[list[float]]:
         model = self._load_model()
-        vectors = model.encode(list(texts), convert_to_numpy=True)
+        vectors = model.encode(list(texts), batch_size=self.batch_size, convert_to_numpy=True)
         return vectors.tolist()
 
 
-def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
+def cosine_similarity(a: np.ndarray, b: np.ndarray, *, normalized: bool = False) -> float:
+    """
+    Cosine similarity; pass normalized=True for unit vectors to skip the norms.
+    """
     if a.shape != b.shape:
         raise ValueError("Embedding vectors must have the same shape")
+    if normalized:
+        # float16 views from storage are widened so the dot accumulates in float32
+        return float(np.asarray(a, dtype=np.float32).dot(np.asarray(b, dtype=np.float32)))
     denom = (np.linalg.norm(a) * np.linalg.norm(b))
     if denom == 0:
         return 0.0
     return float(a.dot(b) / denom)
 
 
-def get_default_embedding_backend() -> EmbeddingBackend:
-    return SentenceTransformerBackend()
+def build_base_backend(
+    model_name: str | None = None,
+    model_version: str | None = None,
+    *,
+    batch_size: int = 32,
+) -> Any:
+    """
+    Uncached, unbatched backend for the configured engine (`embedding_backend`).
+    """
+    if settings.embedding_backend == "onnx":
+        from .onnx_backend import OnnxEmbeddingBackend
+
+        return OnnxEmbeddingBackend(
+            model_name=model_name,
+            model_version=model_version,
+            batch_size=batch_size,
+        )
+    return SentenceTransformerBackend(
+        model_name=model_name,
+        model_version=model_version,
+        batch_size=batch_size,
+    )
+
+
+def warm_default_embedding_model() -> LoadedModel:
+    backend = build_base_backend()
+    backend._load_model()
+    return model_registry.warm(*backend.registry_key)
+
+
+def get_embedding_model_stats() -> dict[str, Any]:
+    backend = build_base_backend()
+    model_name, device = backend.registry_key
+    return {
+        "engine": settings.embedding_backend,
+        "default_model": model_name,
+        "device": device,
+        "state": "warm" if model_registry.is_warm(model_name, device) else "cold",
+        "loaded": model_registry.stats(),
+    }
+
+
+def get_default_embedding_backend(
+    model_name: str | None = None,
+    model_version: str | None = None,
+    *,
+    batching: bool = True,
+    batch_size: int = 32,
+) -> AsyncEmbeddingBackend:
+    """
+    Build the cached (and, for request traffic, micro-batched) backend.
+
+    Bulk jobs pass batching=False and a large batch_size so each call is a
+    single full-size encode instead of going through the request queue.
+    """
+    from .batching import get_embedding_batcher
+    from .embedding_cache import get_cached_backend
 
+    backend: EmbeddingBackend = build_base_backend(
+        model_name,
+        model_version,
+        batch_size=batch_size,
+    )
+    if batching and settings.embedding_batching_enabled:
+        backend = get_embedding_batcher(backend)
+    return get_cached_backend(backend)
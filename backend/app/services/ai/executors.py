@@ -0,0 +1,184 @@
+"""
+Executor layer for CPU-bound AI work.
+
+Anything heavier than a few microseconds must not run on the event loop:
+while it does, every other request on the uvicorn worker stalls. Two
+pools are provided:
+
+- a thread pool for work that releases the GIL (torch / onnx encode);
+- a process pool for pure-Python work (PDF parsing, regex matching).
+
+Callables submitted to the process pool must be importable module-level
+functions with picklable arguments.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, TypeVar
+
+from ...core.config import settings
+from ...core.metrics import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class MonitoredPool:
+    """
+    Wraps a concurrent.futures executor and tracks queue depth and utilisation.
+
+    `in_flight` counts submitted-but-unfinished tasks; anything beyond the
+    worker count is waiting in the executor's queue.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Executor], max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self._factory = factory
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._busy_seconds = 0.0
+        self._started_at = time.perf_counter()
+        self.submitted = Counter(f"{name}_submitted")
+        self.failed = Counter(f"{name}_failed")
+        self.task_ms = Histogram(
+            f"{name}_task_ms",
+            buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000],
+        )
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._factory()
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        call = functools.partial(fn, *args, **kwargs) if kwargs else fn
+        call_args = () if kwargs else args
+        loop = asyncio.get_running_loop()
+
+        self.submitted.inc()
+        with self._lock:
+            self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            try:
+                return await loop.run_in_executor(self._get_executor(), call, *call_args)
+            except BrokenProcessPool:
+                # A crashed worker poisons the whole pool; rebuild it once.
+                logger.warning("Executor pool %s was broken; recreating it", self.name)
+                self._reset()
+                return await loop.run_in_executor(self._get_executor(), call, *call_args)
+        except Exception:
+            self.failed.inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.task_ms.observe(elapsed * 1000.0)
+            with self._lock:
+                self._in_flight -= 1
+                self._busy_seconds += elapsed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+            busy_seconds = self._busy_seconds
+        uptime = max(1e-9, time.perf_counter() - self._started_at)
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - self.max_workers),
+            "utilisation": round(min(in_flight, self.max_workers) / self.max_workers, 4),
+            "avg_utilisation": round(min(1.0, busy_seconds / (uptime * self.max_workers)), 4),
+            "submitted": self.submitted.value,
+            "failed": self.failed.value,
+            "task_ms": self.task_ms.snapshot(),
+        }
+
+    def _reset(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        self._reset()
+
+
+thread_pool = MonitoredPool(
+    "ai_threads",
+    lambda: ThreadPoolExecutor(
+        max_workers=settings.ai_thread_pool_workers,
+        thread_name_prefix="ai-thread",
+    ),
+    max_workers=settings.ai_thread_pool_workers,
+)
+
+# "spawn" avoids forking a parent that already holds torch threads and locks.
+process_pool: MonitoredPool | None = (
+    MonitoredPool(
+        "ai_processes",
+        lambda: ProcessPoolExecutor(
+            max_workers=settings.ai_process_pool_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ),
+        max_workers=settings.ai_process_pool_workers,
+    )
+    if settings.ai_process_pool_workers > 0
+    else None
+)
+
+
+async def run_in_thread(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run GIL-releasing work (e.g. model.encode) on the AI thread pool.
+    """
+    return await thread_pool.run(fn, *args, **kwargs)
+
+
+async def run_cpu_bound(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run pure-Python CPU work on the AI process pool.
+
+    Falls back to the thread pool when the process pool is disabled
+    (ai_process_pool_workers=0), which still keeps the event loop free.
+    """
+    if process_pool is None:
+        return await thread_pool.run(fn, *args, **kwargs)
+    return await process_pool.run(fn, *args, **kwargs)
+
+
+async def warm_executors() -> None:
+    """
+    Start pool workers ahead of the first request; spawned interpreters take
+    a noticeable time to import the app.
+    """
+    if process_pool is not None:
+        await process_pool.run(_noop)
+
+
+def _noop() -> None:
+    return None
+
+
+def get_executor_stats() -> dict[str, Any]:
+    stats = {"threads": thread_pool.stats()}
+    if process_pool is not None:
+        stats["processes"] = process_pool.stats()
+    return stats
+
+
+def shutdown_executors() -> None:
+    thread_pool.shutdown()
+    if process_pool is not None:
+        process_pool.shutdown()
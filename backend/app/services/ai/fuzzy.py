@@ -0,0 +1,267 @@
+"""
+Fuzzy skill matching with a SymSpell deletion index.
+
+The exact matcher misses spelling variants such as "Postgre SQL",
+"Kubernets" or "Scikit learn". Comparing every unmatched token with every
+taxonomy entry by edit distance would be O(tokens x skills); SymSpell
+instead precomputes, for every skill, all strings reachable by deleting
+up to `max_distance` characters from its prefix. A query generates its
+own deletes and looks them up, so the candidate set is found with a few
+dict lookups whatever the taxonomy size, and only those candidates are
+verified with a bounded edit distance.
+
+Skills and candidates are compared in a compact form with spaces and
+separators removed, so split or joined spellings ("postgre sql",
+"scikit learn", "ci cd") resolve exactly. Candidates are the tokens and
+two-/three-token windows of the normalized text that do not overlap an
+exact match. A candidate is accepted when
+
+    confidence = 1 - distance / len(skill) >= min_confidence
+
+and its first character agrees with the skill's, which keeps common
+words one edit away from short skills ("locker", "reach") out.
+
+Lookups are cached per distinct token, and a document only visits tokens
+that can match or start a multi-word skill, so the steady-state cost is
+a set of the document's tokens plus a few dict lookups.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate
+
+_SEPARATORS = str.maketrans("", "", " \t\r\n.-_/")
+
+DEFAULT_MIN_CONFIDENCE = 0.85
+
+
+def compact(text: str) -> str:
+    return text.lower().translate(_SEPARATORS)
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))} - found
+        found |= frontier
+    return found
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (adjacent transpositions count as
+    one edit), or `max_distance + 1` once it is certain to exceed it.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            row_min = min(row_min, v)
+        if row_min > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzySkillIndex:
+    """
+    SymSpell index over skill patterns; lookups return the pattern id of
+    the closest skill, as `SkillMatcher` numbers them.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        *,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+        max_distance: int = 2,
+        prefix_length: int = 7,
+        min_length: int = 4,
+        max_words: int = 3,
+        cache_size: int = 50_000,
+    ) -> None:
+        self.min_confidence = min_confidence
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.min_length = min_length
+        self.max_words = max_words
+        self._cache_size = cache_size
+        self._cache: dict[str, tuple[int, float] | None] = {}
+        self._token_cache: dict[str, tuple[tuple[int, float] | None, bool] | None] = {}
+
+        # Compact spelling -> pattern id (first pattern wins).
+        self.terms: dict[str, int] = {}
+        for pid, pattern in enumerate(patterns):
+            key = compact(pattern)
+            if len(key) >= min_length:
+                self.terms.setdefault(key, pid)
+        self._keys = list(self.terms)
+        # Proper prefixes of every term: a token outside this set cannot
+        # start a multi-token spelling ("postgre" + "sql").
+        self._prefixes: set[str] = {k[:i] for k in self._keys for i in range(1, len(k))}
+        # One-edit variants of the first word of multi-word skills, so a typo
+        # there ("machne learning") still opens a window.
+        self._first_words: set[str] = set()
+        for pattern in patterns:
+            words = pattern.split()
+            if len(words) > 1 and len(words[0]) >= min_length:
+                self._first_words |= _deletes(compact(words[0]), 1)
+        self._deletes: dict[str, list[int]] = {}
+        for idx, key in enumerate(self._keys):
+            for variant in _deletes(key[:prefix_length], self._allowed_distance(len(key))):
+                self._deletes.setdefault(variant, []).append(idx)
+
+    def _allowed_distance(self, length: int) -> int:
+        # Largest distance that can still reach min_confidence for this length.
+        return min(self.max_distance, int(length * (1.0 - self.min_confidence) + 1e-9))
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def memory_bytes(self) -> int:
+        size = sys.getsizeof
+        total = size(self.terms) + size(self._keys) + sum(size(k) for k in self._keys)
+        total += size(self._prefixes) + sum(size(p) for p in self._prefixes)
+        total += size(self._first_words) + sum(size(w) for w in self._first_words)
+        total += size(self._deletes)
+        total += sum(size(k) + size(v) for k, v in self._deletes.items())
+        return total
+
+    def lookup(self, candidate: str) -> tuple[int, float] | None:
+        """
+        (pattern id, confidence) of the best skill for a compact candidate,
+        or None below the confidence threshold.
+        """
+        cached = self._cache.get(candidate, False)
+        if cached is not False:
+            return cached
+        result = self._lookup(candidate)
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[candidate] = result
+        return result
+
+    def _lookup(self, candidate: str) -> tuple[int, float] | None:
+        exact = self.terms.get(candidate)
+        if exact is not None:
+            return exact, 1.0
+        if len(candidate) < self.min_length:
+            return None
+        # A skill of length L is reachable within L * (1 - min_confidence)
+        # edits, and L <= len(candidate) + max_distance.
+        limit = self._allowed_distance(len(candidate) + self.max_distance)
+        if limit <= 0:
+            return None
+        best: tuple[int, float] | None = None
+        best_distance = limit + 1
+        seen: set[int] = set()
+        for variant in _deletes(candidate[: self.prefix_length], limit):
+            for idx in self._deletes.get(variant, ()):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                key = self._keys[idx]
+                if key[0] != candidate[0]:
+                    continue
+                allowed = min(self._allowed_distance(len(key)), best_distance)
+                distance = edit_distance(candidate, key, allowed)
+                if distance > allowed or distance == 0:
+                    continue
+                confidence = 1.0 - distance / len(key)
+                if confidence < self.min_confidence:
+                    continue
+                if best is None or distance < best_distance or (
+                    distance == best_distance and confidence > best[1]
+                ):
+                    best, best_distance = (self.terms[key], confidence), distance
+        return best
+
+    def find(
+        self,
+        text: str,
+        covered: Iterable[tuple[int, int, int]] = (),
+    ) -> Iterator[tuple[int, int, int, float]]:
+        """
+        Yield (start, end, pattern_id, confidence) for fuzzy matches in
+        normalized `text` that do not overlap the `covered` exact hits,
+        left to right; at each token the longest matching window wins.
+        """
+        if not text:
+            return
+        # Normalized text separates tokens with single spaces, so offsets
+        # follow from token lengths; only tokens that can matter are visited.
+        tokens = text.split(" ")
+        classify = self._classify
+        interesting = {t for t in set(tokens) if classify(t) is not None}
+        if not interesting:
+            return
+        starts = list(accumulate((len(t) + 1 for t in tokens), initial=0))
+        taken = bytearray(len(text) + 1)
+        for start, end, _ in covered:
+            taken[start:end] = b"\x01" * (end - start)
+
+        terms, lookup, min_length = self.terms, self.lookup, self.min_length
+        n = len(tokens)
+        resume_at = 0
+        for i in [i for i, t in enumerate(tokens) if t in interesting]:
+            if i < resume_at or taken[starts[i]]:
+                continue
+            hit, is_prefix = classify(tokens[i])
+            width = 1
+            # Multi-token windows only when this token can start a longer skill.
+            if is_prefix:
+                for w in range(min(self.max_words, n - i), 1, -1):
+                    window = tokens[i : i + w]
+                    end = starts[i] + len(" ".join(window).rstrip("."))
+                    if any(taken[starts[i] : end]):
+                        continue
+                    joined = "".join(t.translate(_SEPARATORS) for t in window)
+                    # Exact for any width; edit distance only for pairs.
+                    candidate = terms.get(joined)
+                    if candidate is not None:
+                        width, hit = w, (candidate, 1.0)
+                        break
+                    if w == 2 and len(joined) >= min_length:
+                        pair = lookup(joined)
+                        if pair is not None:
+                            width, hit = 2, pair
+                            break
+            if hit is None:
+                continue
+            end = starts[i] + len(" ".join(tokens[i : i + width]).rstrip("."))
+            if any(taken[starts[i] : end]):
+                continue
+            yield starts[i], end, hit[0], hit[1]
+            resume_at = i + width
+
+    def _classify(self, token: str) -> tuple[tuple[int, float] | None, bool] | None:
+        """
+        (single-token match, may start a multi-token skill) for a raw token,
+        or None when it can be skipped. Cached per distinct token.
+        """
+        cached = self._token_cache.get(token, False)
+        if cached is not False:
+            return cached
+        key = token.rstrip(".").translate(_SEPARATORS)
+        hit = self.lookup(key) if len(key) >= self.min_length else None
+        is_prefix = key in self._prefixes or (
+            len(key) >= self.min_length
+            and not self._first_words.isdisjoint(_deletes(key, 1))
+        )
+        result = (hit, is_prefix) if hit is not None or is_prefix else None
+        if len(self._token_cache) >= self._cache_size:
+            self._token_cache.clear()
+        self._token_cache[token] = result
+        return result
@@ -0,0 +1,419 @@
+"""
+In-process nearest-neighbour indexes over job description embeddings.
+
+Each user's job vectors (unit length, so cosine is a dot product) live in
+one of two structures:
+
+- `ExactIndex`: one contiguous float32 matrix; a query is a single
+  matrix-vector product plus `argpartition`. Exact, and the fastest
+  choice up to a few thousand jobs.
+- `IVFIndex`: an inverted file. Vectors are clustered with spherical
+  k-means into ~sqrt(n) lists; a query scores the centroids and scans
+  only the `nprobe` closest lists. Approximate: `nprobe` is calibrated
+  at training time against a recall@10 target on sample queries, and
+  the estimated recall is reported with the results.
+
+Both support incremental `add` / `remove`. `UserJobIndex` picks the
+structure by size and switches (retraining the IVF clusters) when the
+user's job count crosses the threshold or doubles since training. If
+the vectors cluster so poorly that the recall target is not reached
+within a quarter of the lists, it stays on exact search.
+`JobIndexRegistry` keeps one per (user, embedding model).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from ...core.config import settings
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first.
+    """
+    if k >= scores.shape[0]:
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+class ExactIndex:
+    """
+    Brute-force index: rows of one float32 matrix, grown by doubling.
+    """
+
+    kind = "exact"
+
+    def __init__(self, dim: int) -> None:
+        self.dim = dim
+        self._vectors = np.zeros((16, dim), dtype=np.float32)
+        self._ids: list[UUID] = []
+        self._rows: dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, job_id: UUID) -> bool:
+        return job_id in self._rows
+
+    def add(self, job_id: UUID, vector: np.ndarray) -> None:
+        row = self._rows.get(job_id)
+        if row is None:
+            row = len(self._ids)
+            if row == self._vectors.shape[0]:
+                grown = np.zeros((2 * row, self.dim), dtype=np.float32)
+                grown[:row] = self._vectors
+                self._vectors = grown
+            self._ids.append(job_id)
+            self._rows[job_id] = row
+        self._vectors[row] = vector
+
+    def remove(self, job_id: UUID) -> None:
+        row = self._rows.pop(job_id, None)
+        if row is None:
+            return
+        # Move the last row into the hole.
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._vectors[row] = self._vectors[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+
+    def items(self) -> tuple[list[UUID], np.ndarray]:
+        return list(self._ids), self._vectors[: len(self._ids)]
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[UUID, float]]:
+        if not self._ids or k <= 0:
+            return []
+        scores = self._vectors[: len(self._ids)] @ query
+        return [(self._ids[i], float(scores[i])) for i in _top_k(scores, k)]
+
+
+class IVFIndex:
+    """
+    Inverted-file index: spherical k-means centroids, one (ids, matrix)
+    list per centroid, `nprobe` lists scanned per query.
+
+    With `recall_target`, `nprobe` is the smallest of nprobe, 2 * nprobe,
+    ... (up to `max_nprobe`, default every list) whose recall@10 against
+    exact search reaches the target on `calibration_queries` sample
+    queries (normalized sums of two random stored vectors, so they are
+    not stored vectors themselves); `recall` is the recall measured there.
+    """
+
+    kind = "ivf"
+
+    def __init__(
+        self,
+        ids: Sequence[UUID],
+        vectors: np.ndarray,
+        *,
+        nlist: int | None = None,
+        nprobe: int = 8,
+        recall_target: float | None = None,
+        max_nprobe: int | None = None,
+        calibration_queries: int = 64,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        n, self.dim = vectors.shape
+        self.trained_size = n
+        self.nlist = nlist = max(1, min(n, nlist or int(math.sqrt(n))))
+        self.nprobe = min(nprobe, nlist)
+        self.recall: float | None = None
+        rng = np.random.default_rng(seed)
+        self.centroids = self._train(vectors, nlist, iterations, rng)
+
+        assignment = self._assign(vectors)
+        self._ids: list[list[UUID]] = []
+        self._vectors: list[np.ndarray] = []
+        self._lists: dict[UUID, int] = {}
+        for c in range(nlist):
+            members = np.flatnonzero(assignment == c)
+            self._ids.append([ids[i] for i in members])
+            self._vectors.append(vectors[members])
+            for i in members:
+                self._lists[ids[i]] = c
+        if recall_target is not None:
+            limit = min(self.nlist, max(self.nprobe, max_nprobe or self.nlist))
+            self._calibrate(ids, vectors, recall_target, limit, calibration_queries, rng)
+
+    def _calibrate(
+        self,
+        ids: Sequence[UUID],
+        vectors: np.ndarray,
+        target: float,
+        max_nprobe: int,
+        queries: int,
+        rng: np.random.Generator,
+        k: int = 10,
+    ) -> None:
+        n = vectors.shape[0]
+        pairs = rng.integers(0, n, (queries, 2))
+        sample = vectors[pairs[:, 0]] + vectors[pairs[:, 1]]
+        sample /= np.maximum(np.linalg.norm(sample, axis=1, keepdims=True), 1e-12)
+        truth = [{ids[i] for i in _top_k(scores, k)} for scores in sample @ vectors.T]
+        nprobe = self.nprobe
+        while True:
+            self.nprobe = nprobe
+            hits = sum(
+                len(expected & {job_id for job_id, _ in self.search(query, k)})
+                for query, expected in zip(sample, truth)
+            )
+            self.recall = hits / sum(len(expected) for expected in truth)
+            if self.recall >= target or nprobe >= max_nprobe:
+                return
+            nprobe = min(2 * nprobe, max_nprobe)
+
+    @staticmethod
+    def _train(vectors: np.ndarray, nlist: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+        # Like faiss, train on a sample of ~64 vectors per list.
+        if vectors.shape[0] > 64 * nlist:
+            vectors = vectors[rng.choice(vectors.shape[0], 64 * nlist, replace=False)]
+        centroids = vectors[rng.choice(vectors.shape[0], nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(vectors @ centroids.T, axis=1)
+            order = np.argsort(assignment, kind="stable")
+            counts = np.bincount(assignment, minlength=nlist)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            sums = np.zeros_like(centroids)
+            filled = counts > 0
+            sums[filled] = np.add.reduceat(vectors[order], starts[filled], axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid.
+            centroids = np.where(norms > 0, sums / np.where(norms == 0, 1.0, norms), centroids)
+        return centroids.astype(np.float32)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def __len__(self) -> int:
+        return len(self._lists)
+
+    def __contains__(self, job_id: UUID) -> bool:
+        return job_id in self._lists
+
+    def add(self, job_id: UUID, vector: np.ndarray) -> None:
+        self.remove(job_id)
+        vector = np.asarray(vector, dtype=np.float32)
+        c = int(self._assign(vector[None, :])[0])
+        self._ids[c].append(job_id)
+        self._vectors[c] = np.vstack([self._vectors[c], vector[None, :]])
+        self._lists[job_id] = c
+
+    def remove(self, job_id: UUID) -> None:
+        c = self._lists.pop(job_id, None)
+        if c is None:
+            return
+        row = self._ids[c].index(job_id)
+        del self._ids[c][row]
+        self._vectors[c] = np.delete(self._vectors[c], row, axis=0)
+
+    def items(self) -> tuple[list[UUID], np.ndarray]:
+        ids = [job_id for members in self._ids for job_id in members]
+        vectors = np.vstack(self._vectors) if ids else np.zeros((0, self.dim), dtype=np.float32)
+        return ids, vectors
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[UUID, float]]:
+        if not self._lists or k <= 0:
+            return []
+        probe = _top_k(self.centroids @ query, self.nprobe)
+        ids = [job_id for c in probe for job_id in self._ids[c]]
+        if not ids:
+            return []
+        scores = np.vstack([self._vectors[c] for c in probe]) @ query
+        return [(ids[i], float(scores[i])) for i in _top_k(scores, k)]
+
+
+class UserJobIndex:
+    """
+    One user's job vectors, with the embedding timestamp of each so the
+    index can be diffed against the database.
+    """
+
+    def __init__(
+        self, dim: int, *, ivf_min_jobs: int, nprobe: int, recall_target: float
+    ) -> None:
+        self.dim = dim
+        self.ivf_min_jobs = ivf_min_jobs
+        self.nprobe = nprobe
+        self.recall_target = recall_target
+        self.index: ExactIndex | IVFIndex = ExactIndex(dim)
+        self.stamps: dict[UUID, datetime] = {}
+        # Size at which an IVF index was last built and rejected.
+        self._ivf_rejected_at = 0
+
+    def __len__(self) -> int:
+        return len(self.stamps)
+
+    @property
+    def kind(self) -> str:
+        return self.index.kind
+
+    @property
+    def recall(self) -> float | None:
+        """
+        Estimated recall@10 of searches; None when they are exact.
+        """
+        return self.index.recall if isinstance(self.index, IVFIndex) else None
+
+    def fingerprint(self) -> tuple[int, datetime | None]:
+        """
+        (count, newest embedding timestamp); matches the database when the
+        index holds exactly the stored vectors.
+        """
+        return len(self.stamps), max(self.stamps.values(), default=None)
+
+    def add(self, job_id: UUID, vector: np.ndarray, stamp: datetime) -> None:
+        self.add_many([(job_id, vector, stamp)])
+
+    def add_many(self, entries: Sequence[tuple[UUID, np.ndarray, datetime]]) -> None:
+        """
+        Add or replace vectors, restructuring once for the whole batch.
+        """
+        for job_id, vector, stamp in entries:
+            self.index.add(job_id, vector)
+            self.stamps[job_id] = stamp
+        self._restructure()
+
+    def remove(self, job_id: UUID) -> None:
+        self.remove_many([job_id])
+
+    def remove_many(self, job_ids: Sequence[UUID]) -> None:
+        for job_id in job_ids:
+            self.index.remove(job_id)
+            self.stamps.pop(job_id, None)
+        self._restructure()
+
+    def _restructure(self) -> None:
+        n = len(self.stamps)
+        index = self.index
+        if isinstance(index, ExactIndex):
+            if n < max(self.ivf_min_jobs, 2 * self._ivf_rejected_at):
+                return
+        elif n >= self.ivf_min_jobs // 2 and n < 2 * index.trained_size:
+            # Shrinking far below the threshold goes back to exact search;
+            # doubling retrains the clusters.
+            return
+        ids, vectors = index.items()
+        if n >= self.ivf_min_jobs:
+            ivf = IVFIndex(
+                ids,
+                vectors,
+                nprobe=self.nprobe,
+                recall_target=self.recall_target,
+                max_nprobe=int(math.sqrt(n)) // 4,
+            )
+            if ivf.recall >= self.recall_target:
+                self.index = ivf
+                return
+            # Probing more than a quarter of the lists is no faster than
+            # an exact scan (the vectors barely cluster); retried once the
+            # job count has doubled.
+            self._ivf_rejected_at = n
+            if isinstance(index, ExactIndex):
+                return
+        exact = ExactIndex(self.dim)
+        for job_id, vector in zip(ids, vectors):
+            exact.add(job_id, vector)
+        self.index = exact
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[UUID, float]]:
+        """
+        Up to k (job id, cosine) pairs, best first.
+        """
+        return self.index.search(np.asarray(query, dtype=np.float32), k)
+
+
+class JobIndexRegistry:
+    """
+    Per-(user, embedding model) job indexes, least recently used evicted
+    beyond `max_users`. Indexes are rebuilt lazily from the database, so
+    eviction only costs one reload.
+    """
+
+    def __init__(
+        self, *, max_users: int, ivf_min_jobs: int, nprobe: int, recall_target: float
+    ) -> None:
+        self.max_users = max_users
+        self.ivf_min_jobs = ivf_min_jobs
+        self.nprobe = nprobe
+        self.recall_target = recall_target
+        self._indexes: OrderedDict[tuple[int, str], UserJobIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def get(self, user_id: int, model_id: str) -> UserJobIndex | None:
+        with self._lock:
+            index = self._indexes.get((user_id, model_id))
+            if index is not None:
+                self._indexes.move_to_end((user_id, model_id))
+            return index
+
+    def new_index(self, dim: int) -> UserJobIndex:
+        return UserJobIndex(
+            dim,
+            ivf_min_jobs=self.ivf_min_jobs,
+            nprobe=self.nprobe,
+            recall_target=self.recall_target,
+        )
+
+    def put(self, user_id: int, model_id: str, index: UserJobIndex) -> None:
+        with self._lock:
+            self._indexes[(user_id, model_id)] = index
+            self._indexes.move_to_end((user_id, model_id))
+            self.loads += 1
+            while len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+                self.evictions += 1
+
+    def add_job(
+        self, user_id: int, model_id: str, job_id: UUID, vector: np.ndarray, stamp: datetime
+    ) -> None:
+        """
+        Apply a freshly stored vector to the user's index, if it is loaded.
+        """
+        index = self.get(user_id, model_id)
+        if index is not None and index.dim == vector.shape[0]:
+            index.add(job_id, vector, stamp)
+
+    def remove_job(self, user_id: int, job_id: UUID) -> None:
+        """
+        Drop a deleted job from every loaded index of the user.
+        """
+        with self._lock:
+            indexes = [index for (owner, _), index in self._indexes.items() if owner == user_id]
+        for index in indexes:
+            index.remove(job_id)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            indexes = list(self._indexes.values())
+        return {
+            "users": len(indexes),
+            "jobs": sum(len(index) for index in indexes),
+            "ivf_users": sum(index.kind == "ivf" for index in indexes),
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+
+job_indexes = JobIndexRegistry(
+    max_users=settings.job_index_max_users,
+    ivf_min_jobs=settings.job_index_ivf_min_jobs,
+    nprobe=settings.job_index_min_nprobe,
+    recall_target=settings.job_index_recall_target,
+)
@@ -0,0 +1,158 @@
+"""
+Single-pass skill matching with an Aho-Corasick automaton.
+
+The automaton is compiled once per dictionary and finds every occurrence
+of every skill in one linear scan of the normalized text, however large
+the dictionary is. Matching semantics are those of the original
+per-skill regex loop in `SkillExtractor`:
+
+- single-token skills ("python", "c++", "node.js") must match with `\\b`
+  word boundaries on both ends, exactly as `re.search(rf"\\b{s}\\b", text)`;
+- multi-word skills ("machine learning") are plain substring matches.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import deque
+from typing import Iterable, Iterator, Mapping
+
+
+def _is_word(ch: str) -> bool:
+    # Equivalent to regex \w on normalized (lowercase ASCII) text.
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    `aliases` maps normalized spellings to canonical skill names; any
+    pattern found in it is reported under the canonical name, so aliases
+    resolve in the same scan. Alias spellings that should be recognised
+    in text must also be passed in `skills`.
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Mapping[str, str] | None = None) -> None:
+        aliases = aliases or {}
+        # Distinct lowercase patterns; several dictionary spellings may share one.
+        self.patterns: list[str] = []
+        self.labels: list[list[str]] = []
+        self._needs_boundary: list[bool] = []
+        pattern_ids: dict[str, int] = {}
+        for skill in skills:
+            pattern = skill.strip().lower()
+            if not pattern:
+                continue
+            pid = pattern_ids.get(pattern)
+            if pid is None:
+                pid = pattern_ids[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+                self.labels.append([])
+                self._needs_boundary.append(" " not in pattern)
+            label = aliases.get(pattern, skill)
+            if label not in self.labels[pid]:
+                self.labels[pid].append(label)
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._build()
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate footprint of the compiled automaton (containers only;
+        single-character keys and small ints are interned by CPython).
+        """
+        size = sys.getsizeof
+        total = size(self._goto) + size(self._fail) + size(self._out)
+        total += sum(size(d) for d in self._goto) + sum(size(o) for o in self._out)
+        total += size(self.patterns) + sum(size(p) for p in self.patterns)
+        total += size(self.labels) + sum(size(l) for l in self.labels)
+        return total
+
+    def _build(self) -> None:
+        goto, fail = self._goto, self._fail
+        out: list[list[int]] = [[]]
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append([])
+                state = nxt
+            out[state].append(pid)
+
+        # Breadth-first so every fail target is finished before it is used.
+        # Depth-1 states fail to the root, which they already do.
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+        self._out = [tuple(o) for o in out]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield (start, end, pattern_id) for every raw occurrence, boundaries unchecked.
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for pid in out[state]:
+                    yield end - len(patterns[pid]), end, pid
+
+    def _at_boundaries(self, text: str, start: int, end: int) -> bool:
+        n = len(text)
+        before = start > 0 and _is_word(text[start - 1])
+        first = _is_word(text[start])
+        last = _is_word(text[end - 1])
+        after = end < n and _is_word(text[end])
+        return before != first and last != after
+
+    def accepts(self, text: str, start: int, end: int, pid: int) -> bool:
+        """
+        Whether an occurrence of pattern `pid` at text[start:end] counts as a match.
+        """
+        return not self._needs_boundary[pid] or self._at_boundaries(text, start, end)
+
+    def find_all(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield (start, end, pattern_id) for every occurrence that `match` would accept.
+        """
+        needs_boundary = self._needs_boundary
+        for start, end, pid in self.iter_matches(text):
+            if not needs_boundary[pid] or self._at_boundaries(text, start, end):
+                yield start, end, pid
+
+    def match_ids(self, text: str) -> set[int]:
+        found: set[int] = set()
+        needs_boundary = self._needs_boundary
+        for start, end, pid in self.iter_matches(text):
+            if pid in found:
+                continue
+            if not needs_boundary[pid] or self._at_boundaries(text, start, end):
+                found.add(pid)
+        return found
+
+    def match(self, text: str) -> set[str]:
+        """
+        Dictionary entries (original spelling) present in normalized `text`.
+        """
+        return {label for pid in self.match_ids(text) for label in self.labels[pid]}
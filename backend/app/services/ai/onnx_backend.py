@@ -0,0 +1,243 @@
+"""
+ONNX Runtime embedding backend for CPU-only nodes.
+
+Runs an exported (optionally int8 dynamically quantized) copy of the
+sentence-transformers model with onnxruntime and a `tokenizers` fast
+tokenizer, so serving does not import PyTorch at all. Mean pooling and
+L2 normalization are done in NumPy, mirroring the sentence-transformers
+pipeline for MiniLM (Transformer -> mean Pooling -> Normalize).
+
+Vectors are produced under the same model name / version as
+`SentenceTransformerBackend`, so they can be compared with stored ones.
+Measured tolerance against the PyTorch model (see
+`benchmarks/bench_onnx_backend.py`):
+
+    fp32 export     cosine >= 0.9999 per text
+    int8 quantized  cosine >= 0.98 per text (typically ~0.995)
+
+Use `export_onnx_model.py` to produce the model directory.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from ...core.config import settings
+from .embeddings import model_registry
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+METADATA_FILE = "export.json"
+
+
+class OnnxEncoder:
+    """
+    Tokenizer + InferenceSession with a sentence-transformers style `encode`.
+    """
+
+    def __init__(
+        self,
+        model_path: Path,
+        tokenizer_path: Path,
+        *,
+        max_length: int,
+        intra_op_threads: int = 0,
+    ) -> None:
+        import onnxruntime as ort  # type: ignore[import]
+        from tokenizers import Tokenizer  # type: ignore[import]
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads > 0:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        self.max_length = max_length
+        self.parameter_bytes = model_path.stat().st_size
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        **_: Any,
+    ) -> np.ndarray:
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        # Sort by length so each batch pads to a similar length, then restore order.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        out: list[np.ndarray | None] = [None] * len(texts)
+        for start in range(0, len(order), max(1, batch_size)):
+            idx = order[start : start + batch_size]
+            vectors = self._encode_batch([texts[i] for i in idx])
+            for i, vec in zip(idx, vectors):
+                out[i] = vec
+        return np.stack(out)  # type: ignore[arg-type]
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.asarray([e.type_ids for e in encodings], dtype=np.int64)
+
+        (hidden,) = self.session.run(["last_hidden_state"], feeds)
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.where(norms == 0, 1.0, norms)).astype(np.float32)
+
+
+def _model_file(model_dir: Path, quantized: bool) -> Path:
+    return model_dir / (QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+
+
+class OnnxEmbeddingBackend:
+    """
+    Drop-in replacement for `SentenceTransformerBackend` backed by onnxruntime.
+    """
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        model_version: str | None = None,
+        batch_size: int = 32,
+        *,
+        model_dir: str | None = None,
+        quantized: bool | None = None,
+    ) -> None:
+        self.model_name = model_name or settings.embedding_model_name
+        self.model_version = model_version or settings.embedding_model_version
+        self.batch_size = batch_size
+        self.model_dir = Path(model_dir or settings.onnx_model_dir)
+        self.quantized = settings.onnx_quantized if quantized is None else quantized
+        self.device = "onnx-int8" if self.quantized else "onnx-fp32"
+
+    @property
+    def model_id(self) -> str:
+        return f"{self.model_name}@{self.model_version}"
+
+    @property
+    def registry_key(self) -> tuple[str, str]:
+        return self.model_name, self.device
+
+    def _create_encoder(self) -> OnnxEncoder:
+        model_path = _model_file(self.model_dir, self.quantized)
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"ONNX model not found at {model_path}; run export_onnx_model.py first"
+            )
+        metadata_path = self.model_dir / METADATA_FILE
+        if metadata_path.exists():
+            exported_from = json.loads(metadata_path.read_text()).get("model_name")
+            if exported_from and exported_from != self.model_name:
+                logger.warning(
+                    "ONNX model in %s was exported from %s, not %s",
+                    self.model_dir,
+                    exported_from,
+                    self.model_name,
+                )
+        return OnnxEncoder(
+            model_path,
+            self.model_dir / TOKENIZER_FILE,
+            max_length=settings.onnx_max_length,
+            intra_op_threads=settings.onnx_intra_op_threads,
+        )
+
+    def _load_model(self) -> OnnxEncoder:
+        return model_registry.get(self.model_name, self.device, self._create_encoder)
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        model = self._load_model()
+        embeddings = model.encode(list(texts), batch_size=self.batch_size, convert_to_numpy=True)
+        return embeddings.tolist()
+
+
+def export_onnx_model(
+    model_name: str,
+    output_dir: str | os.PathLike[str],
+    *,
+    max_length: int = 256,
+    quantize: bool = True,
+    opset: int = 14,
+) -> dict[str, Any]:
+    """
+    Export a sentence-transformers model's transformer to ONNX (and int8).
+
+    Only the transformer is exported; pooling and normalization run in
+    `OnnxEncoder`. Requires torch and sentence-transformers, which are not
+    needed at serving time.
+    """
+    import torch  # type: ignore[import]
+    from sentence_transformers import SentenceTransformer  # type: ignore[import]
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+    tokenizer.save_pretrained(str(out))
+
+    sample = tokenizer(
+        ["export sample", "a somewhat longer export sample sentence"],
+        padding=True,
+        truncation=True,
+        max_length=max_length,
+        return_tensors="pt",
+    )
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    model_path = out / MODEL_FILE
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[n] for n in input_names),
+            str(model_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+
+    files = {"fp32": str(model_path)}
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore[import]
+
+        quantized_path = out / QUANTIZED_MODEL_FILE
+        quantize_dynamic(str(model_path), str(quantized_path), weight_type=QuantType.QInt8)
+        files["int8"] = str(quantized_path)
+
+    metadata = {
+        "model_name": model_name,
+        "max_length": max_length,
+        "opset": opset,
+        "pooling": "mean",
+        "normalize": True,
+        "dimension": st_model.get_sentence_embedding_dimension(),
+        "files": files,
+    }
+    (out / METADATA_FILE).write_text(json.dumps(metadata, indent=2))
+    return metadata
@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from .executors import run_cpu_bound
+
 
 class PDFParser(Protocol):
     async def extract_text(self, file_bytes: bytes) -> str:  # pragma: no cover - interface
@@ -17,46 +19,55 @@ class LocalPDFParser:
 
     async def extract_text(self, file_bytes: bytes) -> str:
         """
-        Extract text from a PDF using PyPDF2.
+        Extract text from a PDF off the event loop.
 
-        This is intentionally simple; in production you may want more
-        robust handling (OCR, layout-aware parsing, etc.).
+        Parsing is pure Python, so it runs on the AI process pool.
         """
-        from PyPDF2 import PdfReader  # type: ignore[import]
+        return await run_cpu_bound(extract_pdf_text, file_bytes)
 
-        try:
-            reader = PdfReader.from_bytes(file_bytes)
-        except AttributeError:
-            # Fallback for older PyPDF2 API
-            from io import BytesIO
-
-            reader = PdfReader(BytesIO(file_bytes))
-
-        texts: list[str] = []
-        for page in reader.pages:
-            try:
-                page_text = page.extract_text() or ""
-            except Exception:
-                page_text = ""
-            if page_text:
-                texts.append(page_text)
-        extracted = "\n".join(texts)
-        if extracted.strip():
-            return extracted
 
+def extract_pdf_text(file_bytes: bytes) -> str:
+    """
+    Extract text from a PDF using PyPDF2.
+
+    This is intentionally simple; in production you may want more
+    robust handling (OCR, layout-aware parsing, etc.).
+    """
+    from PyPDF2 import PdfReader  # type: ignore[import]
+
+    try:
+        reader = PdfReader.from_bytes(file_bytes)
+    except AttributeError:
+        # Fallback for older PyPDF2 API
+        from io import BytesIO
+
+        reader = PdfReader(BytesIO(file_bytes))
+
+    texts: list[str] = []
+    for page in reader.pages:
         try:
-            import pdfplumber  # type: ignore[import]
-            from io import BytesIO
-
-            with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-                pages = []
-                for p in pdf.pages:
-                    t = p.extract_text() or ""
-                    if t:
-                        pages.append(t)
-                extracted = "\n".join(pages)
+            page_text = page.extract_text() or ""
         except Exception:
-            extracted = ""
-
+            page_text = ""
+        if page_text:
+            texts.append(page_text)
+    extracted = "\n".join(texts)
+    if extracted.strip():
         return extracted
 
+    try:
+        import pdfplumber  # type: ignore[import]
+        from io import BytesIO
+
+        with pdfplumber.open(BytesIO(file_bytes)) as pdf:
+            pages = []
+            for p in pdf.pages:
+                t = p.extract_text() or ""
+                if t:
+                    pages.append(t)
+            extracted = "\n".join(pages)
+    except Exception:
+        extracted = ""
+
+    return extracted
+
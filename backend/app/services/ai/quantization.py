@@ -0,0 +1,115 @@
+"""
+Compact binary encoding for stored and cached embeddings.
+
+A 384-dim vector as a JSON / Python float list costs several KB; as raw
+float16 it is 768 bytes and as int8 it is 392 bytes. Vectors are
+L2-normalized before encoding, so similarity on decoded vectors is a
+plain dot product.
+
+Layout (little-endian), designed so payloads stay aligned for
+`np.frombuffer`:
+
+    byte 0      encoding code (0 = f32, 1 = f16, 2 = i8)
+    bytes 1-3   reserved (zero)
+    bytes 4-7   i8 only: float32 per-vector scale
+    rest        row-major vector data
+
+Matrices (e.g. chunk vectors) use the same header followed by a uint32
+row count; i8 matrices store one float32 scale per row before the data.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Literal
+
+import numpy as np
+
+Encoding = Literal["f32", "f16", "i8"]
+
+_CODES: dict[str, int] = {"f32": 0, "f16": 1, "i8": 2}
+_NAMES = {v: k for k, v in _CODES.items()}
+_DTYPES = {"f32": np.float32, "f16": np.float16}
+_HEADER = 4
+
+
+def l2_normalize(vec: np.ndarray) -> np.ndarray:
+    vec = np.asarray(vec, dtype=np.float32)
+    norm = np.linalg.norm(vec, axis=-1, keepdims=True)
+    return vec / np.where(norm == 0, 1.0, norm)
+
+
+def _header(encoding: Encoding) -> bytes:
+    return bytes([_CODES[encoding], 0, 0, 0])
+
+
+def encoding_of(buf: bytes | memoryview) -> Encoding:
+    return _NAMES[buf[0]]  # type: ignore[return-value]
+
+
+def encode_vector(vec: np.ndarray, encoding: Encoding = "f16") -> bytes:
+    unit = l2_normalize(vec)
+    if encoding == "i8":
+        peak = float(np.max(np.abs(unit))) if unit.size else 0.0
+        scale = peak / 127.0 if peak else 1.0
+        q = np.clip(np.rint(unit / scale), -127, 127).astype(np.int8)
+        return _header(encoding) + struct.pack("<f", scale) + q.tobytes()
+    return _header(encoding) + unit.astype(_DTYPES[encoding]).tobytes()
+
+
+def decode_vector(buf: bytes | memoryview) -> np.ndarray:
+    """
+    Decode a vector. f32/f16 payloads are returned as zero-copy views.
+
+    int8 payloads are dequantized to float32 (one multiply); use
+    `dot_encoded` to compare two int8 vectors without dequantizing.
+    """
+    encoding = encoding_of(buf)
+    if encoding == "i8":
+        (scale,) = struct.unpack_from("<f", buf, _HEADER)
+        q = np.frombuffer(buf, dtype=np.int8, offset=_HEADER + 4)
+        return q.astype(np.float32) * np.float32(scale)
+    return np.frombuffer(buf, dtype=_DTYPES[encoding], offset=_HEADER)
+
+
+def dot_encoded(a: bytes | memoryview, b: bytes | memoryview) -> float:
+    """
+    Dot product of two encoded (hence normalized) vectors, i.e. their cosine.
+    """
+    if encoding_of(a) == "i8" and encoding_of(b) == "i8":
+        (sa,) = struct.unpack_from("<f", a, _HEADER)
+        (sb,) = struct.unpack_from("<f", b, _HEADER)
+        qa = np.frombuffer(a, dtype=np.int8, offset=_HEADER + 4).astype(np.int32)
+        qb = np.frombuffer(b, dtype=np.int8, offset=_HEADER + 4).astype(np.int32)
+        return float(sa * sb * int(qa.dot(qb)))
+    va = decode_vector(a).astype(np.float32, copy=False)
+    vb = decode_vector(b).astype(np.float32, copy=False)
+    return float(va.dot(vb))
+
+
+def encode_matrix(mat: np.ndarray, encoding: Encoding = "f16") -> bytes:
+    mat = np.asarray(mat, dtype=np.float32)
+    if mat.ndim != 2:
+        mat = mat.reshape(0, 0) if mat.size == 0 else mat.reshape(1, -1)
+    unit = l2_normalize(mat) if mat.size else mat
+    rows = struct.pack("<I", mat.shape[0])
+    if encoding == "i8":
+        peaks = np.max(np.abs(unit), axis=1) if unit.size else np.zeros(0, dtype=np.float32)
+        scales = np.where(peaks == 0, 1.0, peaks / 127.0).astype(np.float32)
+        q = np.clip(np.rint(unit / scales[:, None]), -127, 127).astype(np.int8)
+        return _header(encoding) + rows + scales.tobytes() + q.tobytes()
+    return _header(encoding) + rows + unit.astype(_DTYPES[encoding]).tobytes()
+
+
+def decode_matrix(buf: bytes | memoryview) -> np.ndarray:
+    encoding = encoding_of(buf)
+    (n_rows,) = struct.unpack_from("<I", buf, _HEADER)
+    offset = _HEADER + 4
+    if n_rows == 0:
+        return np.zeros((0, 0), dtype=np.float32)
+    if encoding == "i8":
+        scales = np.frombuffer(buf, dtype=np.float32, count=n_rows, offset=offset)
+        q = np.frombuffer(buf, dtype=np.int8, offset=offset + 4 * n_rows)
+        return q.reshape(n_rows, -1).astype(np.float32) * scales[:, None]
+    data = np.frombuffer(buf, dtype=_DTYPES[encoding], offset=offset)
+    return data.reshape(n_rows, -1)
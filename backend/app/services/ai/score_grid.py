@@ -0,0 +1,183 @@
+"""
+ATS scores for every resume x job pair in one set of array operations.
+
+Scoring 50 resumes against 200 job descriptions with `score_pair` is
+10,000 Python passes over skill sets. Here skill sets become boolean
+matrices over a vocabulary of job skills, so matched counts, weighted
+matches and missing critical skills of every pair are matrix products,
+and the rest of the ATS formula is evaluated elementwise on the
+(n_resumes, n_jobs) grid.
+
+The grid reproduces `score_pair` exactly: elementwise operations are
+evaluated in the same order as the scalar code, and the matrix products
+only sum importances, which are multiples of 0.5 (see
+`sections.JOB_SECTION_IMPORTANCE`), so their sums are exact whatever the
+summation order. Arbitrary importances would agree to within rounding.
+
+Not used by the API yet: `run_batch_analysis` scores one resume against
+a handful of jobs and stores each pair's matched / missing skill lists
+and breakdown, which only `score_pair` produces, so it stays on
+`score_batch`. The grid is for scoring many resumes against many jobs
+where only the scores are needed (see benchmarks/bench_score_grid.py).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .scoring import CRITICAL_IMPORTANCE, FRONTEND_SKILLS, JobFeatures, ResumeFeatures
+
+
+@dataclass(slots=True)
+class ScoreGrid:
+    """
+    (n_resumes, n_jobs) float64 arrays. `similarity` is zeroed where either
+    side has no skills, as in `ScoreBreakdown`.
+    """
+
+    ats_score: np.ndarray
+    similarity: np.ndarray
+    weighted_coverage: np.ndarray
+    critical_penalty: np.ndarray
+
+
+def similarity_grid(
+    resume_embeddings: np.ndarray,
+    job_embeddings: np.ndarray,
+    *,
+    normalized: bool = False,
+) -> np.ndarray:
+    """
+    `compute_similarity_score` for every pair from one matrix product of
+    (n_resumes, dim) and (n_jobs, dim) matrices.
+    """
+    resumes = np.asarray(resume_embeddings, dtype=np.float32)
+    jobs = np.asarray(job_embeddings, dtype=np.float32)
+    if resumes.ndim != 2 or jobs.ndim != 2 or resumes.shape[1] != jobs.shape[1]:
+        raise ValueError("Embedding vectors must have the same shape")
+    raw = resumes @ jobs.T
+    if not normalized:
+        denom = np.outer(np.linalg.norm(resumes, axis=1), np.linalg.norm(jobs, axis=1))
+        raw = np.divide(raw, denom, out=np.zeros_like(raw), where=denom != 0)
+    return np.maximum(0.0, (raw + 1.0) / 2.0)
+
+
+def _skill_matrices(
+    resumes: Sequence[ResumeFeatures],
+    jobs: Sequence[JobFeatures],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, int]]:
+    """
+    Resume and job skills as boolean matrices over the job-skill vocabulary
+    (skills no job asks for cannot change a score), and job importances
+    with non-positive weights zeroed.
+    """
+    vocabulary: dict[str, int] = {}
+    for job in jobs:
+        for skill in job.skills:
+            vocabulary.setdefault(skill, len(vocabulary))
+    size = len(vocabulary)
+
+    has = np.zeros((len(resumes), size), dtype=bool)
+    for r, resume in enumerate(resumes):
+        ids = [vocabulary[s] for s in resume.skills if s in vocabulary]
+        has[r, ids] = True
+
+    wants = np.zeros((len(jobs), size), dtype=bool)
+    weights = np.zeros((len(jobs), size), dtype=np.float64)
+    for j, job in enumerate(jobs):
+        for skill in job.skills:
+            k = vocabulary[skill]
+            wants[j, k] = True
+            weights[j, k] = max(0.0, job.importance.get(skill, 1.0))
+    return has, wants, weights, vocabulary
+
+
+def score_grid(
+    resumes: Sequence[ResumeFeatures],
+    jobs: Sequence[JobFeatures],
+    similarity: np.ndarray,
+) -> ScoreGrid:
+    """
+    `score_pair(ScoringFeatures.of(resumes[r], jobs[j], similarity[r, j]))`
+    for every pair, as arrays.
+    """
+    similarity = np.asarray(similarity, dtype=np.float64)
+    shape = (len(resumes), len(jobs))
+    if similarity.shape != shape:
+        raise ValueError(f"similarity must have shape {shape}")
+
+    has, wants, weights, vocabulary = _skill_matrices(resumes, jobs)
+    has_f = has.astype(np.float64)
+
+    # Weighted coverage: importance of matched skills over total importance.
+    weighted_total = weights.sum(axis=1)
+    weighted_matched = has_f @ weights.T
+    weighted_coverage = np.divide(
+        weighted_matched,
+        weighted_total,
+        out=np.zeros(shape),
+        where=weighted_total > 0,
+    )
+
+    # Critical skills the resume lacks: critical total minus critical matched.
+    critical = (weights >= CRITICAL_IMPORTANCE).astype(np.float64)
+    critical_missing = critical.sum(axis=1) - has_f @ critical.T
+    critical_penalty = np.where(
+        critical_missing > 0, np.minimum(0.25, 0.05 * critical_missing), 0.0
+    )
+    fullstack = np.array([job.fullstack_role for job in jobs], dtype=bool)
+    frontend_missing = np.zeros(shape, dtype=bool)
+    for skill in FRONTEND_SKILLS:
+        k = vocabulary.get(skill)
+        if k is not None:
+            frontend_missing |= np.logical_and.outer(~has[:, k], wants[:, k])
+    critical_penalty = critical_penalty + np.where(frontend_missing & fullstack, 0.1, 0.0)
+
+    # Experience: NaN marks "not stated".
+    required = np.array(
+        [np.nan if job.required_years is None else job.required_years for job in jobs],
+        dtype=np.float64,
+    )
+    stated = np.array(
+        [np.nan if resume.years is None else resume.years for resume in resumes],
+        dtype=np.float64,
+    )
+    gap = required[None, :] - stated[:, None]
+    with np.errstate(invalid="ignore"):
+        exp_match = np.where(
+            gap <= 0, 1.0, np.maximum(0.0, 1.0 - gap / np.maximum(1.0, required)[None, :])
+        )
+    exp_match = np.where(np.isnan(gap), 0.0, exp_match)
+    experience = np.where(np.isnan(required)[None, :], 0.5, exp_match)
+
+    formatting = np.array(
+        [
+            min(1.0, max(0.0, (0.35 if r.has_bullets else 0.15) + min(0.65, r.length / 6000)))
+            for r in resumes
+        ],
+        dtype=np.float64,
+    )
+
+    # If we failed to extract skills, similarity should not dominate the score.
+    resume_has_skills = np.array([bool(r.skills) for r in resumes], dtype=bool)
+    job_has_skills = np.array([bool(j.skills) for j in jobs], dtype=bool)
+    similarity = np.where(np.logical_and.outer(resume_has_skills, job_has_skills), similarity, 0.0)
+
+    ats_score = np.clip(
+        0.25 * similarity
+        + 0.50 * weighted_coverage
+        + 0.15 * experience
+        + 0.10 * formatting[:, None]
+        - critical_penalty,
+        0.0,
+        1.0,
+    )
+    return ScoreGrid(
+        ats_score=ats_score,
+        similarity=similarity,
+        weighted_coverage=weighted_coverage,
+        critical_penalty=critical_penalty,
+    )
@@ -1,42 +1,252 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 
 import numpy as np
 
 from .embeddings import cosine_similarity
+from .skill_profiles import profile_ordinals
 
 
 def compute_similarity_score(
     resume_embedding: np.ndarray,
     job_embedding: np.ndarray,
+    *,
+    normalized: bool = False,
 ) -> float:
     """
     Compute cosine similarity in [0, 1] for stable comparison.
+
+    Stored embeddings are unit vectors; pass normalized=True for those.
     """
-    raw = cosine_similarity(resume_embedding, job_embedding)
+    raw = cosine_similarity(resume_embedding, job_embedding, normalized=normalized)
     # cosine is [-1, 1]; clamp and shift into [0, 1]
     return float(max(0.0, (raw + 1.0) / 2.0))
 
 
-def compute_ats_score(
-    similarity_score: float,
-    matched_skills: Sequence[str],
-    required_skills: Sequence[str],
-) -> float:
+def compute_similarity_scores(
+    resume_embedding: np.ndarray,
+    job_embeddings: np.ndarray,
+    *,
+    normalized: bool = False,
+) -> np.ndarray:
+    """
+    Vectorised `compute_similarity_score` of one resume against many jobs.
+
+    `job_embeddings` is a (n_jobs, dim) matrix; all scores come from a
+    single matrix-vector product.
+    """
+    resume = np.asarray(resume_embedding, dtype=np.float32)
+    jobs = np.asarray(job_embeddings, dtype=np.float32)
+    if jobs.ndim != 2 or jobs.shape[1] != resume.shape[0]:
+        raise ValueError("Embedding vectors must have the same shape")
+    raw = jobs @ resume
+    if not normalized:
+        denom = np.linalg.norm(jobs, axis=1) * np.linalg.norm(resume)
+        raw = np.divide(raw, denom, out=np.zeros_like(raw), where=denom != 0)
+    return np.maximum(0.0, (raw + 1.0) / 2.0)
+
+
+# Skills whose absence from a full-stack role's resume costs extra.
+FRONTEND_SKILLS = frozenset({"react", "node.js"})
+# Job skills at or above this importance are critical when missing.
+CRITICAL_IMPORTANCE = 2.0
+
+
+@dataclass(slots=True)
+class ScoringFeatures:
+    """
+    Everything the ATS formula reads for one resume / job pair. Skill names
+    are canonical; `job_importance` maps canonical job skills to their
+    stored importance (missing entries weigh 1.0).
+
+    With `skill_names` (ordinal -> name) set, overlaps are computed on the
+    bitset profiles `resume_profile` / `job_profile` (see
+    `skill_profiles`) instead of the name sets.
+    """
+
+    resume_skills: frozenset[str]
+    job_skills: frozenset[str]
+    similarity: float
+    job_importance: Mapping[str, float] = field(default_factory=dict)
+    required_years: float | None = None
+    resume_years: float | None = None
+    resume_length: int = 0
+    has_bullets: bool = False
+    fullstack_role: bool = False
+    resume_profile: int = 0
+    job_profile: int = 0
+    skill_names: Mapping[int, str] | None = None
+
+    @classmethod
+    def of(cls, resume: ResumeFeatures, job: JobFeatures, similarity: float) -> ScoringFeatures:
+        return cls(
+            resume_skills=resume.skills,
+            job_skills=job.skills,
+            similarity=similarity,
+            job_importance=job.importance,
+            required_years=job.required_years,
+            resume_years=resume.years,
+            resume_length=resume.length,
+            has_bullets=resume.has_bullets,
+            fullstack_role=job.fullstack_role,
+        )
+
+
+@dataclass(slots=True)
+class ResumeFeatures:
+    """
+    The resume side of `ScoringFeatures`, for scoring one resume against
+    many jobs (see `score_grid`).
+    """
+
+    skills: frozenset[str]
+    years: float | None = None
+    length: int = 0
+    has_bullets: bool = False
+
+
+@dataclass(slots=True)
+class JobFeatures:
     """
-    Placeholder ATS-style scoring function.
+    The job side of `ScoringFeatures`.
+    """
+
+    skills: frozenset[str]
+    importance: Mapping[str, float] = field(default_factory=dict)
+    required_years: float | None = None
+    fullstack_role: bool = False
+
+
+@dataclass(slots=True)
+class ScoreBreakdown:
+    """
+    Result of `score_pair`. `similarity` is the input similarity, zeroed
+    when either side has no skills.
+    """
+
+    similarity: float
+    ats_score: float
+    matched_skills: list[str]
+    missing_skills: list[str]
+    extra_skills: list[str]
+    critical_missing: list[str]
+    critical_penalty: float
+    weighted_coverage: float
+    keyword_optimization: float
+    formatting: float
+    experience_match: float
+    experience_gap: float | None
+    experience_relevance: float
+    project_relevance: float
+
+
+def _clamp(value: float) -> float:
+    return float(min(1.0, max(0.0, value)))
+
+
+def score_pair(features: ScoringFeatures) -> ScoreBreakdown:
+    """
+    ATS score of one pair. Pure: no I/O, so it can run in a process pool.
 
-    Combines semantic similarity with skill coverage in a weighted way.
+    ats = 0.25 * similarity + 0.50 * weighted coverage
+          + 0.15 * experience match (0.5 when the job states no years)
+          + 0.10 * formatting - critical penalty, clamped to [0, 1].
     """
-    if not required_skills:
-        coverage = 1.0
+    similarity = features.similarity
+    # (job skill, matched) sorted by name, and the resume's extra skills.
+    names = features.skill_names
+    if names is not None:
+        resume_bits = features.resume_profile
+        job_bits = features.job_profile
+        job_skills = sorted(
+            (names[k], bool(resume_bits >> k & 1)) for k in profile_ordinals(job_bits)
+        )
+        extra_skills = sorted(names[k] for k in profile_ordinals(resume_bits & ~job_bits))
+        has_resume_skills = resume_bits != 0
     else:
-        coverage = len(set(matched_skills)) / len(set(required_skills))
+        resume_set = features.resume_skills
+        job_skills = [(s, s in resume_set) for s in sorted(features.job_skills)]
+        extra_skills = sorted(resume_set - features.job_skills)
+        has_resume_skills = bool(resume_set)
 
-    # Weighted combination; these weights can be tuned
-    score = 0.6 * similarity_score + 0.4 * coverage
-    return float(max(0.0, min(score, 1.0)))
+    matched_skills = [s for s, matched in job_skills if matched]
+    missing_skills = [s for s, matched in job_skills if not matched]
+
+    formatting = _clamp(
+        (0.35 if features.has_bullets else 0.15) + min(0.65, features.resume_length / 6000)
+    )
+    coverage = 0.0 if not job_skills else (len(matched_skills) / max(1, len(job_skills)))
+    keyword_optimization = _clamp(coverage)
+
+    weighted_total = 0.0
+    weighted_matched = 0.0
+    critical_missing: list[str] = []
+    for s, matched in job_skills:
+        w = features.job_importance.get(s, 1.0)
+        if w <= 0:
+            continue
+        weighted_total += w
+        if matched:
+            weighted_matched += w
+        elif w >= CRITICAL_IMPORTANCE:
+            critical_missing.append(s)
+    weighted_coverage = 0.0 if weighted_total <= 0 else (weighted_matched / weighted_total)
+
+    required_years = features.required_years
+    resume_years = features.resume_years
+    gap = None
+    exp_match = 0.0
+    if required_years is not None and resume_years is not None:
+        gap = float(required_years - resume_years)
+        exp_match = 1.0 if gap <= 0 else max(0.0, 1.0 - (gap / max(1.0, required_years)))
+
+    experience_relevance = _clamp(0.2 + 0.8 * exp_match)
+    project_relevance = _clamp(0.2 + 0.8 * similarity)
+
+    # If we failed to extract skills, similarity should not dominate the score.
+    if not has_resume_skills or not job_skills:
+        similarity = 0.0
+
+    critical_penalty = 0.0
+    if critical_missing:
+        critical_penalty = min(0.25, 0.05 * float(len(critical_missing)))
+    if features.fullstack_role and not FRONTEND_SKILLS.isdisjoint(missing_skills):
+        critical_penalty += 0.1
+
+    ats_score = _clamp(
+        (
+            0.25 * similarity
+            + 0.50 * weighted_coverage
+            + 0.15 * (exp_match if required_years is not None else 0.5)
+            + 0.10 * formatting
+        )
+        - critical_penalty
+    )
+    return ScoreBreakdown(
+        similarity=similarity,
+        ats_score=ats_score,
+        matched_skills=matched_skills,
+        missing_skills=missing_skills,
+        extra_skills=extra_skills,
+        critical_missing=critical_missing,
+        critical_penalty=critical_penalty,
+        weighted_coverage=float(weighted_coverage),
+        keyword_optimization=keyword_optimization,
+        formatting=formatting,
+        experience_match=exp_match,
+        experience_gap=gap,
+        experience_relevance=experience_relevance,
+        project_relevance=project_relevance,
+    )
+
+
+def score_batch(features: Iterable[ScoringFeatures]) -> list[ScoreBreakdown]:
+    """
+    `score_pair` over many pairs in one call (one process-pool task).
+    """
+    return [score_pair(f) for f in features]
 
 
 def compute_missing_skills(
@@ -0,0 +1,246 @@
+"""
+Simple sectionizer for resumes and job descriptions.
+
+A document is split on header lines ("Experience", "Requirements:",
+"Must have") into named sections. The text is normalized line by line
+exactly like `text.normalize_text` normalizes the whole document, so
+section spans are expressed in the same offsets as the skill matcher's
+hits and a hit's enclosing section is a table lookup.
+
+Header lines are recognised by one compiled grammar per document kind.
+Job descriptions are segmented once when they are created and their
+spans stored on `JobDescription.sections`.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any
+
+from .text import TextDocument
+
+# First words of a header line -> section name.
+RESUME_HEADERS: dict[str, str] = {
+    "summary": "summary",
+    "profile": "summary",
+    "about me": "summary",
+    "objective": "summary",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "employment": "experience",
+    "work history": "experience",
+    "projects": "projects",
+    "personal projects": "projects",
+    "skills": "skills",
+    "technical skills": "skills",
+    "core skills": "skills",
+    "technologies": "skills",
+    "education": "education",
+    "certifications": "certifications",
+    "certificates": "certifications",
+}
+
+JOB_HEADERS: dict[str, str] = {
+    "must have": "must_have",
+    "must haves": "must_have",
+    "must have skills": "must_have",
+    "required": "must_have",
+    "required skills": "must_have",
+    "mandatory": "must_have",
+    "requirements": "requirements",
+    "job requirements": "requirements",
+    "qualifications": "requirements",
+    "minimum qualifications": "requirements",
+    "what you bring": "requirements",
+    "what we re looking for": "requirements",
+    "responsibilities": "responsibilities",
+    "key responsibilities": "responsibilities",
+    "what you ll do": "responsibilities",
+    "the role": "responsibilities",
+    "nice to have": "nice_to_have",
+    "nice to haves": "nice_to_have",
+    "preferred": "nice_to_have",
+    "preferred qualifications": "nice_to_have",
+    "preferred skills": "nice_to_have",
+    "bonus": "nice_to_have",
+    "benefits": "benefits",
+    "perks": "benefits",
+    "what we offer": "benefits",
+    "about us": "about",
+    "about the company": "about",
+}
+
+
+def _compile_header_grammar(headers: dict[str, str]) -> re.Pattern[str]:
+    """
+    One regex per document kind recognising a header line: optional
+    bullet/numbering, a known phrase (words may be separated by any
+    punctuation, so "nice-to-have" and "what we're looking for" match),
+    then either the end of the line or a colon introducing inline content
+    ("Must have: Python, SQL").
+    """
+    phrases = sorted(headers, key=len, reverse=True)
+    alternation = "|".join(r"[\W_]+".join(map(re.escape, p.split())) for p in phrases)
+    return re.compile(
+        rf"^[\W\d_]*(?P<header>{alternation})(?:[\W_]*$|\s*[:\u2013\u2014-])",
+        re.IGNORECASE,
+    )
+
+
+_GRAMMARS: dict[str, tuple[re.Pattern[str], dict[str, str]]] = {
+    "resume": (_compile_header_grammar(RESUME_HEADERS), RESUME_HEADERS),
+    "job": (_compile_header_grammar(JOB_HEADERS), JOB_HEADERS),
+}
+_HEADER_WORDS = re.compile(r"[a-z]+")
+
+# Section -> JobSkill.importance: must-have 2.0, requirements 1.5 (the scale
+# the analysis used to infer from keywords anywhere in the text), optional
+# skills count half.
+JOB_SECTION_IMPORTANCE: dict[str, float] = {
+    "must_have": 2.0,
+    "requirements": 1.5,
+    "responsibilities": 1.5,
+    "nice_to_have": 0.5,
+}
+DEFAULT_JOB_IMPORTANCE = 1.0
+
+# Section -> base ResumeSkill.weight; each further mention adds a little.
+RESUME_SECTION_WEIGHTS: dict[str, float] = {
+    "experience": 0.8,
+    "projects": 0.8,
+    "skills": 0.6,
+    "certifications": 0.6,
+}
+DEFAULT_RESUME_WEIGHT = 0.5
+RESUME_REPEAT_BONUS = 0.1
+
+
+@dataclass(frozen=True)
+class Section:
+    name: str
+    start: int
+    end: int
+
+
+@dataclass
+class SectionedText:
+    """
+    Normalized text plus its sections, in normalized-text offsets.
+
+    Text before the first header belongs to the "body" section. Sections
+    are contiguous and ordered; `section_at` is a single table lookup.
+    """
+
+    text: str
+    sections: list[Section]
+
+    def __post_init__(self) -> None:
+        self._names = [s.name for s in self.sections]
+        if len(self.sections) < 256:
+            # One byte per character: the index of its section.
+            self._table = b"".join(bytes((i,)) * (s.end - s.start) for i, s in enumerate(self.sections))
+        else:
+            self._table = None
+            self._starts = [s.start for s in self.sections]
+
+    def section_at(self, offset: int) -> str:
+        if self._table is not None:
+            if 0 <= offset < len(self._table):
+                return self._names[self._table[offset]]
+            return self._names[-1] if self._names and offset >= 0 else "body"
+        i = bisect_right(self._starts, offset) - 1
+        return self._names[i] if i >= 0 else "body"
+
+    def to_json(self) -> list[list[Any]]:
+        return [[s.name, s.start, s.end] for s in self.sections]
+
+    @classmethod
+    def from_json(cls, text: str, spans: list[list[Any]]) -> SectionedText:
+        return cls(text=text, sections=[Section(str(n), int(a), int(b)) for n, a, b in spans])
+
+
+def _normalize_line(line: str) -> str:
+    line = re.sub(r"[^a-z0-9\s\+\#\.]", " ", line.lower())
+    return re.sub(r"\s+", " ", line).strip()
+
+
+def _header_section(line: str, kind: str) -> str | None:
+    grammar, headers = _GRAMMARS[kind]
+    m = grammar.match(line)
+    if m is None:
+        return None
+    # The alternation tries longer phrases first ("preferred qualifications").
+    return headers.get(" ".join(_HEADER_WORDS.findall(m.group("header").lower())))
+
+
+def split_sections(text: str, kind: str = "resume") -> SectionedText:
+    """
+    Normalize `text` and split it into sections.
+
+    Joining normalized non-empty lines with single spaces yields exactly
+    `normalize_text(text)`, since newlines are whitespace there too.
+    """
+    parts: list[str] = []
+    sections: list[Section] = []
+    offset = 0
+    current = "body"
+    current_start = 0
+    for raw_line in (text or "").split("\n"):
+        line = _normalize_line(raw_line)
+        if not line:
+            continue
+        if parts:
+            offset += 1  # joining space
+        header = _header_section(raw_line, kind)
+        if header is not None and header != current:
+            if offset > current_start:
+                sections.append(Section(current, current_start, offset))
+            current, current_start = header, offset
+        parts.append(line)
+        offset += len(line)
+    if offset > current_start or not sections:
+        sections.append(Section(current, current_start, offset))
+    return SectionedText(text=" ".join(parts), sections=sections)
+
+
+def split_job_sections(text: str | TextDocument) -> str:
+    """
+    Section spans of a job description as the JSON stored on
+    `JobDescription.sections` at creation time.
+    """
+    return json.dumps(TextDocument.of(text).layout("job").to_json())
+
+
+def load_sections(normalized_text: str, stored: str | None) -> SectionedText | None:
+    """
+    Rebuild a layout from spans stored by `split_job_sections`; None when
+    nothing usable is stored (callers then segment the text themselves).
+    """
+    if not stored:
+        return None
+    try:
+        layout = SectionedText.from_json(normalized_text, json.loads(stored))
+    except (ValueError, TypeError):
+        return None
+    if not layout.sections or layout.sections[-1].end != len(normalized_text):
+        return None
+    return layout
+
+
+def job_importance(sections: set[str] | tuple[str, ...]) -> float:
+    return max(
+        (JOB_SECTION_IMPORTANCE.get(s, DEFAULT_JOB_IMPORTANCE) for s in sections),
+        default=DEFAULT_JOB_IMPORTANCE,
+    )
+
+
+def resume_weight(sections: set[str] | tuple[str, ...], count: int) -> float:
+    base = max(
+        (RESUME_SECTION_WEIGHTS.get(s, DEFAULT_RESUME_WEIGHT) for s in sections),
+        default=DEFAULT_RESUME_WEIGHT,
+    )
+    return round(min(1.0, base + RESUME_REPEAT_BONUS * max(0, count - 1)), 4)
@@ -0,0 +1,142 @@
+"""
+Bitset skill profiles over dense skill ordinals.
+
+Every row of the `skills` table has a dense integer `ordinal`. A
+document's skills are stored as a bitset with bit `ordinal` set for each
+skill: a Python int in memory, and packed little-endian uint64 words on
+the row (`Resume.skill_profile`, `JobDescription.skill_profile`).
+
+Matched, missing and extra skills of a pair are then `&` / `& ~` of two
+ints and coverage a popcount, and thousands of stored profiles stack
+into a (n, words) uint64 matrix where overlaps with one profile are a
+vectorised AND + popcount.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+
+_WORD_BYTES = 8
+
+
+def profile_from_ordinals(ordinals: Iterable[int]) -> int:
+    profile = 0
+    for ordinal in ordinals:
+        profile |= 1 << ordinal
+    return profile
+
+
+def profile_ordinals(profile: int) -> list[int]:
+    """
+    Ordinals of the set bits, ascending.
+    """
+    ordinals: list[int] = []
+    while profile:
+        low = profile & -profile
+        ordinals.append(low.bit_length() - 1)
+        profile ^= low
+    return ordinals
+
+
+def profile_to_bytes(profile: int) -> bytes:
+    words = (profile.bit_length() + 63) // 64
+    return profile.to_bytes(words * _WORD_BYTES, "little")
+
+
+def profile_from_bytes(buf: bytes | None) -> int:
+    return int.from_bytes(buf, "little") if buf else 0
+
+
+def profile_matrix(buffers: Sequence[bytes | None], words: int | None = None) -> np.ndarray:
+    """
+    Stored profiles as a zero-padded (len(buffers), words) uint64 matrix.
+    """
+    if words is None:
+        words = max((len(b) // _WORD_BYTES for b in buffers if b), default=0)
+    out = np.zeros((len(buffers), words), dtype="<u8")
+    for row, buf in enumerate(buffers):
+        if buf:
+            data = np.frombuffer(buf, dtype="<u8")[:words]
+            out[row, : len(data)] = data
+    return out
+
+
+def profile_row(profile: int, words: int) -> np.ndarray:
+    """
+    One in-memory profile as a (words,) uint64 row, truncated to `words`.
+    """
+    buf = profile_to_bytes(profile)[: words * _WORD_BYTES]
+    row = np.zeros(words, dtype="<u8")
+    data = np.frombuffer(buf, dtype="<u8")
+    row[: len(data)] = data
+    return row
+
+
+if hasattr(np, "bitwise_count"):
+
+    def popcount(words: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(words)
+
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(words: np.ndarray) -> np.ndarray:
+        counts = _BYTE_COUNTS[np.ascontiguousarray(words).view(np.uint8)]
+        return counts.reshape(*words.shape, _WORD_BYTES).sum(axis=-1, dtype=np.uint8)
+
+
+def overlap_counts(row: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Number of skills each profile in `matrix` shares with `row`.
+    """
+    return popcount(matrix & row).sum(axis=1, dtype=np.int64)
+
+
+def profile_sizes(matrix: np.ndarray) -> np.ndarray:
+    return popcount(matrix).sum(axis=1, dtype=np.int64)
+
+
+class SkillVocabulary:
+    """
+    Skill name <-> ordinal, filled from every query that reads or writes
+    skills with their ordinal. Ordinals never change for a name, so
+    entries are never invalidated.
+    """
+
+    def __init__(self) -> None:
+        self._ordinals: dict[str, int] = {}
+        self._names: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def update(self, pairs: Iterable[tuple[str, int]]) -> None:
+        with self._lock:
+            for name, ordinal in pairs:
+                self._ordinals[name] = ordinal
+                self._names[ordinal] = name
+
+    @property
+    def names(self) -> Mapping[int, str]:
+        return self._names
+
+    def ordinal(self, name: str) -> int | None:
+        return self._ordinals.get(name)
+
+    def profile(self, names: Iterable[str]) -> int:
+        """
+        Profile of `names`; names without a known ordinal are skipped.
+        """
+        ordinals = self._ordinals
+        return profile_from_ordinals(o for o in map(ordinals.get, names) if o is not None)
+
+    def knows(self, profile: int) -> bool:
+        names = self._names
+        return all(o in names for o in profile_ordinals(profile))
+
+
+skill_vocabulary = SkillVocabulary()
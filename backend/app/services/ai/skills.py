@@ -1,37 +1,103 @@
-import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from .fuzzy import FuzzySkillIndex
+from .matcher import SkillMatcher
+from .sections import SectionedText
+from .text import TextDocument, normalize_text
+
+
+@dataclass(frozen=True)
+class SkillMention:
+    """
+    Every occurrence of one skill in a document: how often it appears,
+    where (offsets into the normalized text) and in which sections.
+    """
+
+    skill: str
+    count: int
+    offsets: tuple[tuple[int, int], ...]
+    sections: tuple[str, ...]
 
 
 class SkillExtractor:
-    def __init__(self, skill_dictionary: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        skill_dictionary: list[str] | None = None,
+        aliases: dict[str, str] | None = None,
+        fuzzy_min_confidence: float | None = None,
+    ) -> None:
         self.skill_dictionary = skill_dictionary or _DEFAULT_SKILLS
+        # Compiled once; one linear pass per text regardless of dictionary size.
+        self.matcher = SkillMatcher(self.skill_dictionary, aliases)
+        # Optional second stage for spelling variants the exact matcher misses.
+        self.fuzzy = (
+            FuzzySkillIndex(self.matcher.patterns, min_confidence=fuzzy_min_confidence)
+            if fuzzy_min_confidence is not None
+            else None
+        )
 
-    def extract_skills(self, text: str) -> list[str]:
-        normalized = _normalize_text(text)
-        if not normalized:
-            return []
+    def extract_skills(self, text: str | TextDocument) -> list[str]:
+        """
+        Sorted skill names of `extract_mentions`, fuzzy matches included.
+        """
+        return [mention.skill for mention in self.extract_mentions(text)]
 
-        found: set[str] = set()
-        for skill in self.skill_dictionary:
-            s = skill.strip().lower()
-            if not s:
-                continue
-            # word-boundary-ish match for single tokens; relaxed substring for multi-word skills
-            if " " in s:
-                if s in normalized:
-                    found.add(skill)
-            else:
-                if re.search(rf"\b{re.escape(s)}\b", normalized):
-                    found.add(skill)
+    def extract_mentions(
+        self,
+        text: str | TextDocument,
+        kind: str = "resume",
+        stored_sections: str | None = None,
+    ) -> list[SkillMention]:
+        """
+        Skills with their occurrence counts, offsets and enclosing sections,
+        from one matcher pass plus the fuzzy stage when enabled.
+        `kind` ("resume" or "job") selects the section headers to recognise;
+        `stored_sections` are spans saved at creation, used instead of
+        segmenting the text again.
+        """
+        layout = TextDocument.of(text).layout(kind, stored_sections)
+        if not layout.text:
+            return []
+        return self.mentions_from_hits(layout, self.matcher.find_all(layout.text))
 
-        return sorted(found)
+    def mentions_from_hits(
+        self,
+        layout: SectionedText,
+        hits: Iterable[tuple[int, int, int]],
+    ) -> list[SkillMention]:
+        """
+        Group (start, end, pattern_id) hits over `layout.text` into mentions,
+        adding fuzzy matches of the remaining text when enabled. Shared with
+        the spaCy bulk pipeline, which finds exact hits its own way.
+        """
+        if self.fuzzy is not None:
+            hits = list(hits)
+            hits.extend((start, end, pid) for start, end, pid, _ in self.fuzzy.find(layout.text, hits))
+        offsets: dict[str, list[tuple[int, int]]] = {}
+        sections: dict[str, list[str]] = {}
+        labels = self.matcher.labels
+        for start, end, pid in hits:
+            section = layout.section_at(start)
+            for label in labels[pid]:
+                offsets.setdefault(label, []).append((start, end))
+                seen = sections.setdefault(label, [])
+                if section not in seen:
+                    seen.append(section)
+        return [
+            SkillMention(
+                skill=label,
+                count=len(offsets[label]),
+                offsets=tuple(offsets[label]),
+                sections=tuple(sections[label]),
+            )
+            for label in sorted(offsets)
+        ]
 
 
 def _normalize_text(text: str) -> str:
-    text = (text or "").lower()
     # Keep word characters, plus, and # for skills like c++/c#
-    text = re.sub(r"[^a-z0-9\s\+\#\.]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return normalize_text(text)
 
 
 _DEFAULT_SKILLS: list[str] = [
@@ -75,6 +141,58 @@ _DEFAULT_SKILLS: list[str] = [
 ]
 
 
-def get_skill_extractor() -> SkillExtractor:
-    return SkillExtractor()
+# Bumped when extraction output changes for the same dictionary, so stored
+# skills are stamped stale and re-extracted (2: occurrence weights,
+# 3: header grammar and nice-to-have importance).
+_EXTRACTOR_REVISION = 3
+
+
+# alias -> canonical name. Aliases marked False only canonicalize names that
+# were already extracted; as text patterns they are too ambiguous
+# ("next steps", the "js" in "node.js").
+_DEFAULT_ALIASES: dict[str, tuple[str, bool]] = {
+    "react.js": ("react", True),
+    "reactjs": ("react", True),
+    "nodejs": ("node.js", True),
+    "node": ("node.js", True),
+    "expressjs": ("express", True),
+    "nextjs": ("next.js", True),
+    "next": ("next.js", False),
+    "postgres": ("postgresql", True),
+    "postgre": ("postgresql", True),
+    "js": ("javascript", False),
+    "ts": ("typescript", False),
+}
+
+
+def get_skill_extractor(taxonomy_version: str | None = None) -> SkillExtractor:
+    """
+    Extractor for the active skill taxonomy (or a specific version of it).
+    """
+    from .taxonomy import taxonomy_registry
+
+    return taxonomy_registry.for_version(taxonomy_version).extractor
+
+
+def extract_skill_mentions_many(
+    texts: list[str],
+    kinds: list[str],
+    taxonomy_version: str | None = None,
+    stored_sections: list[str | None] | None = None,
+    normalized: list[str | None] | None = None,
+) -> list[list[SkillMention]]:
+    """
+    Extract skill mentions for several texts in one call; `kinds[i]` is
+    "resume" or "job", and `stored_sections[i]` / `normalized[i]` the
+    document's stored spans and normalized text, if any.
 
+    Module-level so it can be shipped to the AI process pool; pass the
+    parent's taxonomy version so workers match with the same dictionary.
+    """
+    extractor = get_skill_extractor(taxonomy_version)
+    stored_sections = stored_sections or [None] * len(texts)
+    normalized = normalized or [None] * len(texts)
+    return [
+        extractor.extract_mentions(TextDocument(t, normalized=n), kind, spans)
+        for t, kind, spans, n in zip(texts, kinds, stored_sections, normalized)
+    ]
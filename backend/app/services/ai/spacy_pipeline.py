@@ -0,0 +1,122 @@
+"""
+Bulk skill extraction with a spaCy pipeline.
+
+For backfills and re-extraction over thousands of documents, texts are
+streamed through `nlp.pipe` on a blank English pipeline (tokenizer only)
+whose single component is a `PhraseMatcher` over the skill taxonomy.
+`nlp.pipe` batches documents and can fan out to `n_process` worker
+processes; each worker builds its matcher from the taxonomy snapshot of
+the requested version, exactly like the AI process pool does.
+
+Documents are fed in normalized form, so match offsets line up with the
+section layout and the results are the same `SkillMention` lists the
+online extractor produces. Hits are filtered with the online matcher's
+boundary rule, so both paths store the same skills for a document; the
+one remaining difference is that matches are token-aligned, so a skill
+inside a token spaCy does not split ("node" in "node.js") is not
+counted. `bench_spacy_pipeline.py` measures agreement with the online
+extractor alongside throughput.
+
+spaCy is only imported by this module, which the API never loads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import spacy
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
+
+from .skills import SkillMention
+from .taxonomy import taxonomy_registry
+from .text import TextDocument
+
+COMPONENT_NAME = "resumepilot_skill_matcher"
+
+if not Doc.has_extension("skill_hits"):
+    Doc.set_extension("skill_hits", default=None)
+
+
+class SkillPhraseComponent:
+    """
+    Stores (start_char, end_char, pattern_id) hits on `doc._.skill_hits`;
+    pattern ids are those of the taxonomy's `SkillMatcher`.
+    """
+
+    def __init__(self, nlp: Language, taxonomy_version: str | None) -> None:
+        compiled = taxonomy_registry.for_version(taxonomy_version)
+        self.taxonomy_version = compiled.version
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self._pids: dict[int, int] = {}
+        patterns = compiled.extractor.matcher.patterns
+        for pid, doc in enumerate(nlp.tokenizer.pipe(patterns, batch_size=1000)):
+            key = f"skill:{pid}"
+            self._pids[nlp.vocab.strings.add(key)] = pid
+            self.matcher.add(key, [doc])
+
+    def __call__(self, doc: Doc) -> Doc:
+        pids = self._pids
+        doc._.skill_hits = [
+            (doc[start].idx, doc[end - 1].idx + len(doc[end - 1]), pids[match_id])
+            for match_id, start, end in self.matcher(doc)
+        ]
+        return doc
+
+
+@Language.factory(COMPONENT_NAME, default_config={"taxonomy_version": None})
+def _make_skill_phrase_component(
+    nlp: Language,
+    name: str,
+    taxonomy_version: str | None,
+) -> SkillPhraseComponent:
+    return SkillPhraseComponent(nlp, taxonomy_version)
+
+
+def build_skill_nlp(taxonomy_version: str | None = None, model: str | None = None) -> Language:
+    """
+    Blank English pipeline (or `model` with its other components disabled)
+    plus the skill phrase matcher for `taxonomy_version`.
+    """
+    if model:
+        nlp = spacy.load(model)
+        nlp.select_pipes(enable=[])
+    else:
+        nlp = spacy.blank("en")
+    nlp.add_pipe(COMPONENT_NAME, config={"taxonomy_version": taxonomy_version})
+    return nlp
+
+
+def pipe_skill_mentions(
+    rows: Iterable[tuple[Any, str, str, str | None]],
+    *,
+    taxonomy_version: str | None = None,
+    batch_size: int = 256,
+    n_process: int = 1,
+    model: str | None = None,
+    nlp: Language | None = None,
+) -> Iterator[tuple[Any, list[SkillMention]]]:
+    """
+    Stream (doc_id, mentions) for (doc_id, text, kind, stored_sections) rows,
+    in input order. `kind` is "resume" or "job"; `stored_sections` are a
+    job description's stored spans, or None.
+    """
+    nlp = nlp or build_skill_nlp(taxonomy_version, model)
+    extractor = taxonomy_registry.for_version(taxonomy_version).extractor
+    accepts = extractor.matcher.accepts
+    # Layouts stay in this process; only normalized text and a sequence
+    # number travel to the workers.
+    layouts: dict[int, tuple[Any, Any]] = {}
+
+    def _feed() -> Iterator[tuple[str, int]]:
+        for seq, (doc_id, text, kind, stored_sections) in enumerate(rows):
+            layout = TextDocument(text).layout(kind, stored_sections)
+            layouts[seq] = (doc_id, layout)
+            yield layout.text, seq
+
+    for doc, seq in nlp.pipe(_feed(), as_tuples=True, batch_size=batch_size, n_process=n_process):
+        doc_id, layout = layouts.pop(seq)
+        hits = sorted(h for h in doc._.skill_hits or () if accepts(layout.text, *h))
+        yield doc_id, extractor.mentions_from_hits(layout, hits)
@@ -0,0 +1,330 @@
+"""
+Versioned skill taxonomy compiled into the skill matcher.
+
+A taxonomy is the built-in skills and aliases plus either the `skills`
+and `skill_aliases` tables or a data file (see
+app/services/skill_taxonomy.py for loading). It is compiled once into a
+`SkillExtractor` and published through
+`taxonomy_registry`; publishing is a single reference swap, so
+concurrent requests see either the old or the new matcher and nothing
+is rebuilt per request. `canonicalize_skill` reads the same compiled
+alias table, so every place that normalizes a skill name agrees with the
+extractor.
+
+Process-pool workers cannot see the parent's registry. Every compiled
+taxonomy is therefore written to a snapshot file named after its version,
+and workers load (and cache) the snapshot for the version they are asked
+to use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from ...core.config import settings
+from .skills import _DEFAULT_ALIASES, _DEFAULT_SKILLS, _EXTRACTOR_REVISION, SkillExtractor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    name: str
+    category: str | None = None
+
+
+@dataclass(frozen=True)
+class AliasEntry:
+    alias: str
+    canonical: str
+    # False: only canonicalizes extracted names, never matched in text
+    match_in_text: bool = True
+
+
+@dataclass(frozen=True)
+class SkillTaxonomy:
+    version: str
+    source: str
+    entries: tuple[SkillEntry, ...]
+    aliases: tuple[AliasEntry, ...] = ()
+
+
+@dataclass
+class CompiledTaxonomy:
+    taxonomy: SkillTaxonomy
+    extractor: SkillExtractor
+    categories: dict[str, str]
+    aliases: dict[str, str]
+    compile_seconds: float
+    matcher_bytes: int
+    compiled_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def version(self) -> str:
+        return self.taxonomy.version
+
+    def canonicalize(self, skill: str) -> str:
+        name = (skill or "").strip().lower()
+        return self.aliases.get(name, name)
+
+    def category_of(self, skill: str) -> str | None:
+        return self.categories.get(self.canonicalize(skill))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "source": self.taxonomy.source,
+            "skills": len(self.extractor.matcher.patterns),
+            "categories": len(set(self.categories.values())),
+            "aliases": len(self.aliases),
+            "matcher_states": self.extractor.matcher.state_count,
+            "matcher_bytes": self.matcher_bytes,
+            "fuzzy_terms": len(self.extractor.fuzzy) if self.extractor.fuzzy is not None else None,
+            "compile_ms": round(self.compile_seconds * 1000.0, 1),
+            "compiled_at": self.compiled_at.isoformat(),
+        }
+
+
+def taxonomy_version(*parts: object) -> str:
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _fuzzy_min_confidence() -> float | None:
+    return settings.skill_fuzzy_min_confidence if settings.skill_fuzzy_matching else None
+
+
+def builtin_taxonomy() -> SkillTaxonomy:
+    aliases = tuple(
+        AliasEntry(alias, canonical, match)
+        for alias, (canonical, match) in _DEFAULT_ALIASES.items()
+    )
+    # Fuzzy matching changes what is extracted, so it is part of the version.
+    fuzzy = _fuzzy_min_confidence()
+    return SkillTaxonomy(
+        version=taxonomy_version(
+            "builtin",
+            _EXTRACTOR_REVISION,
+            *([f"fuzzy={fuzzy}"] if fuzzy is not None else []),
+            *_DEFAULT_SKILLS,
+            *aliases,
+        ),
+        source="builtin",
+        entries=tuple(SkillEntry(name) for name in _DEFAULT_SKILLS),
+        aliases=aliases,
+    )
+
+
+def merge_entries(*groups: Iterable[SkillEntry]) -> tuple[SkillEntry, ...]:
+    """
+    Union of entries by normalized name; the first non-empty category wins.
+    """
+    merged: dict[str, SkillEntry] = {}
+    for group in groups:
+        for entry in group:
+            key = entry.name.strip().lower()
+            if not key:
+                continue
+            current = merged.get(key)
+            if current is None or (current.category is None and entry.category):
+                merged[key] = SkillEntry(current.name if current else entry.name, entry.category)
+    return tuple(merged.values())
+
+
+def merge_aliases(*groups: Iterable[AliasEntry]) -> tuple[AliasEntry, ...]:
+    """
+    Union of aliases by normalized spelling; later groups override earlier ones.
+    """
+    merged: dict[str, AliasEntry] = {}
+    for group in groups:
+        for entry in group:
+            key = entry.alias.strip().lower()
+            canonical = entry.canonical.strip().lower()
+            if key and canonical and key != canonical:
+                merged[key] = AliasEntry(key, canonical, entry.match_in_text)
+    return tuple(merged.values())
+
+
+def read_taxonomy_file(
+    path: str | os.PathLike[str],
+) -> tuple[str, list[SkillEntry], list[AliasEntry]]:
+    """
+    Read a taxonomy data file and return (file_version, entries, aliases).
+
+    Accepted JSON shapes: a list of names, a list of {"name", "category"}
+    objects, or {"version": ..., "skills": [...], "aliases": {...}} with
+    either list. Aliases map a spelling to a canonical name, or to
+    {"canonical", "match_in_text"}. Files without an explicit version are
+    versioned by content hash.
+    """
+    raw = Path(path).read_bytes()
+    data = json.loads(raw)
+    version = None
+    raw_aliases: dict[str, Any] = {}
+    if isinstance(data, dict):
+        version = data.get("version")
+        raw_aliases = data.get("aliases", {}) or {}
+        data = data.get("skills", [])
+    entries = [
+        SkillEntry(item) if isinstance(item, str) else SkillEntry(item["name"], item.get("category"))
+        for item in data
+    ]
+    aliases = [
+        AliasEntry(alias, target)
+        if isinstance(target, str)
+        else AliasEntry(alias, target["canonical"], bool(target.get("match_in_text", True)))
+        for alias, target in raw_aliases.items()
+    ]
+    return str(version) if version else hashlib.sha256(raw).hexdigest()[:16], entries, aliases
+
+
+def compile_taxonomy(taxonomy: SkillTaxonomy) -> CompiledTaxonomy:
+    started = time.perf_counter()
+    aliases = {a.alias: a.canonical for a in taxonomy.aliases}
+    patterns = [e.name for e in taxonomy.entries]
+    patterns.extend(a.alias for a in taxonomy.aliases if a.match_in_text)
+    extractor = SkillExtractor(patterns, aliases, _fuzzy_min_confidence())
+    compile_seconds = time.perf_counter() - started
+    categories: dict[str, str] = {}
+    for e in taxonomy.entries:
+        if e.category:
+            name = e.name.strip().lower()
+            categories[aliases.get(name, name)] = e.category
+    return CompiledTaxonomy(
+        taxonomy=taxonomy,
+        extractor=extractor,
+        categories=categories,
+        aliases=aliases,
+        compile_seconds=compile_seconds,
+        matcher_bytes=extractor.matcher.memory_bytes()
+        + (extractor.fuzzy.memory_bytes() if extractor.fuzzy is not None else 0),
+    )
+
+
+def _snapshot_path(version: str) -> Path:
+    return Path(settings.skill_taxonomy_snapshot_dir) / f"{version}.json"
+
+
+def write_snapshot(taxonomy: SkillTaxonomy) -> Path:
+    path = _snapshot_path(taxonomy.version)
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": taxonomy.version,
+        "source": taxonomy.source,
+        "skills": [{"name": e.name, "category": e.category} for e in taxonomy.entries],
+        "aliases": {
+            a.alias: {"canonical": a.canonical, "match_in_text": a.match_in_text}
+            for a in taxonomy.aliases
+        },
+    }
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload))
+    os.replace(tmp, path)
+    return path
+
+
+def read_snapshot(version: str) -> SkillTaxonomy:
+    payload = json.loads(_snapshot_path(version).read_text())
+    return SkillTaxonomy(
+        version=payload["version"],
+        source=payload.get("source", "snapshot"),
+        entries=tuple(SkillEntry(s["name"], s.get("category")) for s in payload["skills"]),
+        aliases=tuple(
+            AliasEntry(alias, target["canonical"], target["match_in_text"])
+            for alias, target in payload.get("aliases", {}).items()
+        ),
+    )
+
+
+class TaxonomyRegistry:
+    """
+    Holds the compiled taxonomy currently in use by this process.
+    """
+
+    # Compiled non-current versions kept for `for_version`.
+    max_cached_versions = 2
+
+    def __init__(self) -> None:
+        self._current: CompiledTaxonomy | None = None
+        self._versions: OrderedDict[str, CompiledTaxonomy] = OrderedDict()
+        self._lock = threading.Lock()
+        self.reloads = 0
+        self.last_checked_at: datetime | None = None
+
+    @property
+    def current(self) -> CompiledTaxonomy:
+        compiled = self._current
+        if compiled is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = compile_taxonomy(builtin_taxonomy())
+                compiled = self._current
+        return compiled
+
+    def publish(self, compiled: CompiledTaxonomy) -> None:
+        previous = self._current
+        self._current = compiled
+        self.reloads += 1
+        logger.info(
+            "Skill taxonomy %s -> %s skills=%s compile_ms=%.1f matcher_bytes=%s",
+            previous.version if previous else None,
+            compiled.version,
+            len(compiled.extractor.matcher.patterns),
+            compiled.compile_seconds * 1000.0,
+            compiled.matcher_bytes,
+        )
+
+    def for_version(self, version: str | None) -> CompiledTaxonomy:
+        """
+        Compiled taxonomy for `version`, loading its snapshot if this process
+        has not seen it yet (used by process-pool workers). Other versions
+        than the current one go to a small cache of their own; only
+        `publish` changes the current taxonomy. Raises LookupError when the
+        snapshot cannot be read, since matching with another version would
+        store skills under the wrong stamp.
+        """
+        compiled = self.current
+        if version is None or version == compiled.version:
+            return compiled
+        with self._lock:
+            cached = self._versions.get(version)
+            if cached is not None:
+                self._versions.move_to_end(version)
+                return cached
+            try:
+                taxonomy = read_snapshot(version)
+            except (OSError, ValueError, KeyError) as exc:
+                raise LookupError(f"Skill taxonomy snapshot {version} unavailable") from exc
+            cached = self._versions[version] = compile_taxonomy(taxonomy)
+            while len(self._versions) > self.max_cached_versions:
+                self._versions.popitem(last=False)
+            return cached
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.current.stats(),
+            "reloads": self.reloads,
+            "last_checked_at": self.last_checked_at.isoformat() if self.last_checked_at else None,
+        }
+
+
+taxonomy_registry = TaxonomyRegistry()
+
+
+def canonicalize_skill(name: str) -> str:
+    """
+    Normalized, alias-resolved skill name under the active taxonomy.
+    """
+    return taxonomy_registry.current.canonicalize(name)
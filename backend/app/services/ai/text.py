@@ -0,0 +1,235 @@
+"""
+One analysed view of a text, shared by every stage that reads it.
+
+Skill extraction, keyword extraction, years-of-experience detection and
+soft-skill detection all used to lowercase and regex-scan the raw string
+on their own. A `TextDocument` lowercases and normalizes a text once and
+caches everything derived from it (token list and set, sentence spans,
+section layouts, detected years), so each stage reads cached views
+instead of re-scanning the raw string.
+
+Resumes and job descriptions also store the normalized text and a content
+hash when they are written; passing those in skips the work entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sections import SectionedText
+
+_DISALLOWED = re.compile(r"[^a-z0-9\s\+\#\.]")
+_WHITESPACE = re.compile(r"\s+")
+_SENTENCE_END = re.compile(r"[.!?]+(?=\s)|\n\s*\n|\n(?=\s*[-*•])")
+
+_WORD_NUMBERS: dict[str, int] = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+}
+# Digits take precedence over number words anywhere in the text, so both
+# alternatives are collected in one scan and the first digit match wins.
+_YEARS = re.compile(
+    r"(?P<digits>\d+(?:\.\d+)?)\s*\+?\s*years?"
+    r"|\b(?P<word>" + "|".join(_WORD_NUMBERS) + r")\b\s+years?"
+)
+
+_BULLETS = frozenset("•-*")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase, keep letters, digits, '+', '#' and '.', collapse whitespace.
+    """
+    return " ".join(_DISALLOWED.sub(" ", (text or "").lower()).split())
+
+
+def content_hash(text: str) -> str:
+    """
+    sha256 of the text with whitespace runs collapsed; the same hash keys
+    stored embeddings.
+    """
+    collapsed = _WHITESPACE.sub(" ", text or "").strip()
+    return hashlib.sha256(collapsed.encode("utf-8")).hexdigest()
+
+
+class TextDocument:
+    """
+    Lazily computed, cached views of one text. Build it once per text and
+    pass it to every stage.
+    """
+
+    __slots__ = (
+        "raw",
+        "_lower",
+        "_normalized",
+        "_tokens",
+        "_token_set",
+        "_words",
+        "_sentences",
+        "_layouts",
+        "_years",
+        "_has_bullets",
+        "_content_hash",
+    )
+
+    def __init__(
+        self,
+        raw: str | None,
+        *,
+        normalized: str | None = None,
+        content_hash: str | None = None,
+    ) -> None:
+        self.raw = raw or ""
+        self._lower: str | None = None
+        self._normalized: str | None = normalized
+        self._tokens: list[str] | None = None
+        self._token_set: frozenset[str] | None = None
+        self._words: list[str] | None = None
+        self._sentences: list[tuple[int, int]] | None = None
+        self._layouts: dict[tuple[str, str | None], SectionedText] = {}
+        self._years: tuple[float | None] | None = None
+        self._has_bullets: bool | None = None
+        self._content_hash: str | None = content_hash
+
+    @classmethod
+    def of(cls, text: str | TextDocument | None) -> TextDocument:
+        return text if isinstance(text, TextDocument) else cls(text)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.raw.lower()
+        return self._lower
+
+    @property
+    def normalized(self) -> str:
+        """
+        The text as the skill matcher sees it (see `normalize_text`).
+        """
+        if self._normalized is None:
+            self._normalized = " ".join(_DISALLOWED.sub(" ", self.lower).split())
+        return self._normalized
+
+    @property
+    def content_hash(self) -> str:
+        if self._content_hash is None:
+            self._content_hash = content_hash(self.raw)
+        return self._content_hash
+
+    @property
+    def tokens(self) -> list[str]:
+        """
+        Tokens of the normalized text.
+        """
+        if self._tokens is None:
+            self._tokens = self.normalized.split(" ") if self.normalized else []
+        return self._tokens
+
+    @property
+    def token_set(self) -> frozenset[str]:
+        if self._token_set is None:
+            self._token_set = frozenset(self.tokens)
+        return self._token_set
+
+    @property
+    def words(self) -> list[str]:
+        """
+        Whitespace-separated words of the raw text (punctuation kept).
+        """
+        if self._words is None:
+            self._words = self.raw.split()
+        return self._words
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def sentences(self) -> list[tuple[int, int]]:
+        """
+        (start, end) spans of sentences and bullet items in `lower`.
+        """
+        if self._sentences is None:
+            spans: list[tuple[int, int]] = []
+            start = 0
+            for m in _SENTENCE_END.finditer(self.lower):
+                if self.lower[start : m.start()].strip():
+                    spans.append((start, m.end()))
+                start = m.end()
+            if self.lower[start:].strip():
+                spans.append((start, len(self.lower)))
+            self._sentences = spans
+        return self._sentences
+
+    def sentence_texts(self) -> list[str]:
+        lower = self.lower
+        return [lower[s:e].strip() for s, e in self.sentences]
+
+    def layout(self, kind: str = "resume", stored_sections: str | None = None) -> SectionedText:
+        """
+        Section layout over `normalized`, from stored spans when usable.
+        """
+        key = (kind, stored_sections)
+        layout = self._layouts.get(key)
+        if layout is None:
+            from .sections import load_sections, split_sections
+
+            if stored_sections:
+                layout = load_sections(self.normalized, stored_sections)
+            if layout is None:
+                layout = split_sections(self.raw, kind)
+            self._layouts[key] = layout
+        return layout
+
+    @property
+    def years(self) -> float | None:
+        """
+        Years of experience mentioned in the text ("5+ years", "three
+        years"); the first figure in digits wins over number words.
+        """
+        if self._years is None:
+            found: float | None = None
+            for m in _YEARS.finditer(self.lower):
+                digits = m.group("digits")
+                if digits is not None:
+                    try:
+                        found = float(digits)
+                    except ValueError:
+                        found = None
+                    break
+                if found is None:
+                    found = float(_WORD_NUMBERS[m.group("word")])
+            self._years = (found,)
+        return self._years[0]
+
+    @property
+    def has_bullets(self) -> bool:
+        if self._has_bullets is None:
+            self._has_bullets = not _BULLETS.isdisjoint(self.raw)
+        return self._has_bullets
+
+    def contains(self, phrase: str) -> bool:
+        """
+        Whether normalized `phrase` occurs in the normalized text. Single
+        words are a token-set lookup; phrases a search of `normalized`.
+        """
+        needle = normalize_text(phrase)
+        if not needle:
+            return False
+        if " " not in needle and needle in self.token_set:
+            return True
+        return needle in self.normalized
@@ -0,0 +1,451 @@
+"""
+Append-only, memory-mapped embedding segments.
+
+Stored vectors are also kept in Postgres (`document_embeddings`), but
+loading thousands of them from there means one bytes object and one
+decode per row. Here each shard (one user's job vectors under one model
+version) is a directory of segments that every worker on the host maps
+with `np.memmap`, so a scan reads the page cache directly:
+
+    <root>/<model>/<version>/<shard>/
+        manifest.json   dim, dtype, live segment numbers (replaced atomically)
+        000001.vec      row-major float16/float32 matrix, no header
+        000001.ids      one (uuid, stamp) record per row: the id index
+        000001.del      uint32 row numbers of deleted / superseded rows
+        lock            flock()ed by writers
+
+Writers append the vector first and its id record second, so the `.ids`
+length is the commit point: a reader never sees a row whose vector is
+not fully written, and a torn append is truncated by the next writer.
+Replacing a vector appends a new row and tombstones the old one; the
+latest row of an id wins even before its tombstone lands. `compact`
+rewrites a shard's live rows into one fresh segment, swaps the manifest
+and unlinks the old files (workers still mapping them keep a valid view
+until their next refresh).
+
+Each row carries a stamp, the embedding's `created_at` in microseconds,
+so callers can tell whether a stored row matches the database row.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Literal
+from uuid import UUID
+
+import numpy as np
+
+from ...core.config import settings
+from ...utils.storage import BASE_DIR
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts get no cross-process lock
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+StoreDtype = Literal["f16", "f32"]
+
+_DTYPES = {"f16": np.float16, "f32": np.float32}
+_ROW = np.dtype([("id", "V16"), ("stamp", "<i8")])
+_TOMBSTONE = np.dtype("<u4")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Rows scored per matrix-vector product when scanning (bounds the float32 upcast).
+_SCAN_BLOCK = 16384
+
+
+def to_stamp(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _map(path: Path, dtype: np.dtype, rows: int, dim: int | None = None) -> np.ndarray:
+    shape = (rows,) if dim is None else (rows, dim)
+    if rows == 0:
+        return np.zeros(shape, dtype=dtype)
+    # A plain ndarray view of the mapping: same pages, cheaper indexing.
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape).view(np.ndarray)
+
+
+class _Segment:
+    """
+    Read view of one segment: mapped vectors and id records, dead mask.
+    """
+
+    __slots__ = ("number", "vectors", "records", "stamps", "dead", "tombstones_read")
+
+    def __init__(self, number: int, dim: int, dtype: np.dtype) -> None:
+        self.number = number
+        self.vectors = np.zeros((0, dim), dtype=dtype)
+        self.records = np.zeros(0, dtype=_ROW)
+        self.stamps: list[int] = []
+        self.dead = np.zeros(0, dtype=bool)
+        self.tombstones_read = 0
+
+    def __len__(self) -> int:
+        return self.records.shape[0]
+
+
+class ShardStore:
+    """
+    One shard's segments, as seen by this process.
+
+    Reads refresh the view from file sizes (no lock, no copy); writes take
+    the shard's file lock. Rows are read with the dtype recorded in the
+    manifest; `dtype` is what new shards are written with, and a shard
+    stored with another dtype is rewritten on its next write.
+    """
+
+    def __init__(self, path: Path, *, dtype: StoreDtype, segment_rows: int) -> None:
+        self.path = path
+        self.dtype = dtype
+        self.segment_rows = segment_rows
+        self.dim: int | None = None
+        self._np_dtype = np.dtype(_DTYPES[dtype])
+        self._segments: list[_Segment] = []
+        self._generation: int | None = None
+        # id bytes -> (segment index, row) of its live row; raw bytes hash
+        # and compare far faster than UUID objects.
+        self._live: dict[bytes, tuple[int, int]] = {}
+        self._lock = threading.RLock()
+
+    def _file(self, number: int, suffix: str) -> Path:
+        return self.path / f"{number:06d}.{suffix}"
+
+    def _size(self, number: int, suffix: str) -> int:
+        try:
+            return self._file(number, suffix).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _read_manifest(self) -> dict | None:
+        try:
+            return json.loads((self.path / "manifest.json").read_text())
+        except FileNotFoundError:
+            return None
+
+    def _write_manifest(self, manifest: dict) -> None:
+        manifest["generation"] = manifest.get("generation", 0) + 1
+        tmp = self.path / f"manifest.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, self.path / "manifest.json")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path / "lock", "a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def refresh(self) -> None:
+        """
+        Pick up rows, tombstones and compactions written by any process.
+        """
+        with self._lock:
+            try:
+                self._refresh()
+            except FileNotFoundError:
+                # A compaction unlinked a segment between manifest and map.
+                self._generation = None
+                self._refresh()
+
+    def _refresh(self) -> None:
+        manifest = self._read_manifest()
+        if manifest is None:
+            self._segments, self._live, self._generation = [], {}, None
+            return
+        if manifest["generation"] != self._generation:
+            self.dim = manifest["dim"]
+            self._np_dtype = np.dtype(_DTYPES[manifest["dtype"]])
+            self._segments = [
+                _Segment(number, self.dim, self._np_dtype) for number in manifest["segments"]
+            ]
+            self._live = {}
+            self._generation = manifest["generation"]
+
+        assert self.dim is not None
+        row_bytes = self.dim * self._np_dtype.itemsize
+        for index, segment in enumerate(self._segments):
+            rows = self._size(segment.number, "ids") // _ROW.itemsize
+            start = len(segment)
+            if rows > start:
+                # Vectors are written before their id records, so they exist.
+                rows = min(rows, self._size(segment.number, "vec") // row_bytes)
+                segment.records = _map(self._file(segment.number, "ids"), _ROW, rows)
+                segment.vectors = _map(self._file(segment.number, "vec"), self._np_dtype, rows, self.dim)
+                segment.stamps.extend(segment.records["stamp"][start:rows].tolist())
+                segment.dead = np.concatenate([segment.dead, np.zeros(rows - start, dtype=bool)])
+                live = self._live
+                for row, key in enumerate(segment.records["id"][start:rows].tolist(), start):
+                    previous = live.get(key)
+                    if previous is not None:
+                        self._segments[previous[0]].dead[previous[1]] = True
+                    live[key] = (index, row)
+            self._read_tombstones(index, segment)
+
+    def _read_tombstones(self, index: int, segment: _Segment) -> None:
+        path = self._file(segment.number, "del")
+        size = self._size(segment.number, "del") // _TOMBSTONE.itemsize
+        if size <= segment.tombstones_read:
+            return
+        with open(path, "rb") as handle:
+            handle.seek(segment.tombstones_read * _TOMBSTONE.itemsize)
+            rows = np.frombuffer(
+                handle.read((size - segment.tombstones_read) * _TOMBSTONE.itemsize),
+                dtype=_TOMBSTONE,
+            )
+        # A tombstone can land after this process read the `.ids` length;
+        # stop before the first one past the mapped rows and re-read it
+        # once the next refresh has mapped its row.
+        unmapped = np.flatnonzero(rows >= len(segment))
+        if unmapped.size:
+            rows = rows[: unmapped[0]]
+        segment.dead[rows] = True
+        segment.tombstones_read += len(rows)
+        for row in rows:
+            key = segment.records[row]["id"].tobytes()
+            if self._live.get(key) == (index, int(row)):
+                del self._live[key]
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def get(self, ids: Iterable[UUID]) -> dict[UUID, tuple[np.ndarray, int]]:
+        """
+        Live (vector view, stamp) of the requested ids that are stored.
+        """
+        self.refresh()
+        found: dict[UUID, tuple[np.ndarray, int]] = {}
+        with self._lock:
+            for job_id in ids:
+                position = self._live.get(job_id.bytes)
+                if position is not None:
+                    segment_index, row = position
+                    segment = self._segments[segment_index]
+                    found[job_id] = (segment.vectors[row], segment.stamps[row])
+        return found
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[UUID, float]]:
+        """
+        Exact top-k (id, dot product) over the live rows, scanning the
+        mapped segments block by block.
+        """
+        self.refresh()
+        query = np.asarray(query, dtype=np.float32)
+        best: list[tuple[UUID, float]] = []
+        with self._lock:
+            for segment in self._segments:
+                for start in range(0, len(segment), _SCAN_BLOCK):
+                    block = slice(start, start + _SCAN_BLOCK)
+                    scores = segment.vectors[block].astype(np.float32) @ query
+                    scores[segment.dead[block]] = -np.inf
+                    top = np.argsort(-scores, kind="stable")[:k]
+                    best.extend(
+                        (UUID(bytes=segment.records[start + i]["id"].tobytes()), float(scores[i]))
+                        for i in top
+                        if np.isfinite(scores[i])
+                    )
+                    best = sorted(best, key=lambda item: -item[1])[:k]
+        return best
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            rows = sum(len(segment) for segment in self._segments)
+            return {
+                "segments": len(self._segments),
+                "rows": rows,
+                "live_rows": len(self._live),
+            }
+
+    def upsert(self, entries: Sequence[tuple[UUID, np.ndarray, datetime]]) -> None:
+        """
+        Append (id, vector, stamp) rows, tombstoning rows they replace.
+        """
+        if not entries:
+            return
+        with self._locked():
+            manifest = self._read_manifest()
+            if manifest is None:
+                dim = int(np.asarray(entries[0][1]).shape[0])
+                manifest = {"dim": dim, "dtype": self.dtype, "segments": [1], "next_segment": 2}
+                self._write_manifest(manifest)
+            elif manifest["dtype"] != self.dtype:
+                self._rewrite(manifest)
+            self.refresh()
+            assert self.dim is not None
+            vectors = np.stack([np.asarray(v, dtype=np.float32) for _, v, _ in entries])
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Vector dimension {vectors.shape[1]} != shard dimension {self.dim}")
+
+            segment = self._segments[-1]
+            if len(segment) >= self.segment_rows:
+                manifest["segments"].append(manifest["next_segment"])
+                manifest["next_segment"] += 1
+                self._write_manifest(manifest)
+                self.refresh()
+                segment = self._segments[-1]
+
+            replaced = [
+                self._live[job_id.bytes] for job_id, _, _ in entries if job_id.bytes in self._live
+            ]
+            records = np.zeros(len(entries), dtype=_ROW)
+            records["id"] = [job_id.bytes for job_id, _, _ in entries]
+            records["stamp"] = [to_stamp(stamp) for _, _, stamp in entries]
+            row_bytes = self.dim * self._np_dtype.itemsize
+            with open(self._file(segment.number, "vec"), "ab") as handle:
+                # Drop a torn tail left by a writer that died mid-append.
+                handle.truncate(len(segment) * row_bytes)
+                handle.write(vectors.astype(self._np_dtype).tobytes())
+            with open(self._file(segment.number, "ids"), "ab") as handle:
+                handle.truncate(len(segment) * _ROW.itemsize)
+                handle.write(records.tobytes())
+            self._tombstone(replaced)
+            self.refresh()
+
+    def delete(self, ids: Iterable[UUID]) -> int:
+        """
+        Tombstone the live rows of `ids`; returns how many were stored.
+        """
+        with self._locked():
+            self.refresh()
+            positions = [self._live[job_id.bytes] for job_id in ids if job_id.bytes in self._live]
+            self._tombstone(positions)
+            self.refresh()
+        return len(positions)
+
+    def _tombstone(self, positions: Sequence[tuple[int, int]]) -> None:
+        by_segment: dict[int, list[int]] = {}
+        for index, row in positions:
+            by_segment.setdefault(index, []).append(row)
+        for index, rows in by_segment.items():
+            number = self._segments[index].number
+            with open(self._file(number, "del"), "ab") as handle:
+                handle.write(np.array(rows, dtype=_TOMBSTONE).tobytes())
+
+    def compact(self) -> int:
+        """
+        Rewrite the live rows into one new segment and drop the old ones,
+        converting them to `dtype` if the shard was stored with another.
+        Returns the number of rows removed.
+        """
+        with self._locked():
+            manifest = self._read_manifest()
+            if manifest is None:
+                return 0
+            self.refresh()
+            total = sum(len(segment) for segment in self._segments)
+            dropped = total - len(self._live)
+            if not dropped and manifest["dtype"] == self.dtype:
+                return 0
+            self._rewrite(manifest)
+        logger.info("Compacted %s: dropped %s of %s rows", self.path, dropped, total)
+        return dropped
+
+    def _rewrite(self, manifest: dict) -> None:
+        """
+        Write the live rows, as `dtype`, to one new segment and swap the
+        manifest to it. Caller holds the shard lock.
+        """
+        self.refresh()
+        old = list(self._segments)
+        target = np.dtype(_DTYPES[self.dtype])
+        number = manifest["next_segment"]
+        with open(self._file(number, "vec"), "wb") as vec_file, open(
+            self._file(number, "ids"), "wb"
+        ) as ids_file:
+            for segment in old:
+                keep = ~segment.dead
+                vec_file.write(np.ascontiguousarray(segment.vectors[keep], dtype=target).tobytes())
+                ids_file.write(segment.records[keep].tobytes())
+        manifest["dtype"] = self.dtype
+        manifest["segments"] = [number]
+        manifest["next_segment"] = number + 1
+        self._write_manifest(manifest)
+        for segment in old:
+            for suffix in ("vec", "ids", "del"):
+                self._file(segment.number, suffix).unlink(missing_ok=True)
+        self.refresh()
+
+
+class VectorStore:
+    """
+    Shards under one root directory, opened on first use.
+    """
+
+    def __init__(self, root: Path, *, dtype: StoreDtype = "f16", segment_rows: int = 65536) -> None:
+        self.root = root
+        self.dtype = dtype
+        self.segment_rows = segment_rows
+        self._shards: dict[Path, ShardStore] = {}
+        self._lock = threading.Lock()
+
+    def shard_path(self, model_name: str, model_version: str, shard: str) -> Path:
+        return self.root / model_name.replace("/", "__") / model_version / shard
+
+    def shard(self, model_name: str, model_version: str, shard: str) -> ShardStore:
+        return self.open_path(self.shard_path(model_name, model_version, shard))
+
+    def shard_paths(self) -> list[Path]:
+        """
+        Every shard directory on disk, including ones this process never opened.
+        """
+        return sorted(path.parent for path in self.root.glob("*/*/*/manifest.json"))
+
+    def open_path(self, path: Path) -> ShardStore:
+        with self._lock:
+            store = self._shards.get(path)
+            if store is None:
+                store = ShardStore(path, dtype=self.dtype, segment_rows=self.segment_rows)
+                self._shards[path] = store
+            return store
+
+    def delete_everywhere(self, shard: str, ids: Sequence[UUID]) -> int:
+        """
+        Tombstone `ids` in the shard named `shard` under every model version.
+        """
+        return sum(
+            self.open_path(manifest.parent).delete(ids)
+            for manifest in self.root.glob(f"*/*/{shard}/manifest.json")
+        )
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            shards = list(self._shards.values())
+        per_shard = [shard.stats() for shard in shards]
+        return {
+            "root": str(self.root),
+            "dtype": self.dtype,
+            "open_shards": len(shards),
+            "rows": sum(s["rows"] for s in per_shard),
+            "live_rows": sum(s["live_rows"] for s in per_shard),
+        }
+
+
+def job_shard(user_id: int) -> str:
+    return f"jobs-{user_id}"
+
+
+def _default_store() -> VectorStore | None:
+    if not settings.vector_store_dir:
+        return None
+    return VectorStore(
+        BASE_DIR / settings.vector_store_dir,
+        dtype=settings.vector_store_dtype,
+        segment_rows=settings.vector_store_segment_rows,
+    )
+
+
+vector_store = _default_store()
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-import re
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+import logging
 from typing import Any
 from uuid import UUID
 import uuid
 
-import numpy as np
 from fastapi import HTTPException, status
+import numpy as np
 from sqlalchemy import and_, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
@@ -17,60 +18,37 @@ from ..models.activity_log import ActivityLog
 from ..models.analysis import AnalysisResult
 from ..models.job import JobDescription
 from ..models.resume import Resume
-from ..models.skill import JobSkill, ResumeSkill, Skill
 from ..models.user import User
 from ..schemas.analysis import (
+    AnalysisBatchItem,
+    AnalysisBatchResponse,
     AnalysisDashboardResponse,
     AnalysisResultRead,
 )
-from .ai.embeddings import get_default_embedding_backend
 from .ai.scoring import (
-    compute_ats_score,
+    ScoreBreakdown,
+    ScoringFeatures,
     compute_missing_skills,
     compute_similarity_score,
+    compute_similarity_scores,
+    score_batch,
+    score_pair,
 )
-from .ai.skills import get_skill_extractor
+from .ai.skill_profiles import profile_from_bytes, skill_vocabulary
+from .ai.taxonomy import canonicalize_skill
+from .ai.text import TextDocument
+from .document_embeddings import get_batch_embeddings, get_pair_embeddings
+from .document_skills import get_document_skills
 
+logger = logging.getLogger(__name__)
 
-def _normalize_skill(name: str) -> str:
-    return (name or "").strip().lower()
-
-
-_WORD_NUMBERS: dict[str, int] = {
-    "one": 1,
-    "two": 2,
-    "three": 3,
-    "four": 4,
-    "five": 5,
-    "six": 6,
-    "seven": 7,
-    "eight": 8,
-    "nine": 9,
-    "ten": 10,
-}
-
-
-def _extract_years(text: str) -> float | None:
-    t = (text or "").lower()
-    m = re.search(r"(\d+(?:\.\d+)?)\s*\+?\s*years?", t)
-    if m:
-        try:
-            return float(m.group(1))
-        except Exception:
-            return None
 
-    m2 = re.search(r"\b(" + "|".join(_WORD_NUMBERS.keys()) + r")\b\s+years?", t)
-    if m2:
-        return float(_WORD_NUMBERS[m2.group(1)])
+def _normalize_skill(name: str) -> str:
+    return canonicalize_skill(name)
 
-    m3 = re.search(r"over\s+(\d+)\s+years?", t)
-    if m3:
-        try:
-            return float(m3.group(1))
-        except Exception:
-            return None
 
-    return None
+def _extract_years(text: str | TextDocument) -> float | None:
+    return TextDocument.of(text).years
 
 
 async def _get_resume_for_user(
@@ -126,86 +104,142 @@ async def _find_existing_analysis(
     return result.scalar_one_or_none()
 
 
-async def _upsert_skills_for_texts(
-    db: AsyncSession,
+def _score_features(
     *,
-    resume: Resume,
-    resume_text: str,
-    job: JobDescription,
-    job_text: str,
-) -> tuple[list[str], list[str]]:
+    resume_text: str | TextDocument,
+    job_text: str | TextDocument,
+    resume_skill_names: Sequence[str],
+    job_skill_names: Sequence[str],
+    similarity_score: float,
+    job_skill_importance: Mapping[str, float] | None = None,
+    resume_profile: bytes | None = None,
+    job_profile: bytes | None = None,
+) -> ScoringFeatures:
     """
-    Extract skills for resume and job text, ensure Skill records exist,
-    and create join rows in resume_skills and job_skills.
-    Returns (resume_skill_names, job_skill_names).
+    Canonical skill sets and text signals the scoring kernel reads. Texts
+    may be shared `TextDocument`s (one resume scored against many jobs is
+    analysed once). Stored skill profiles, when both are given and every
+    ordinal in them is known, let the kernel compare skills as bitsets.
     """
-    extractor = get_skill_extractor()
-
-    resume_skills_names = extractor.extract_skills(resume_text)
-    job_skills_names = extractor.extract_skills(job_text)
-
-    # Normalize skill names
-    def normalize(names: Sequence[str]) -> list[str]:
-        return sorted({_normalize_skill(n) for n in names if _normalize_skill(n)})
+    resume_doc = TextDocument.of(resume_text)
+    job_doc = TextDocument.of(job_text)
+
+    importance: dict[str, float] = {}
+    for name, weight in (job_skill_importance or {}).items():
+        key = canonicalize_skill(name)
+        importance[key] = max(importance.get(key, 0.0), float(weight))
+
+    resume_bits = job_bits = 0
+    skill_names = None
+    if resume_profile is not None and job_profile is not None:
+        resume_bits = profile_from_bytes(resume_profile)
+        job_bits = profile_from_bytes(job_profile)
+        if skill_vocabulary.knows(resume_bits | job_bits):
+            skill_names = skill_vocabulary.names
 
-    resume_norm = normalize(resume_skills_names)
-    job_norm = normalize(job_skills_names)
+    fullstack_keywords = {"react", "react.js", "node.js", "node", "frontend"}
+    return ScoringFeatures(
+        resume_skills=frozenset(canonicalize_skill(s) for s in resume_skill_names),
+        job_skills=frozenset(canonicalize_skill(s) for s in job_skill_names),
+        similarity=float(similarity_score),
+        job_importance=importance,
+        required_years=_extract_years(job_doc),
+        resume_years=_extract_years(resume_doc),
+        resume_length=len(resume_doc),
+        has_bullets=resume_doc.has_bullets,
+        # None of the keywords contains characters normalization drops, so the
+        # stored normalized text answers this without lowercasing the raw text.
+        fullstack_role=any(k in job_doc.normalized for k in fullstack_keywords),
+        resume_profile=resume_bits,
+        job_profile=job_bits,
+        skill_names=skill_names,
+    )
 
-    # Early exit if nothing detected
-    if not resume_norm and not job_norm:
-        return [], []
 
-    # Upsert Skill records in a concurrency-safe way.
-    all_names = sorted(set(resume_norm) | set(job_norm))
-    if all_names:
-        stmt = (
-            insert(Skill)
-            .values([{"name": name} for name in all_names])
-            .on_conflict_do_nothing(index_elements=[Skill.name])
-        )
-        await db.execute(stmt)
+def _score_details(
+    features: ScoringFeatures,
+    score: ScoreBreakdown,
+    *,
+    resume_text: str,
+    resume_skill_count: int,
+    job_skill_count: int,
+) -> dict[str, Any]:
+    """
+    Structured details JSON for analytics.
+    """
+    return {
+        "resume_skill_count": resume_skill_count,
+        "job_skill_count": job_skill_count,
+        "resume_skills": sorted(features.resume_skills),
+        "job_skills": sorted(features.job_skills),
+        "resume_text": resume_text,
+        "matched_skills": score.matched_skills,
+        "missing_skills": score.missing_skills,
+        "extra_skills": score.extra_skills,
+        "critical_missing_skills": score.critical_missing,
+        "weighted_coverage": score.weighted_coverage,
+        "breakdown": {
+            "formatting": score.formatting,
+            "keyword_optimization": score.keyword_optimization,
+            "experience_relevance": score.experience_relevance,
+            "project_relevance": score.project_relevance,
+        },
+        "experience": {
+            "required_years": features.required_years,
+            "resume_years": features.resume_years,
+            "gap": score.experience_gap,
+        },
+    }
 
-    # Re-load to get ids for all names (whether pre-existing or newly inserted).
-    existing_stmt = select(Skill).where(Skill.name.in_(all_names))
-    existing_result = await db.execute(existing_stmt)
-    skill_by_name: dict[str, Skill] = {s.name: s for s in existing_result.scalars().all()}
 
-    # Join table inserts must be idempotent; re-running analysis should not crash.
-    if resume_norm:
-        resume_rows = [
-            {
-                "resume_id": resume.id,
-                "skill_id": skill_by_name[name].id,
-            }
-            for name in resume_norm
-            if name in skill_by_name
-        ]
-        if resume_rows:
-            stmt = (
-                insert(ResumeSkill)
-                .values(resume_rows)
-                .on_conflict_do_nothing(constraint="uq_resume_skill")
-            )
-            await db.execute(stmt)
-
-    if job_norm:
-        job_rows = [
-            {
-                "job_description_id": job.id,
-                "skill_id": skill_by_name[name].id,
-            }
-            for name in job_norm
-            if name in skill_by_name
-        ]
-        if job_rows:
-            stmt = (
-                insert(JobSkill)
-                .values(job_rows)
-                .on_conflict_do_nothing(constraint="uq_job_skill")
-            )
-            await db.execute(stmt)
+def _score_pair(
+    *,
+    resume_text: str | TextDocument,
+    job_text: str | TextDocument,
+    resume_skill_names: Sequence[str],
+    job_skill_names: Sequence[str],
+    similarity_score: float,
+    job_skill_importance: Mapping[str, float] | None = None,
+    resume_profile: bytes | None = None,
+    job_profile: bytes | None = None,
+) -> tuple[float, float, list[str], dict[str, Any]]:
+    """
+    Score one resume / job pair from extracted skills and embedding similarity.
+    `job_skill_importance` holds the importance stored with each job skill at
+    extraction time (see app/services/document_skills.py); missing skills
+    weigh 1.0. The math lives in `score_pair`. Returns (similarity_score,
+    ats_score, missing_skills, details).
+    """
+    features = _score_features(
+        resume_text=resume_text,
+        job_text=job_text,
+        resume_skill_names=resume_skill_names,
+        job_skill_names=job_skill_names,
+        similarity_score=similarity_score,
+        job_skill_importance=job_skill_importance,
+        resume_profile=resume_profile,
+        job_profile=job_profile,
+    )
+    score = score_pair(features)
+    logger.debug(
+        "Scored pair resume_skills=%s job_skills=%s similarity=%.4f "
+        "weighted_coverage=%.4f critical_missing=%s critical_penalty=%.4f",
+        resume_skill_names,
+        job_skill_names,
+        similarity_score,
+        score.weighted_coverage,
+        score.critical_missing,
+        score.critical_penalty,
+    )
 
-    return resume_norm, job_norm
+    details = _score_details(
+        features,
+        score,
+        resume_text=TextDocument.of(resume_text).raw,
+        resume_skill_count=len(resume_skill_names),
+        job_skill_count=len(job_skill_names),
+    )
+    return score.similarity, score.ats_score, score.missing_skills, details
 
 
 async def run_analysis(
@@ -255,10 +289,6 @@ async def run_analysis(
     resume_text = resume.extracted_text or ""
     job_text = job.description_text or ""
 
-    print("Resume ID:", str(resume_id))
-    print("Resume text first 200 chars:", (resume_text or "")[:200])
-    print("JD ID:", str(job_description_id))
-
     if not resume_text.strip():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -270,166 +300,41 @@ async def run_analysis(
             detail="Job description text is empty.",
         )
 
-    # Extract & upsert skills
-    resume_skill_names, job_skill_names = await _upsert_skills_for_texts(
-        db,
-        resume=resume,
-        resume_text=resume_text,
-        job=job,
-        job_text=job_text,
-    )
+    # Skills are extracted at ingest; this reads the stored join rows and only
+    # re-extracts documents stamped with an older taxonomy version.
+    resume_skills, skills_by_job = await get_document_skills(db, resume=resume, jobs=[job])
+    resume_skill_names = list(resume_skills)
+    job_skill_importance = skills_by_job[job.id]
+    job_skill_names = list(job_skill_importance)
 
     # Embeddings & similarity
-    backend = get_default_embedding_backend()
+    # Embeddings are normally precomputed at ingest; this is a lookup plus a dot product.
     try:
-        vectors = backend.embed([resume_text, job_text])
-    except Exception as e:
-        print("Embedding error:", repr(e))
-        vectors = None
+        resume_vec, job_vec = await get_pair_embeddings(db, resume=resume, job=job)
+    except Exception:
+        logger.exception(
+            "Embedding lookup failed resume_id=%s job_description_id=%s",
+            str(resume_id),
+            str(job_description_id),
+        )
+        resume_vec = job_vec = None
 
-    if not vectors:
+    if resume_vec is None or job_vec is None or not resume_vec.size or not job_vec.size:
         similarity_score = 0.0
     else:
-        resume_vec = np.asarray(vectors[0], dtype=float)
-        job_vec = np.asarray(vectors[1], dtype=float)
-        similarity_score = compute_similarity_score(resume_vec, job_vec)
-
-    print("Resume skills (normalized):", resume_skill_names)
-    print("JD skills (normalized):", job_skill_names)
-    print("Similarity score:", float(similarity_score))
-
-    def canonicalize_skill(name: str) -> str:
-        n = _normalize_skill(name)
-        aliases = {
-            "react.js": "react",
-            "reactjs": "react",
-            "nodejs": "node.js",
-            "node": "node.js",
-            "expressjs": "express",
-            "nextjs": "next.js",
-            "next": "next.js",
-            "postgres": "postgresql",
-            "postgre": "postgresql",
-            "js": "javascript",
-            "ts": "typescript",
-        }
-        return aliases.get(n, n)
-
-    resume_set = {canonicalize_skill(s) for s in resume_skill_names}
-    job_set = {canonicalize_skill(s) for s in job_skill_names}
-
-    matched_skills = sorted(resume_set & job_set)
-    missing_skills = sorted(job_set - resume_set)
-    extra_skills = sorted(resume_set - job_set)
-
-    fullstack_keywords = {"react", "react.js", "node.js", "node", "frontend"}
-    fullstack_role = any(k in job_text.lower() for k in fullstack_keywords)
-
-    resume_len = len(resume_text or "")
-    job_len = len(job_text or "")
-    has_bullets = any(ch in ("•", "-", "*") for ch in (resume_text or ""))
-    formatting_score = min(1.0, max(0.0, (0.35 if has_bullets else 0.15) + min(0.65, resume_len / 6000)))
-    coverage = 0.0 if not job_set else (len(matched_skills) / max(1, len(job_set)))
-    keyword_optimization = float(min(1.0, max(0.0, coverage)))
-
-    def _weight_for_skill(skill: str) -> float:
-        s = canonicalize_skill(skill)
-        t = job_text.lower()
-        if not s:
-            return 0.0
-        if re.search(r"\\b(must have|required|mandatory)\\b", t) and s in t:
-            return 2.0
-        if re.search(r"\\b(requirements|qualification|responsibilit)\\w*\\b", t) and s in t:
-            return 1.5
-        return 1.0
-
-    weighted_total = 0.0
-    weighted_matched = 0.0
-    critical_missing: list[str] = []
-    for s in sorted(job_set):
-        w = float(_weight_for_skill(s))
-        if w <= 0:
-            continue
-        weighted_total += w
-        if s in resume_set:
-            weighted_matched += w
-        else:
-            if w >= 2.0:
-                critical_missing.append(s)
-
-    weighted_coverage = 0.0 if weighted_total <= 0 else (weighted_matched / weighted_total)
-    print("Weighted coverage:", float(weighted_coverage))
-
-    required_years = _extract_years(job_text)
-    resume_years = _extract_years(resume_text)
-    gap = None
-    exp_match = 0.0
-    if required_years is not None and resume_years is not None:
-        gap = float(required_years - resume_years)
-        exp_match = 1.0 if gap <= 0 else max(0.0, 1.0 - (gap / max(1.0, required_years)))
-
-    experience_relevance = float(min(1.0, max(0.0, 0.2 + 0.8 * exp_match)))
-    project_relevance = float(min(1.0, max(0.0, 0.2 + 0.8 * similarity_score)))
-
-    # If we failed to extract skills, similarity should not dominate the score.
-    if not resume_set or not job_set:
-        similarity_score = 0.0
+        similarity_score = compute_similarity_score(resume_vec, job_vec, normalized=True)
 
-    critical_penalty = 0.0
-    if critical_missing:
-        critical_penalty = min(0.25, 0.05 * float(len(critical_missing)))
-
-    if fullstack_role:
-        frontend_missing = [
-            s for s in missing_skills if canonicalize_skill(s) in {"react", "node.js"}
-        ]
-        if frontend_missing:
-            critical_penalty += 0.1
-
-    print("Critical missing:", critical_missing)
-    print("Critical penalty:", float(critical_penalty))
-
-    ats_score = float(
-        max(
-            0.0,
-            min(
-                1.0,
-                (
-                    0.25 * similarity_score
-                    + 0.50 * weighted_coverage
-                    + 0.15 * (exp_match if required_years is not None else 0.5)
-                    + 0.10 * formatting_score
-                )
-                - critical_penalty,
-            ),
-        )
+    similarity_score, ats_score, missing_skills, details = _score_pair(
+        resume_text=TextDocument(resume_text, normalized=resume.normalized_text),
+        job_text=TextDocument(job_text, normalized=job.normalized_text),
+        resume_skill_names=resume_skill_names,
+        job_skill_names=job_skill_names,
+        similarity_score=similarity_score,
+        job_skill_importance=job_skill_importance,
+        resume_profile=resume.skill_profile,
+        job_profile=job.skill_profile,
     )
 
-    # Structured details JSON for analytics
-    details: dict[str, Any] = {
-        "resume_skill_count": len(resume_skill_names),
-        "job_skill_count": len(job_skill_names),
-        "resume_skills": sorted(resume_set),
-        "job_skills": sorted(job_set),
-        "resume_text": resume_text,
-        "matched_skills": matched_skills,
-        "missing_skills": missing_skills,
-        "extra_skills": extra_skills,
-        "critical_missing_skills": critical_missing,
-        "weighted_coverage": float(weighted_coverage),
-        "breakdown": {
-            "formatting": formatting_score,
-            "keyword_optimization": keyword_optimization,
-            "experience_relevance": experience_relevance,
-            "project_relevance": project_relevance,
-        },
-        "experience": {
-            "required_years": required_years,
-            "resume_years": resume_years,
-            "gap": gap,
-        },
-    }
-
     # Persist analysis + activity log in a single transaction
     analysis = AnalysisResult(
         id=uuid.uuid4(),
@@ -479,6 +384,175 @@ async def run_analysis(
     return _build_dashboard_response(analysis)
 
 
+async def run_batch_analysis(
+    db: AsyncSession,
+    *,
+    user: User,
+    resume_id: UUID,
+    job_description_ids: Sequence[UUID],
+    force: bool = False,
+) -> AnalysisBatchResponse:
+    """
+    Analyse one resume against many job descriptions and rank the results.
+
+    Stored skills for the resume and every job are read in one query and
+    the resume vector is looked up once; all similarities come from one
+    matrix-vector product over the job vectors. Analyses that already exist
+    are reused unless `force=true`. Every AnalysisResult, re-extracted join
+    row and ActivityLog row is bulk-inserted in a single transaction.
+    """
+    job_ids = list(dict.fromkeys(job_description_ids))
+    resume = await _get_resume_for_user(db, user=user, resume_id=resume_id)
+    resume_text = resume.extracted_text or ""
+    if not resume_text.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Resume text is empty. Please re-upload a text-based PDF.",
+        )
+
+    jobs_stmt = select(JobDescription).where(
+        JobDescription.id.in_(job_ids),
+        JobDescription.user_id == user.id,
+    )
+    jobs_by_id = {j.id: j for j in (await db.execute(jobs_stmt)).scalars().all()}
+    if len(jobs_by_id) != len(job_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job description not found",
+        )
+
+    cached_ids: set[UUID] = set()
+    if not force:
+        cached_stmt = select(AnalysisResult.job_description_id).where(
+            AnalysisResult.user_id == user.id,
+            AnalysisResult.resume_id == resume.id,
+            AnalysisResult.job_description_id.in_(job_ids),
+        )
+        cached_ids = set((await db.execute(cached_stmt)).scalars().all())
+
+    pending = [jobs_by_id[job_id] for job_id in job_ids if job_id not in cached_ids]
+    for job in pending:
+        if not (job.description_text or "").strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Job description text is empty: {job.id}",
+            )
+
+    if pending:
+        resume_skills, skills_by_job = await get_document_skills(db, resume=resume, jobs=pending)
+        resume_skill_names = list(resume_skills)
+        # The resume is analysed once (years, bullets, ...) for every job.
+        resume_doc = TextDocument(resume_text, normalized=resume.normalized_text)
+
+        try:
+            resume_vec, job_matrix = await get_batch_embeddings(db, resume=resume, jobs=pending)
+            similarities = compute_similarity_scores(resume_vec, job_matrix, normalized=True)
+        except Exception:
+            logger.exception("Batch embedding lookup failed resume_id=%s", str(resume.id))
+            similarities = np.zeros(len(pending))
+
+        now = datetime.now(timezone.utc)
+        analysis_rows: list[dict[str, Any]] = []
+        features = [
+            _score_features(
+                resume_text=resume_doc,
+                job_text=TextDocument(job.description_text, normalized=job.normalized_text),
+                resume_skill_names=resume_skill_names,
+                job_skill_names=list(skills_by_job[job.id]),
+                similarity_score=float(similarity),
+                job_skill_importance=skills_by_job[job.id],
+                resume_profile=resume.skill_profile,
+                job_profile=job.skill_profile,
+            )
+            for job, similarity in zip(pending, similarities)
+        ]
+        for job, pair, score in zip(pending, features, score_batch(features)):
+            details = _score_details(
+                pair,
+                score,
+                resume_text=resume_text,
+                resume_skill_count=len(resume_skill_names),
+                job_skill_count=len(skills_by_job[job.id]),
+            )
+            analysis_rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user.id,
+                    "resume_id": resume.id,
+                    "job_description_id": job.id,
+                    "similarity_score": score.similarity,
+                    "ats_score": score.ats_score,
+                    "missing_skills": {"items": score.missing_skills},
+                    "details": details,
+                    "created_at": now,
+                }
+            )
+
+        # An upsert both honours `force` and absorbs races with /analysis/run.
+        stmt = insert(AnalysisResult).values(analysis_rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_analysis_resume_job",
+            set_={
+                "similarity_score": stmt.excluded.similarity_score,
+                "ats_score": stmt.excluded.ats_score,
+                "missing_skills": stmt.excluded.missing_skills,
+                "details": stmt.excluded.details,
+                "created_at": stmt.excluded.created_at,
+            },
+        ).returning(AnalysisResult.id, AnalysisResult.job_description_id)
+        analysis_ids = {job_id: analysis_id for analysis_id, job_id in (await db.execute(stmt)).all()}
+
+        await db.execute(
+            insert(ActivityLog),
+            [
+                {
+                    "user_id": user.id,
+                    "action": "analysis_run",
+                    "entity_type": "analysis_result",
+                    "entity_id": analysis_ids[row["job_description_id"]],
+                    "extra_data": {
+                        "resume_id": str(resume.id),
+                        "job_description_id": str(row["job_description_id"]),
+                        "ats_score": row["ats_score"],
+                        "similarity_score": row["similarity_score"],
+                        "batch": True,
+                    },
+                    "created_at": now,
+                }
+                for row in analysis_rows
+            ],
+        )
+        await db.commit()
+
+    results_stmt = select(AnalysisResult).where(
+        AnalysisResult.user_id == user.id,
+        AnalysisResult.resume_id == resume.id,
+        AnalysisResult.job_description_id.in_(job_ids),
+    )
+    results = (await db.execute(results_stmt)).scalars().all()
+    ranked = sorted(results, key=lambda a: (-a.ats_score, -a.similarity_score))
+
+    items: list[AnalysisBatchItem] = []
+    for rank, analysis in enumerate(ranked, start=1):
+        job = jobs_by_id[analysis.job_description_id]
+        details = analysis.details or {}
+        items.append(
+            AnalysisBatchItem(
+                rank=rank,
+                analysis_id=analysis.id,
+                job_description_id=job.id,
+                job_title=job.title,
+                company=job.company,
+                ats_score=float(analysis.ats_score),
+                similarity_score=float(analysis.similarity_score),
+                matched_skills=list(details.get("matched_skills", []) or []),
+                missing_skills=list(details.get("missing_skills", []) or []),
+                cached=job.id in cached_ids,
+            )
+        )
+    return AnalysisBatchResponse(resume_id=resume.id, items=items)
+
+
 async def list_analyses_for_user(
     db: AsyncSession,
     *,
@@ -505,7 +579,6 @@ def _build_dashboard_response(analysis: AnalysisResult) -> AnalysisDashboardResp
     if not extra_skills and resume_skills and job_skills:
         extra_skills = sorted(set(resume_skills) - set(job_skills))
 
-    job_skills_set = {_normalize_skill(s) for s in job_skills}
     resume_skills_set = {_normalize_skill(s) for s in resume_skills}
     keyword_gap: list[dict[str, Any]] = []
     for i, kw in enumerate(job_skills):
@@ -545,8 +618,9 @@ def _build_dashboard_response(analysis: AnalysisResult) -> AnalysisDashboardResp
     resume_blob = (details.get("resume_text", "") or "").lower()
     if not resume_blob:
         resume_blob = " ".join(resume_skills).lower()
-    soft_matched = [s for s in soft_dict if s in resume_blob]
-    soft_missing = [s for s in soft_dict if s not in resume_blob]
+    resume_doc = TextDocument(resume_blob)
+    soft_matched = [s for s in soft_dict if resume_doc.contains(s)]
+    soft_missing = [s for s in soft_dict if not resume_doc.contains(s)]
     soft_skills = {"matched": soft_matched, "missing": soft_missing}
 
     recommendations: list[str] = []
@@ -0,0 +1,487 @@
+"""
+Precomputed resume / job description embeddings.
+
+Vectors are computed once, in a background task right after a resume is
+uploaded or a job description is created, and persisted in
+`document_embeddings`. Analysis then only needs a lookup and a dot
+product; it falls back to inline encoding when a vector is missing or
+stale (source text changed, or a different model is active).
+
+Every stored vector is tagged with its model name, model version and
+dimension. Only vectors of the active version (see
+`embedding_model_versions`) are ever compared with each other.
+
+Job vectors are also appended to the memory-mapped segment store (see
+`ai.vector_store`), one shard per user and model version, so bulk reads
+(the job ranking index, batch analysis) map them instead of decoding
+rows. Postgres stays
+the source of truth: a stored row is used only when its stamp equals the
+row's `created_at`, and rows missing from the store are read from
+Postgres and written back.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.embedding import DocumentEmbedding, EmbeddingModelVersion
+from ..models.job import JobDescription
+from ..models.resume import Resume
+from .ai.chunking import DocumentEmbedding as ComputedEmbedding
+from .ai.chunking import aembed_documents
+from .ai.embedding_cache import text_hash
+from .ai.embeddings import AsyncEmbeddingBackend, get_default_embedding_backend
+from .ai.executors import run_in_thread
+from .ai.job_index import job_indexes
+from .ai.quantization import decode_vector, encode_matrix, encode_vector
+from .ai.vector_store import job_shard, to_stamp, vector_store
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EmbeddingModelSpec:
+    model_name: str
+    model_version: str
+
+    @property
+    def model_id(self) -> str:
+        return f"{self.model_name}@{self.model_version}"
+
+
+_active_model: EmbeddingModelSpec | None = None
+_active_model_checked_at = 0.0
+
+
+async def get_active_embedding_model(db: AsyncSession) -> EmbeddingModelSpec:
+    """
+    Return the active model version, cached briefly per worker.
+
+    Falls back to the configured model when no version has been registered.
+    """
+    global _active_model, _active_model_checked_at
+
+    now = time.monotonic()
+    ttl = settings.embedding_version_refresh_seconds
+    if _active_model is not None and now - _active_model_checked_at < ttl:
+        return _active_model
+
+    stmt = select(EmbeddingModelVersion).where(EmbeddingModelVersion.is_active.is_(True))
+    row = (await db.execute(stmt)).scalar_one_or_none()
+    if row is not None:
+        _active_model = EmbeddingModelSpec(row.model_name, row.model_version)
+    else:
+        _active_model = EmbeddingModelSpec(
+            settings.embedding_model_name,
+            settings.embedding_model_version,
+        )
+    _active_model_checked_at = now
+    return _active_model
+
+
+async def activate_embedding_model(
+    db: AsyncSession,
+    *,
+    spec: EmbeddingModelSpec,
+    dimension: int | None,
+) -> None:
+    """
+    Atomically make `spec` the active model version.
+
+    Deactivation and activation happen in one transaction, so readers see
+    either the old or the new version, never none or both.
+    """
+    global _active_model
+
+    await db.execute(
+        insert(EmbeddingModelVersion)
+        .values(
+            model_name=spec.model_name,
+            model_version=spec.model_version,
+            dimension=dimension,
+            is_active=False,
+        )
+        .on_conflict_do_nothing(constraint="uq_embedding_model_version")
+    )
+    await db.execute(
+        update(EmbeddingModelVersion)
+        .where(EmbeddingModelVersion.is_active.is_(True))
+        .values(is_active=False)
+    )
+    await db.execute(
+        update(EmbeddingModelVersion)
+        .where(
+            EmbeddingModelVersion.model_name == spec.model_name,
+            EmbeddingModelVersion.model_version == spec.model_version,
+        )
+        .values(is_active=True, activated_at=datetime.now(timezone.utc), dimension=dimension)
+    )
+    await db.commit()
+    _active_model = spec
+
+
+def backend_for(spec: EmbeddingModelSpec, **kwargs) -> AsyncEmbeddingBackend:
+    return get_default_embedding_backend(spec.model_name, spec.model_version, **kwargs)
+
+
+def row_values(doc: ComputedEmbedding, *, spec: EmbeddingModelSpec, content_hash: str) -> dict:
+    return {
+        "model_name": spec.model_name,
+        "model_version": spec.model_version,
+        "dimension": int(doc.vector.shape[0]),
+        "content_hash": content_hash,
+        "encoding": settings.embedding_storage_encoding,
+        "vector": encode_vector(doc.vector, settings.embedding_storage_encoding),
+        "chunk_vectors": encode_matrix(doc.chunk_vectors, settings.embedding_storage_encoding),
+        # Set here rather than by the column default so callers know the
+        # stamp without reading the row back (job ranking indexes track it).
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+async def upsert_embedding(
+    db: AsyncSession,
+    *,
+    resume_id: UUID | None = None,
+    job_description_id: UUID | None = None,
+    values: dict,
+) -> None:
+    if resume_id is not None:
+        constraint = "uq_document_embedding_resume_model"
+    else:
+        constraint = "uq_document_embedding_job_model"
+    stmt = insert(DocumentEmbedding).values(
+        resume_id=resume_id,
+        job_description_id=job_description_id,
+        **values,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint=constraint,
+        set_={
+            "dimension": stmt.excluded.dimension,
+            "content_hash": stmt.excluded.content_hash,
+            "encoding": stmt.excluded.encoding,
+            "vector": stmt.excluded.vector,
+            "chunk_vectors": stmt.excluded.chunk_vectors,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+    await db.execute(stmt)
+
+
+def _is_fresh(row: DocumentEmbedding | None, *, spec: EmbeddingModelSpec, content_hash: str) -> bool:
+    return (
+        row is not None
+        and row.model_name == spec.model_name
+        and row.model_version == spec.model_version
+        and row.content_hash == content_hash
+        and bool(row.vector)
+    )
+
+
+async def precompute_resume_embedding(resume_id: UUID) -> None:
+    """
+    Background task: embed a freshly uploaded resume and persist the vector.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            resume = await db.get(Resume, resume_id)
+            text = (resume.extracted_text or "") if resume else ""
+            if not text.strip():
+                return
+            await _ensure_embedding(
+                db, text=text, content_hash=resume.content_hash, resume_id=resume_id
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.exception("Precomputing embedding failed resume_id=%s", str(resume_id))
+
+
+async def precompute_job_embedding(job_description_id: UUID) -> None:
+    """
+    Background task: embed a newly created job description and persist the vector.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            job = await db.get(JobDescription, job_description_id)
+            text = (job.description_text or "") if job else ""
+            if not text.strip():
+                return
+            spec = await get_active_embedding_model(db)
+            values = await _ensure_embedding(
+                db,
+                text=text,
+                content_hash=job.content_hash,
+                job_description_id=job_description_id,
+            )
+            await db.commit()
+            if values is not None:
+                vector = decode_vector(values["vector"])
+                await store_job_vectors(
+                    job.user_id, spec, [(job_description_id, vector, values["created_at"])]
+                )
+                job_indexes.add_job(
+                    job.user_id, spec.model_id, job_description_id, vector, values["created_at"]
+                )
+        except Exception:
+            await db.rollback()
+            logger.exception(
+                "Precomputing embedding failed job_description_id=%s",
+                str(job_description_id),
+            )
+
+
+async def store_job_vectors(
+    user_id: int,
+    spec: EmbeddingModelSpec,
+    entries: Sequence[tuple[UUID, np.ndarray, datetime]],
+) -> None:
+    """
+    Append (job id, vector, created_at) rows to the user's segment shard.
+    Best effort: the database row stays authoritative. Runs on the thread
+    pool, since the shard's file lock may be held by a compaction.
+    """
+    if vector_store is None or not entries:
+        return
+    shard = vector_store.shard(spec.model_name, spec.model_version, job_shard(user_id))
+    try:
+        await run_in_thread(shard.upsert, entries)
+    except (OSError, ValueError):
+        logger.warning("Failed to append %s job vector(s) for user_id=%s", len(entries), user_id)
+
+
+async def drop_job_vectors(user_id: int, job_ids: Sequence[UUID]) -> None:
+    """
+    Tombstone deleted jobs in the user's shards of every model version,
+    on the thread pool like `store_job_vectors`.
+    """
+    if vector_store is None:
+        return
+    try:
+        await run_in_thread(vector_store.delete_everywhere, job_shard(user_id), job_ids)
+    except OSError:
+        logger.warning("Failed to tombstone %s job vector(s) for user_id=%s", len(job_ids), user_id)
+
+
+async def load_job_vectors(
+    db: AsyncSession,
+    *,
+    user_id: int,
+    spec: EmbeddingModelSpec,
+    stamps: Mapping[UUID, datetime],
+) -> list[tuple[UUID, np.ndarray, datetime]]:
+    """
+    (job id, vector, created_at) for the given stored job vectors.
+
+    Rows whose segment-store stamp matches `stamps` (the database
+    `created_at`) are zero-copy views of the mapped segments; the rest
+    are read from Postgres in one query and appended to the store.
+    """
+    if not stamps:
+        return []
+    found: dict[UUID, tuple[np.ndarray, int]] = {}
+    if vector_store is not None:
+        shard = vector_store.shard(spec.model_name, spec.model_version, job_shard(user_id))
+        try:
+            found = await run_in_thread(shard.get, stamps)
+        except (OSError, ValueError):
+            logger.warning("Unreadable vector store shard %s", shard.path)
+    loaded: list[tuple[UUID, np.ndarray, datetime]] = []
+    missing: list[UUID] = []
+    for job_id, stamp in stamps.items():
+        hit = found.get(job_id)
+        if hit is not None and hit[1] == to_stamp(stamp):
+            loaded.append((job_id, hit[0], stamp))
+        else:
+            missing.append(job_id)
+    if missing:
+        rows = (
+            await db.execute(
+                select(
+                    DocumentEmbedding.job_description_id,
+                    DocumentEmbedding.vector,
+                    DocumentEmbedding.created_at,
+                ).where(
+                    DocumentEmbedding.job_description_id.in_(missing),
+                    DocumentEmbedding.model_name == spec.model_name,
+                    DocumentEmbedding.model_version == spec.model_version,
+                )
+            )
+        ).all()
+        fetched = [(job_id, decode_vector(vector), stamp) for job_id, vector, stamp in rows]
+        if fetched:
+            await store_job_vectors(user_id, spec, fetched)
+        loaded.extend(fetched)
+    return loaded
+
+
+async def _ensure_embedding(
+    db: AsyncSession,
+    *,
+    text: str,
+    content_hash: str | None = None,
+    resume_id: UUID | None = None,
+    job_description_id: UUID | None = None,
+) -> dict | None:
+    """
+    Encode and upsert the document's vector unless a fresh one is stored.
+    Returns the written row values, or None when nothing was written.
+    """
+    spec = await get_active_embedding_model(db)
+    content_hash = content_hash or text_hash(text)
+    stmt = select(DocumentEmbedding).where(
+        DocumentEmbedding.model_name == spec.model_name,
+        DocumentEmbedding.model_version == spec.model_version,
+    )
+    if resume_id is not None:
+        stmt = stmt.where(DocumentEmbedding.resume_id == resume_id)
+    else:
+        stmt = stmt.where(DocumentEmbedding.job_description_id == job_description_id)
+    existing = (await db.execute(stmt)).scalar_one_or_none()
+    if _is_fresh(existing, spec=spec, content_hash=content_hash):
+        return None
+
+    [doc] = await aembed_documents(backend_for(spec), [text])
+    values = row_values(doc, spec=spec, content_hash=content_hash)
+    await upsert_embedding(
+        db,
+        resume_id=resume_id,
+        job_description_id=job_description_id,
+        values=values,
+    )
+    return values
+
+
+async def get_pair_embeddings(
+    db: AsyncSession,
+    *,
+    resume: Resume,
+    job: JobDescription,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return pooled, L2-normalized (resume, job) vectors, reading precomputed
+    vectors as `get_batch_embeddings` does.
+
+    Missing or stale vectors are encoded inline (in one batched call) and
+    written back through the caller's session, so they are committed with
+    the analysis.
+    """
+    resume_vec, job_matrix = await get_batch_embeddings(db, resume=resume, jobs=[job])
+    return resume_vec, job_matrix[0]
+
+
+async def get_batch_embeddings(
+    db: AsyncSession,
+    *,
+    resume: Resume,
+    jobs: Sequence[JobDescription],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the resume vector and a (len(jobs), dim) matrix of job vectors.
+
+    Same contract as `get_pair_embeddings`: the resume row and the stamps
+    of the fresh job rows are read in one query each, job vectors come
+    through `load_job_vectors` (mapped segments, Postgres for the rest),
+    and whatever is missing or stale is encoded in one batched call.
+    """
+    spec = await get_active_embedding_model(db)
+    resume_text = resume.extracted_text or ""
+    # Hashes stored at write time spare re-hashing every text per analysis.
+    resume_hash = resume.content_hash or text_hash(resume_text)
+    unique_jobs = list({job.id: job for job in jobs}.values())
+
+    resume_row = (
+        await db.execute(
+            select(DocumentEmbedding).where(
+                DocumentEmbedding.model_name == spec.model_name,
+                DocumentEmbedding.model_version == spec.model_version,
+                DocumentEmbedding.resume_id == resume.id,
+            )
+        )
+    ).scalar_one_or_none()
+
+    resume_vec: np.ndarray | None = None
+    job_vecs: dict[UUID, np.ndarray] = {}
+    # (resume_id, job_description_id, text, content_hash)
+    missing: list[tuple[UUID | None, UUID | None, str, str]] = []
+    if _is_fresh(resume_row, spec=spec, content_hash=resume_hash):
+        resume_vec = decode_vector(resume_row.vector)
+    else:
+        missing.append((resume.id, None, resume_text, resume_hash))
+
+    job_hashes = {
+        job.id: job.content_hash or text_hash(job.description_text or "") for job in unique_jobs
+    }
+    stamps: dict[UUID, datetime] = {}
+    if unique_jobs:
+        # Stamps only; the vectors are read through the segment store.
+        rows = await db.execute(
+            select(
+                DocumentEmbedding.job_description_id,
+                DocumentEmbedding.content_hash,
+                DocumentEmbedding.created_at,
+            ).where(
+                DocumentEmbedding.model_name == spec.model_name,
+                DocumentEmbedding.model_version == spec.model_version,
+                DocumentEmbedding.job_description_id.in_(job_hashes),
+                func.octet_length(DocumentEmbedding.vector) > 0,
+            )
+        )
+        stamps = {
+            job_id: created_at
+            for job_id, content_hash, created_at in rows.all()
+            if content_hash == job_hashes[job_id]
+        }
+    owners = {job.id: job.user_id for job in unique_jobs}
+    for user_id in set(owners.values()):
+        owned = {job_id: stamp for job_id, stamp in stamps.items() if owners[job_id] == user_id}
+        loaded = await load_job_vectors(db, user_id=user_id, spec=spec, stamps=owned)
+        job_vecs.update((job_id, vector) for job_id, vector, _ in loaded)
+    for job in unique_jobs:
+        if job.id not in job_vecs:
+            missing.append((None, job.id, job.description_text or "", job_hashes[job.id]))
+
+    if missing:
+        logger.info("Inline embedding fallback for %s document(s)", len(missing))
+        # Identical texts (by content hash) are encoded once.
+        distinct = {m[3]: m[2] for m in missing}
+        docs = await aembed_documents(backend_for(spec), list(distinct.values()))
+        encoded = dict(zip(distinct, docs))
+        stored: dict[int, list[tuple[UUID, np.ndarray, datetime]]] = {}
+        for resume_id, job_id, _, content_hash in missing:
+            doc = encoded[content_hash]
+            values = row_values(doc, spec=spec, content_hash=content_hash)
+            # Score with the vector as stored, so re-runs that read it back
+            # get the same similarity.
+            vector = decode_vector(values["vector"])
+            if resume_id is not None:
+                resume_vec = vector
+            else:
+                job_vecs[job_id] = vector
+                stored.setdefault(owners[job_id], []).append((job_id, vector, values["created_at"]))
+            await upsert_embedding(
+                db,
+                resume_id=resume_id,
+                job_description_id=job_id,
+                values=values,
+            )
+        # Appended before the caller commits; a rolled-back row's stamp
+        # never matches the database, so readers ignore it.
+        for user_id, entries in stored.items():
+            await store_job_vectors(user_id, spec, entries)
+
+    assert resume_vec is not None
+    if not jobs:
+        return resume_vec, np.zeros((0, resume_vec.shape[0]), dtype=np.float32)
+    return resume_vec, np.stack([np.asarray(job_vecs[job.id], dtype=np.float32) for job in jobs])
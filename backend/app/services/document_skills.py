@@ -0,0 +1,325 @@
+"""
+Skills extracted once per resume / job description and stored as join rows.
+
+Extraction runs in a background task right after a resume is uploaded or
+a job description is created; the matched skills are stored in
+`resume_skills` / `job_skills` and the document is stamped with the
+taxonomy version that produced them. Analysis then reads the join rows
+in one query and only re-extracts documents whose stamp differs from the
+active taxonomy version (never extracted, or the taxonomy changed).
+
+The same pass records how often and in which section each skill occurs;
+that becomes `ResumeSkill.weight` and `JobSkill.importance`, so scoring
+reads weights instead of re-scanning the text.
+"""
+
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, false, select, true, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..core.database import AsyncSessionLocal
+from ..models.job import JobDescription
+from ..models.resume import Resume
+from ..models.skill import JobSkill, ResumeSkill, Skill
+from .ai.executors import run_cpu_bound
+from .ai.sections import job_importance, resume_weight
+from .ai.skill_profiles import profile_to_bytes, skill_vocabulary
+from .ai.skills import SkillMention, extract_skill_mentions_many
+from .ai.taxonomy import canonicalize_skill, taxonomy_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _weigh(mentions: Sequence[SkillMention], kind: str) -> dict[str, float]:
+    """
+    Canonical skill name -> weight, merging mentions of aliases of one skill.
+    """
+    counts: dict[str, int] = {}
+    sections: dict[str, set[str]] = {}
+    for mention in mentions:
+        name = canonicalize_skill(mention.skill)
+        if not name:
+            continue
+        counts[name] = counts.get(name, 0) + mention.count
+        sections.setdefault(name, set()).update(mention.sections)
+    if kind == "job":
+        return {name: job_importance(sections[name]) for name in sorted(counts)}
+    return {name: resume_weight(sections[name], counts[name]) for name in sorted(counts)}
+
+
+def skill_profile(names: Iterable[str]) -> bytes:
+    """
+    Stored bitset profile of canonical skill names with known ordinals.
+    """
+    return profile_to_bytes(skill_vocabulary.profile(names))
+
+
+async def extract_and_store_skills(
+    db: AsyncSession,
+    *,
+    resumes: Sequence[Resume] = (),
+    jobs: Sequence[JobDescription] = (),
+) -> tuple[dict[UUID, dict[str, float]], dict[UUID, dict[str, float]]]:
+    """
+    Extract skills for the given documents and replace their join rows.
+
+    All texts go to the process pool in one call, with their stored
+    normalized form, and documents of one kind sharing a content hash (the
+    same resume uploaded twice, one posting saved by several users) are
+    extracted once. Skill rows, join rows and version stamps are written
+    with one statement each. Does not commit. Returns ({skill: weight} by
+    resume id, {skill: importance} by job id).
+    """
+    if not resumes and not jobs:
+        return {}, {}
+
+    version = taxonomy_registry.current.version
+    # Job descriptions are segmented once at creation; reuse their spans.
+    documents = [("resume", r, r.extracted_text, None) for r in resumes] + [
+        ("job", j, j.description_text, j.sections) for j in jobs
+    ]
+    slots: dict[tuple, int] = {}
+    index: list[int] = []
+    texts: list[str] = []
+    kinds: list[str] = []
+    stored_sections: list[str | None] = []
+    normalized: list[str | None] = []
+    for kind, document, text, sections in documents:
+        text = text or ""
+        key = (kind, document.content_hash or document.id, sections)
+        slot = slots.get(key)
+        # The hash ignores whitespace, which section headers depend on.
+        if slot is None or texts[slot] != text:
+            slot = len(texts)
+            slots.setdefault(key, slot)
+            texts.append(text)
+            kinds.append(kind)
+            stored_sections.append(sections)
+            normalized.append(document.normalized_text)
+        index.append(slot)
+    unique = await run_cpu_bound(
+        extract_skill_mentions_many, texts, kinds, version, stored_sections, normalized
+    )
+    extracted = [unique[slot] for slot in index]
+    resume_names, job_names = await store_skill_mentions(
+        db,
+        resume_mentions={r.id: mentions for r, mentions in zip(resumes, extracted)},
+        job_mentions={j.id: mentions for j, mentions in zip(jobs, extracted[len(resumes) :])},
+        version=version,
+    )
+    for document, names in (
+        *((r, resume_names[r.id]) for r in resumes),
+        *((j, job_names[j.id]) for j in jobs),
+    ):
+        set_committed_value(document, "skills_taxonomy_version", version)
+        set_committed_value(document, "skill_profile", skill_profile(names))
+    return resume_names, job_names
+
+
+async def store_skill_mentions(
+    db: AsyncSession,
+    *,
+    resume_mentions: Mapping[UUID, Sequence[SkillMention]] | None = None,
+    job_mentions: Mapping[UUID, Sequence[SkillMention]] | None = None,
+    version: str,
+) -> tuple[dict[UUID, dict[str, float]], dict[UUID, dict[str, float]]]:
+    """
+    Weigh extracted mentions and replace the documents' join rows and
+    version stamps, with one statement per table. Does not commit.
+    """
+    resume_names = {rid: _weigh(m, "resume") for rid, m in (resume_mentions or {}).items()}
+    job_names = {jid: _weigh(m, "job") for jid, m in (job_mentions or {}).items()}
+
+    all_names = sorted(set().union(*resume_names.values(), *job_names.values()))
+    skill_ids: dict[str, UUID] = {}
+    if all_names:
+        rows = await db.execute(
+            select(Skill.name, Skill.id, Skill.ordinal).where(Skill.name.in_(all_names))
+        )
+        known = rows.all()
+        new_names = sorted(set(all_names) - {name for name, _, _ in known})
+        if new_names:
+            # Only unknown names are inserted: a conflicting insert still
+            # draws an ordinal, and ordinals should stay dense. The upsert
+            # stays concurrency-safe; rows are passed as executemany
+            # parameters so large bulk batches stay under the driver's
+            # bind-parameter limit.
+            await db.execute(
+                insert(Skill).on_conflict_do_nothing(index_elements=[Skill.name]),
+                [{"name": name} for name in new_names],
+            )
+            rows = await db.execute(
+                select(Skill.name, Skill.id, Skill.ordinal).where(Skill.name.in_(new_names))
+            )
+            known = [*known, *rows.all()]
+        skill_ids = {name: skill_id for name, skill_id, _ in known}
+        skill_vocabulary.update((name, ordinal) for name, _, ordinal in known)
+
+    if resume_names:
+        # Rows from an older taxonomy may no longer apply.
+        await db.execute(delete(ResumeSkill).where(ResumeSkill.resume_id.in_(resume_names)))
+        resume_rows = [
+            {"resume_id": resume_id, "skill_id": skill_ids[name], "weight": weight}
+            for resume_id, names in resume_names.items()
+            for name, weight in names.items()
+            if name in skill_ids
+        ]
+        if resume_rows:
+            await db.execute(
+                insert(ResumeSkill).on_conflict_do_nothing(constraint="uq_resume_skill"),
+                resume_rows,
+            )
+        # Bulk UPDATE by primary key: one statement, one profile per row.
+        await db.execute(
+            update(Resume).execution_options(synchronize_session=False),
+            [
+                {
+                    "id": resume_id,
+                    "skills_taxonomy_version": version,
+                    "skill_profile": skill_profile(names),
+                }
+                for resume_id, names in resume_names.items()
+            ],
+        )
+
+    if job_names:
+        await db.execute(delete(JobSkill).where(JobSkill.job_description_id.in_(job_names)))
+        job_rows = [
+            {"job_description_id": job_id, "skill_id": skill_ids[name], "importance": importance}
+            for job_id, names in job_names.items()
+            for name, importance in names.items()
+            if name in skill_ids
+        ]
+        if job_rows:
+            await db.execute(
+                insert(JobSkill).on_conflict_do_nothing(constraint="uq_job_skill"),
+                job_rows,
+            )
+        await db.execute(
+            update(JobDescription).execution_options(synchronize_session=False),
+            [
+                {
+                    "id": job_id,
+                    "skills_taxonomy_version": version,
+                    "skill_profile": skill_profile(names),
+                }
+                for job_id, names in job_names.items()
+            ],
+        )
+
+    return resume_names, job_names
+
+
+async def get_document_skills(
+    db: AsyncSession,
+    *,
+    resume: Resume,
+    jobs: Sequence[JobDescription],
+) -> tuple[dict[str, float], dict[UUID, dict[str, float]]]:
+    """
+    Return ({skill: weight} for the resume, {skill: importance} by job id),
+    reading stored join rows in one query and re-extracting only documents
+    stamped with another taxonomy version. Re-extracted rows are committed
+    with the caller's transaction. Rows stored without a weight count as 1.0.
+    """
+    version = taxonomy_registry.current.version
+    unique_jobs = list({j.id: j for j in jobs}.values())
+    stale_resumes = [resume] if resume.skills_taxonomy_version != version else []
+    stale_jobs = [j for j in unique_jobs if j.skills_taxonomy_version != version]
+    fresh_job_ids = [j.id for j in unique_jobs if j.skills_taxonomy_version == version]
+
+    resume_skills: dict[str, float] = {}
+    job_skills: dict[UUID, dict[str, float]] = {job_id: {} for job_id in fresh_job_ids}
+    if not stale_resumes or fresh_job_ids:
+        stmts = []
+        if not stale_resumes:
+            stmts.append(
+                select(
+                    true().label("is_resume"),
+                    ResumeSkill.resume_id.label("owner_id"),
+                    Skill.name,
+                    Skill.ordinal,
+                    ResumeSkill.weight.label("weight"),
+                )
+                .join(Skill, Skill.id == ResumeSkill.skill_id)
+                .where(ResumeSkill.resume_id == resume.id)
+            )
+        if fresh_job_ids:
+            stmts.append(
+                select(
+                    false().label("is_resume"),
+                    JobSkill.job_description_id.label("owner_id"),
+                    Skill.name,
+                    Skill.ordinal,
+                    JobSkill.importance.label("weight"),
+                )
+                .join(Skill, Skill.id == JobSkill.skill_id)
+                .where(JobSkill.job_description_id.in_(fresh_job_ids))
+            )
+        stmt = stmts[0] if len(stmts) == 1 else stmts[0].union_all(stmts[1])
+        rows = (await db.execute(stmt)).all()
+        skill_vocabulary.update((name, ordinal) for _, _, name, ordinal, _ in rows)
+        for is_resume, owner_id, name, _, weight in rows:
+            weight = 1.0 if weight is None else float(weight)
+            if is_resume:
+                resume_skills[name] = weight
+            else:
+                job_skills[owner_id][name] = weight
+
+    if stale_resumes or stale_jobs:
+        logger.info(
+            "Re-extracting skills for %s resume(s) and %s job(s) under taxonomy %s",
+            len(stale_resumes),
+            len(stale_jobs),
+            version,
+        )
+        extracted_resumes, extracted_jobs = await extract_and_store_skills(
+            db, resumes=stale_resumes, jobs=stale_jobs
+        )
+        if stale_resumes:
+            resume_skills = extracted_resumes[resume.id]
+        job_skills.update(extracted_jobs)
+
+    return dict(sorted(resume_skills.items())), {
+        job_id: dict(sorted(names.items())) for job_id, names in job_skills.items()
+    }
+
+
+async def precompute_resume_skills(resume_id: UUID) -> None:
+    """
+    Background task: extract and store skills for a freshly uploaded resume.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            resume = await db.get(Resume, resume_id)
+            if resume is None or not (resume.extracted_text or "").strip():
+                return
+            await extract_and_store_skills(db, resumes=[resume])
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.exception("Extracting skills failed resume_id=%s", str(resume_id))
+
+
+async def precompute_job_skills(job_description_id: UUID) -> None:
+    """
+    Background task: extract and store skills for a newly created job description.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            job = await db.get(JobDescription, job_description_id)
+            if job is None or not (job.description_text or "").strip():
+                return
+            await extract_and_store_skills(db, jobs=[job])
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.exception(
+                "Extracting skills failed job_description_id=%s",
+                str(job_description_id),
+            )
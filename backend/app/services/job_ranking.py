@@ -0,0 +1,183 @@
+"""
+"Best matching jobs for this resume": top-k of the user's job descriptions
+by embedding similarity, optionally re-ranked by skill coverage.
+
+Queries go to the user's in-process `UserJobIndex` (see
+`services.ai.job_index`) instead of scanning every stored vector. The
+index is built from `document_embeddings` on first use and kept current
+incrementally: job embedding tasks add to it and job deletion removes
+from it. Other workers' writes are caught by comparing a fingerprint,
+(count, newest created_at) of the user's stored job vectors, on every
+query; on a mismatch only new, changed or removed vectors are synced,
+read from the memory-mapped vector store where it has them.
+"""
+
+import logging
+from uuid import UUID
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.embedding import DocumentEmbedding
+from ..models.job import JobDescription
+from ..models.user import User
+from ..schemas.analysis import JobMatchItem, JobMatchResponse
+from .ai.job_index import UserJobIndex, job_indexes
+from .ai.skill_profiles import overlap_counts, profile_matrix, profile_sizes
+from .ai.taxonomy import taxonomy_registry
+from .document_embeddings import (
+    EmbeddingModelSpec,
+    get_active_embedding_model,
+    get_batch_embeddings,
+    load_job_vectors,
+)
+from .document_skills import get_document_skills
+from .resumes import get_resume_for_user
+
+logger = logging.getLogger(__name__)
+
+
+def _job_vector_stamps(user: User, spec: EmbeddingModelSpec):
+    """
+    (job id, created_at) of the stored job vectors of `user` under `spec`.
+    """
+    return (
+        select(DocumentEmbedding.job_description_id, DocumentEmbedding.created_at)
+        .join(JobDescription, JobDescription.id == DocumentEmbedding.job_description_id)
+        .where(
+            JobDescription.user_id == user.id,
+            DocumentEmbedding.model_name == spec.model_name,
+            DocumentEmbedding.model_version == spec.model_version,
+        )
+    )
+
+
+async def _sync_index(db: AsyncSession, *, user: User, spec: EmbeddingModelSpec) -> UserJobIndex | None:
+    """
+    The user's index, loaded or brought up to date with the database.
+    None when the user has no stored job vectors.
+    """
+    vectors = _job_vector_stamps(user, spec).subquery()
+    count, newest = (await db.execute(select(func.count(), func.max(vectors.c.created_at)))).one()
+    if not count:
+        return None
+    index = job_indexes.get(user.id, spec.model_id)
+    if index is not None and index.fingerprint() == (count, newest):
+        return index
+
+    stamps = dict(
+        (await db.execute(select(vectors.c.job_description_id, vectors.c.created_at))).all()
+    )
+    known = index.stamps if index is not None else {}
+    changed = {job_id: stamp for job_id, stamp in stamps.items() if known.get(job_id) != stamp}
+    loaded = await load_job_vectors(db, user_id=user.id, spec=spec, stamps=changed)
+
+    # No awaits from here on: the index is updated in one step.
+    if index is None:
+        index = job_indexes.new_index(loaded[0][1].shape[0] if loaded else 0)
+        job_indexes.put(user.id, spec.model_id, index)
+    index.remove_many([job_id for job_id in index.stamps if job_id not in stamps])
+    index.add_many(loaded)
+    logger.info(
+        "Synced job index user_id=%s jobs=%s changed=%s kind=%s",
+        user.id,
+        len(index),
+        len(loaded),
+        index.kind,
+    )
+    return index
+
+
+async def rank_jobs_for_resume(
+    db: AsyncSession,
+    *,
+    user: User,
+    resume_id: UUID,
+    k: int = 10,
+    rerank: bool = False,
+) -> JobMatchResponse:
+    """
+    Top-k of the user's job descriptions for one resume.
+
+    Scores are the embedding similarity in [0, 1]. With `rerank`,
+    `job_index_rerank_factor * k` candidates are re-scored as
+    (similarity + 2 * skill coverage) / 3 from stored skill profiles, the
+    same 1:2 weighting as similarity and coverage in the ATS score.
+    Jobs without a stored vector yet are not ranked. Above
+    `job_index_ivf_min_jobs` jobs the search may be approximate; the
+    response then says so and carries the index's estimated recall.
+    """
+    resume = await get_resume_for_user(db, user=user, resume_id=resume_id)
+    if not (resume.extracted_text or "").strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Resume text is empty. Please re-upload a text-based PDF.",
+        )
+
+    spec = await get_active_embedding_model(db)
+    resume_vec, _ = await get_batch_embeddings(db, resume=resume, jobs=[])
+    index = await _sync_index(db, user=user, spec=spec)
+    if index is None or index.dim != resume_vec.shape[0]:
+        await db.commit()
+        return JobMatchResponse(resume_id=resume.id, index="empty", indexed_jobs=0, items=[])
+
+    limit = k * settings.job_index_rerank_factor if rerank else k
+    candidates = index.search(resume_vec, limit)
+    job_ids = [job_id for job_id, _ in candidates]
+    rows = (
+        await db.execute(
+            select(
+                JobDescription.id,
+                JobDescription.title,
+                JobDescription.company,
+                JobDescription.skill_profile,
+            ).where(JobDescription.id.in_(job_ids), JobDescription.user_id == user.id)
+        )
+    ).all()
+    jobs = {row.id: row for row in rows}
+    candidates = [(job_id, raw) for job_id, raw in candidates if job_id in jobs]
+    # Same [0, 1] scale as `compute_similarity_score`.
+    raw = np.array([raw for _, raw in candidates], dtype=np.float64)
+    similarity = np.maximum(0.0, (raw + 1.0) / 2.0)
+
+    coverage: np.ndarray | None = None
+    scores = similarity
+    if rerank and candidates:
+        if resume.skills_taxonomy_version != taxonomy_registry.current.version:
+            # Re-extracts and stamps the resume's profile.
+            await get_document_skills(db, resume=resume, jobs=[])
+        matrix = profile_matrix([jobs[job_id].skill_profile for job_id, _ in candidates])
+        row = profile_matrix([resume.skill_profile], matrix.shape[1])[0]
+        sizes = profile_sizes(matrix)
+        coverage = np.divide(
+            overlap_counts(row, matrix), sizes, out=np.zeros(len(candidates)), where=sizes > 0
+        )
+        scores = (similarity + 2.0 * coverage) / 3.0
+    # Commits any vector or skills the lookups had to compute inline.
+    await db.commit()
+
+    order = np.argsort(-scores, kind="stable")[:k]
+    items = [
+        JobMatchItem(
+            rank=rank,
+            job_description_id=candidates[i][0],
+            job_title=jobs[candidates[i][0]].title,
+            company=jobs[candidates[i][0]].company,
+            similarity_score=round(float(similarity[i]), 4),
+            skill_coverage=round(float(coverage[i]), 4) if coverage is not None else None,
+            score=round(float(scores[i]), 4),
+        )
+        for rank, i in enumerate(order, start=1)
+    ]
+    recall = index.recall
+    return JobMatchResponse(
+        resume_id=resume.id,
+        index=index.kind,
+        indexed_jobs=len(index),
+        approximate=recall is not None,
+        expected_recall=round(recall, 4) if recall is not None else None,
+        items=items,
+    )
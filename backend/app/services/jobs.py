@@ -11,40 +11,46 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.job import JobDescription
 from ..models.user import User
 from ..schemas.job import JobDescriptionCreate
+from .ai.job_index import job_indexes
+from .ai.sections import split_job_sections
+from .ai.taxonomy import canonicalize_skill
+from .ai.text import TextDocument
+from .document_embeddings import drop_job_vectors
 
 logger = logging.getLogger(__name__)
 
 
-def extract_keywords(text: str) -> list[str]:
+# Common programming languages, technologies and practices, as one
+# alternation so the job description is scanned once.
+_KEYWORD_PATTERN = re.compile(
+    r"\b("
+    r"python|javascript|java|c\+\+|c#|ruby|go|rust|php|swift|kotlin|scala|typescript"
+    r"|react|vue|angular|node\.js|express|django|flask|spring|rails|laravel|symfony"
+    r"|aws|azure|gcp|docker|kubernetes|terraform|ansible|jenkins|git|ci\/cd"
+    r"|mongodb|postgresql|mysql|redis|elasticsearch|cassandra|dynamodb"
+    r"|machine learning|ai|data science|deep learning|tensorflow|pytorch|scikit-learn"
+    r"|agile|scrum|kanban|devops|microservices|rest|graphql|api"
+    r")\b"
+)
+
+
+def extract_keywords(text: str | TextDocument) -> list[str]:
     """Extract basic keywords from job description text."""
     try:
         # Simple keyword extraction - look for common tech terms and skills
-        tech_keywords = set()
-        
-        # Common programming languages and technologies
-        tech_patterns = [
-            r'\b(Python|JavaScript|Java|C\+\+|C#|Ruby|Go|Rust|PHP|Swift|Kotlin|Scala|TypeScript)\b',
-            r'\b(React|Vue|Angular|Node\.js|Express|Django|Flask|Spring|Rails|Laravel|Symfony)\b',
-            r'\b(AWS|Azure|GCP|Docker|Kubernetes|Terraform|Ansible|Jenkins|Git|CI\/CD)\b',
-            r'\b(MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|Cassandra|DynamoDB)\b',
-            r'\b(Machine Learning|AI|Data Science|Deep Learning|TensorFlow|PyTorch|Scikit-learn)\b',
-            r'\b(Agile|Scrum|Kanban|DevOps|Microservices|REST|GraphQL|API)\b'
-        ]
-        
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            tech_keywords.update([match.lower() for match in matches])
-        
+        matches = _KEYWORD_PATTERN.findall(TextDocument.of(text).lower)
+        tech_keywords = {canonicalize_skill(match) for match in matches}
+
         return list(tech_keywords)
     except Exception as e:
         logger.warning(f"Error extracting keywords: {str(e)}")
         return []
 
 
-def count_words(text: str) -> int:
+def count_words(text: str | TextDocument) -> int:
     """Count words in text."""
     try:
-        return len(text.split())
+        return TextDocument.of(text).word_count
     except Exception as e:
         logger.warning(f"Error counting words: {str(e)}")
         return 0
@@ -73,9 +79,12 @@ async def create_job_description(
     try:
         logger.info(f"Creating job description for user {user.id}: {data.title}")
         
-        # Calculate word count and extract keywords
-        word_count = count_words(data.description_text)
-        keywords = extract_keywords(data.description_text)
+        # Calculate word count, extract keywords, segment into sections and
+        # normalize/hash the text, all from one analysed copy of it
+        document = TextDocument(data.description_text)
+        word_count = count_words(document)
+        keywords = extract_keywords(document)
+        sections = split_job_sections(document)
         
         # Create job description object
         job = JobDescription(
@@ -89,8 +98,11 @@ async def create_job_description(
             salary_range=data.salary_range,
             tech_stack=json.dumps(data.tech_stack) if data.tech_stack else None,
             description_text=data.description_text,
+            normalized_text=document.normalized,
+            content_hash=document.content_hash,
             word_count=word_count,
             keywords=json.dumps(keywords) if keywords else None,
+            sections=sections,
         )
         
         # Save to database
@@ -160,4 +172,6 @@ async def delete_job_description(
     job = await get_job_description_for_user(db, user=user, job_id=job_id)
     await db.delete(job)
     await db.commit()
+    await drop_job_vectors(user.id, [job_id])
+    job_indexes.remove_job(user.id, job_id)
 
@@ -11,6 +11,7 @@ from ..models.user import User
 from ..schemas.resume import ResumeCreate
 from ..utils.storage import BASE_DIR, save_resume_file
 from .ai.pdf_parser import LocalPDFParser
+from .ai.text import TextDocument
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +75,8 @@ async def upload_resume_file(
     - Each upload is treated as an independent Resume.
     - Save the file to disk.
     - Extract text from PDF.
-    - Persist file_path + extracted_text on Resume.
+    - Persist file_path + extracted_text (with its normalized form and
+      content hash) on Resume.
     """
     parser = LocalPDFParser()
 
@@ -114,6 +116,9 @@ async def upload_resume_file(
 
     resume.file_path = storage_path
     resume.extracted_text = extracted_text
+    document = TextDocument(extracted_text)
+    resume.normalized_text = document.normalized
+    resume.content_hash = document.content_hash
 
     await db.commit()
     await db.refresh(resume)
@@ -0,0 +1,186 @@
+"""
+Loading and hot-reloading the skill taxonomy.
+
+The taxonomy version is derived from a fingerprint of its source (a
+content hash of the `skills` and `skill_aliases` rows, computed by
+Postgres, or the data file's version), so a background task can poll it
+and only recompile when something actually changed. Compilation runs on
+the AI thread pool and the result is published atomically through
+`taxonomy_registry`.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import String, cast, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.skill import Skill, SkillAlias
+from .ai.executors import run_in_thread
+from .ai.taxonomy import (
+    AliasEntry,
+    CompiledTaxonomy,
+    SkillEntry,
+    SkillTaxonomy,
+    builtin_taxonomy,
+    compile_taxonomy,
+    merge_aliases,
+    merge_entries,
+    read_taxonomy_file,
+    taxonomy_registry,
+    taxonomy_version,
+    write_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+_refresh_task: asyncio.Task | None = None
+
+
+_FileContents = tuple[list[SkillEntry], list[AliasEntry]]
+_SEP = "\x1f"
+
+
+def _content_md5(row_text, order_by):
+    """
+    md5 over every row's text in a stable order; md5 of "" for no rows.
+    """
+    rows = func.string_agg(row_text, aggregate_order_by(literal_column("E'\\n'"), order_by))
+    return func.md5(func.coalesce(rows, ""))
+
+
+async def _probe(db: AsyncSession) -> tuple[str, _FileContents | None]:
+    """
+    Return (version, file contents) for the configured source without
+    loading the skill tables.
+    """
+    builtin = builtin_taxonomy()
+    source = settings.skill_taxonomy_source
+    if source == "file" and settings.skill_taxonomy_file:
+        file_version, entries, aliases = await run_in_thread(
+            read_taxonomy_file, settings.skill_taxonomy_file
+        )
+        return taxonomy_version("file", builtin.version, file_version), (entries, aliases)
+    if source == "database":
+        # Hash what the taxonomy is built from, so re-pointed aliases and
+        # recategorised skills change the version. Built-in names stored
+        # without a category (inserted as skill rows by extraction) do not
+        # change the merged taxonomy and are left out.
+        builtin_names = [entry.name.strip().lower() for entry in builtin.entries]
+        skills = await db.scalar(
+            select(
+                _content_md5(
+                    func.concat_ws(_SEP, Skill.name, func.coalesce(Skill.category, "")),
+                    Skill.name,
+                )
+            ).where(
+                or_(
+                    Skill.category.is_not(None),
+                    func.lower(func.trim(Skill.name)).not_in(builtin_names),
+                )
+            )
+        )
+        aliases = await db.scalar(
+            select(
+                _content_md5(
+                    func.concat_ws(
+                        _SEP, SkillAlias.alias, Skill.name, cast(SkillAlias.match_in_text, String)
+                    ),
+                    SkillAlias.alias,
+                )
+            ).join(Skill, Skill.id == SkillAlias.skill_id)
+        )
+        return taxonomy_version("database", builtin.version, skills, aliases), None
+    return builtin.version, None
+
+
+async def load_skill_taxonomy(
+    db: AsyncSession,
+    version: str,
+    file_contents: _FileContents | None,
+) -> SkillTaxonomy:
+    builtin = builtin_taxonomy()
+    source = settings.skill_taxonomy_source
+    if file_contents is not None:
+        file_entries, file_aliases = file_contents
+        entries = merge_entries(builtin.entries, file_entries)
+        aliases = merge_aliases(builtin.aliases, file_aliases)
+    elif source == "database":
+        rows = (await db.execute(select(Skill.name, Skill.category))).all()
+        entries = merge_entries(builtin.entries, (SkillEntry(name, category) for name, category in rows))
+        alias_rows = (
+            await db.execute(
+                select(SkillAlias.alias, Skill.name, SkillAlias.match_in_text).join(
+                    Skill, Skill.id == SkillAlias.skill_id
+                )
+            )
+        ).all()
+        aliases = merge_aliases(
+            builtin.aliases,
+            (AliasEntry(alias, name, match) for alias, name, match in alias_rows),
+        )
+    else:
+        return builtin
+    return SkillTaxonomy(version=version, source=source, entries=entries, aliases=aliases)
+
+
+def _compile_and_snapshot(taxonomy: SkillTaxonomy) -> CompiledTaxonomy:
+    # The snapshot must exist before the version is published to workers.
+    write_snapshot(taxonomy)
+    return compile_taxonomy(taxonomy)
+
+
+async def refresh_skill_taxonomy(db: AsyncSession, *, force: bool = False) -> bool:
+    """
+    Recompile and publish the taxonomy if its version changed.
+    Returns True when a new taxonomy was published.
+    """
+    version, file_contents = await _probe(db)
+    taxonomy_registry.last_checked_at = datetime.now(timezone.utc)
+    if not force and version == taxonomy_registry.current.version:
+        return False
+    taxonomy = await load_skill_taxonomy(db, version, file_contents)
+    compiled = await run_in_thread(_compile_and_snapshot, taxonomy)
+    taxonomy_registry.publish(compiled)
+    return True
+
+
+async def _refresh_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.skill_taxonomy_refresh_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await refresh_skill_taxonomy(db)
+        except Exception:
+            logger.exception("Skill taxonomy refresh failed; keeping %s", taxonomy_registry.current.version)
+
+
+async def start_skill_taxonomy_refresher() -> None:
+    """
+    Load the taxonomy now, then keep polling for new versions in the background.
+    """
+    global _refresh_task
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await refresh_skill_taxonomy(db)
+    except Exception:
+        logger.exception("Initial skill taxonomy load failed; using built-in skills")
+    if _refresh_task is None and settings.skill_taxonomy_refresh_seconds > 0:
+        _refresh_task = asyncio.get_running_loop().create_task(_refresh_loop())
+
+
+async def stop_skill_taxonomy_refresher() -> None:
+    global _refresh_task
+
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
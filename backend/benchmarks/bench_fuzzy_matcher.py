@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Cost and accuracy of the fuzzy skill-matching stage.
+
+Synthetic mode (default): resumes are filler text with skills inserted,
+a share of them misspelled (one edit, or split into two words). Reports,
+per dictionary size:
+
+- index build time, terms and approximate memory;
+- ms per document for the fuzzy stage alone (exact hits are computed
+  first and excluded, as in extraction): mean on a cold index, mean and
+  p95 once its per-token caches are warm (the steady state of a running
+  worker); and for a naive scan that edit-distances every token against
+  every skill;
+- recall on the misspelled skills, and fuzzy hits for skills that were
+  not inserted at all (false positives).
+
+With --from-db, the stage runs over stored resumes instead (no ground
+truth; reports latency and how many extra skills per resume it adds).
+
+Usage (from backend/):
+
+    python benchmarks/bench_fuzzy_matcher.py --sizes 37,1000,20000 --docs 300
+    python benchmarks/bench_fuzzy_matcher.py --from-db --docs 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from bench_skill_matcher import _FILLER, _dictionary  # noqa: E402
+
+from app.services.ai.fuzzy import FuzzySkillIndex, compact, edit_distance  # noqa: E402
+from app.services.ai.matcher import SkillMatcher  # noqa: E402
+from app.services.ai.skills import _normalize_text  # noqa: E402
+
+
+def _misspell(skill: str, rng: random.Random) -> str:
+    if " " not in skill and len(skill) >= 8 and rng.random() < 0.3:
+        cut = rng.randint(3, len(skill) - 3)
+        return skill[:cut] + " " + skill[cut:]
+    i = rng.randrange(1, len(skill))
+    op = rng.choice("dst")
+    if op == "d":
+        return skill[:i] + skill[i + 1 :]
+    if op == "s":
+        return skill[:i] + rng.choice("aeiourstn") + skill[i + 1 :]
+    i = min(i, len(skill) - 2)
+    return skill[:i] + skill[i + 1] + skill[i] + skill[i + 2 :]
+
+
+def _documents(n: int, skills: list[str], rng: random.Random, typo_rate: float):
+    eligible = [s for s in skills if len(compact(s)) >= 7 and s.isascii()]
+    docs = []
+    for _ in range(n):
+        words = [rng.choice(_FILLER) for _ in range(rng.randint(300, 900))]
+        misspelled, inserted = set(), set()
+        for _ in range(rng.randint(5, 40)):
+            skill = rng.choice(skills)
+            if eligible and rng.random() < typo_rate:
+                skill = rng.choice(eligible)
+                words.insert(rng.randrange(len(words)), _misspell(skill, rng))
+                misspelled.add(skill.strip().lower())
+            else:
+                words.insert(rng.randrange(len(words)), skill)
+            inserted.add(skill.strip().lower())
+        docs.append((_normalize_text(" ".join(words)), misspelled, inserted))
+    return docs
+
+
+def _naive(index: FuzzySkillIndex, text: str, covered) -> int:
+    """
+    The brute-force alternative: every uncovered token against every skill.
+    """
+    taken = {i for s, e, _ in covered for i in range(s, e)}
+    keys = list(index.terms)
+    found = 0
+    for m in re.finditer(r"\S+", text):
+        token = compact(m.group())
+        if len(token) < index.min_length or m.start() in taken:
+            continue
+        for key in keys:
+            allowed = index._allowed_distance(len(key))
+            if allowed and edit_distance(token, key, allowed) <= allowed:
+                found += 1
+                break
+    return found
+
+
+def _ms(samples: list[float]) -> tuple[float, float]:
+    samples = sorted(samples)
+    return statistics.fmean(samples), samples[int(0.95 * (len(samples) - 1))]
+
+
+def run_synthetic(args: argparse.Namespace) -> None:
+    print(
+        f"{'skills':>8}{'build ms':>10}{'terms':>8}{'MB':>7}{'cold ms/doc':>13}{'warm ms/doc':>13}{'p95':>8}"
+        f"{'naive ms/doc':>14}{'recall':>8}{'extra/doc':>11}"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(args.seed)
+        skills = _dictionary(size, rng)
+        docs = _documents(args.docs, skills, rng, args.typo_rate)
+        matcher = SkillMatcher(skills)
+
+        started = time.perf_counter()
+        index = FuzzySkillIndex(matcher.patterns, min_confidence=args.min_confidence)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        covered_by_doc = [list(matcher.find_all(text)) for text, _, _ in docs]
+        # First pass fills the per-token caches; the second is steady state.
+        cold: list[float] = []
+        for (text, _, _), covered in zip(docs, covered_by_doc):
+            started = time.perf_counter()
+            list(index.find(text, covered))
+            cold.append((time.perf_counter() - started) * 1000)
+
+        timings: list[float] = []
+        hits_found = injected_total = extra = 0
+        for (text, misspelled, inserted), covered in zip(docs, covered_by_doc):
+            exact = {matcher.patterns[pid] for _, _, pid in covered}
+            started = time.perf_counter()
+            fuzzy = {matcher.patterns[pid] for _, _, pid, _ in index.find(text, covered)}
+            timings.append((time.perf_counter() - started) * 1000)
+            expected = misspelled - exact
+            injected_total += len(expected)
+            hits_found += len(expected & fuzzy)
+            # Separator-split spellings of inserted skills ("ci cd") are true hits too.
+            extra += len(fuzzy - inserted)
+        mean_ms, p95_ms = _ms(timings)
+
+        naive_docs = docs[: args.naive_docs]
+        started = time.perf_counter()
+        for text, _, _ in naive_docs:
+            _naive(index, text, list(matcher.find_all(text)))
+        naive_ms = (time.perf_counter() - started) * 1000 / len(naive_docs)
+
+        recall = hits_found / injected_total if injected_total else 1.0
+        print(
+            f"{size:>8}{build_ms:>10.0f}{len(index):>8}{index.memory_bytes() / 2**20:>7.1f}"
+            f"{statistics.fmean(cold):>13.3f}{mean_ms:>13.3f}{p95_ms:>8.3f}{naive_ms:>14.1f}{recall:>8.2f}{extra / len(docs):>11.2f}"
+        )
+
+
+async def run_from_db(args: argparse.Namespace) -> None:
+    from sqlalchemy import select
+
+    from app.core.database import AsyncSessionLocal
+    from app.models.resume import Resume
+    from app.services.ai.taxonomy import taxonomy_registry
+    from app.services.skill_taxonomy import refresh_skill_taxonomy
+
+    async with AsyncSessionLocal() as db:
+        await refresh_skill_taxonomy(db)
+        texts = (
+            await db.execute(
+                select(Resume.extracted_text).where(Resume.extracted_text.is_not(None)).limit(args.docs)
+            )
+        ).scalars().all()
+    matcher = taxonomy_registry.current.extractor.matcher
+    started = time.perf_counter()
+    index = FuzzySkillIndex(matcher.patterns, min_confidence=args.min_confidence)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    timings: list[float] = []
+    added: list[int] = []
+    for raw in texts:
+        text = _normalize_text(raw)
+        covered = list(matcher.find_all(text))
+        exact = {pid for _, _, pid in covered}
+        started = time.perf_counter()
+        fuzzy = {pid for _, _, pid, _ in index.find(text, covered)}
+        timings.append((time.perf_counter() - started) * 1000)
+        added.append(len(fuzzy - exact))
+    if not timings:
+        print("No stored resumes.")
+        return
+    mean_ms, p95_ms = _ms(timings)
+    print(f"{len(texts)} resumes, {len(index)} terms, build {build_ms:.0f} ms")
+    print(f"fuzzy stage: mean {mean_ms:.3f} ms/doc, p95 {p95_ms:.3f} ms/doc")
+    print(f"extra skills per resume: mean {statistics.fmean(added):.2f}, max {max(added)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="37,1000,20000")
+    parser.add_argument("--docs", type=int, default=300)
+    parser.add_argument("--naive-docs", type=int, default=5)
+    parser.add_argument("--typo-rate", type=float, default=0.3)
+    parser.add_argument("--min-confidence", type=float, default=0.85)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--from-db", action="store_true")
+    args = parser.parse_args()
+    if args.from_db:
+        asyncio.run(run_from_db(args))
+    else:
+        run_synthetic(args)
+
+
+if __name__ == "__main__":
+    main()
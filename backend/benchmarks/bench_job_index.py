@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Top-k latency and recall of the per-user job indexes.
+
+Job vectors are synthetic unit embeddings drawn around --clusters topic
+centres (postings in one field resemble each other) with --spread
+noise, queries are drawn the same way. `--clusters 1` gives data with
+no cluster structure for the IVF lists to exploit, the hard case.
+Reports, per index size:
+
+- build ms (exact: incremental adds; IVF: k-means training plus nprobe
+  calibration against --recall-target);
+- the calibrated nprobe out of the number of lists;
+- median ms per top-k query for a full scan (one matrix-vector product
+  plus argsort, what ranking without an index costs), `ExactIndex` and
+  `IVFIndex`;
+- IVF recall@k against the exact top-k on the benchmark queries, next to
+  the recall@10 estimated during calibration;
+- ms per incremental add + remove on the IVF index.
+
+Usage (from backend/):
+
+    python benchmarks/bench_job_index.py --sizes 1000,10000,50000 --k 10
+    python benchmarks/bench_job_index.py --sizes 20000 --clusters 1
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.services.ai.job_index import ExactIndex, IVFIndex  # noqa: E402
+
+
+def _embeddings(n: int, centres: np.ndarray, spread: float, rng: np.random.Generator) -> np.ndarray:
+    topics = centres[rng.integers(0, centres.shape[0], n)]
+    mat = topics + spread * rng.standard_normal(topics.shape).astype(np.float32) / np.sqrt(centres.shape[1])
+    return (mat / np.linalg.norm(mat, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _median_ms(fn, queries: np.ndarray) -> float:
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--spread", type=float, default=0.6)
+    parser.add_argument("--nprobe", type=int, default=8, help="minimum nprobe")
+    parser.add_argument("--recall-target", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'jobs':>8}{'exact build':>13}{'ivf build':>11}{'nprobe':>10}{'scan ms':>10}"
+        f"{'exact ms':>10}{'ivf ms':>9}{'recall':>9}{'est.':>7}{'ivf add+rm':>12}"
+    )
+    for n in (int(s) for s in args.sizes.split(",")):
+        rng = np.random.default_rng(args.seed)
+        centres = rng.standard_normal((args.clusters, args.dim)).astype(np.float32)
+        centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+        vectors = _embeddings(n, centres, args.spread, rng)
+        queries = _embeddings(args.queries, centres, args.spread, rng)
+        ids = [uuid.UUID(int=i) for i in range(n)]
+
+        started = time.perf_counter()
+        exact = ExactIndex(args.dim)
+        for job_id, vector in zip(ids, vectors):
+            exact.add(job_id, vector)
+        exact_build = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        ivf = IVFIndex(ids, vectors, nprobe=args.nprobe, recall_target=args.recall_target)
+        ivf_build = (time.perf_counter() - started) * 1000
+
+        def scan(query: np.ndarray) -> None:
+            np.argsort(-(vectors @ query))[: args.k]
+
+        scan_ms = _median_ms(scan, queries)
+        exact_ms = _median_ms(lambda q: exact.search(q, args.k), queries)
+        ivf_ms = _median_ms(lambda q: ivf.search(q, args.k), queries)
+
+        hits = 0
+        for query in queries:
+            truth = {job_id for job_id, _ in exact.search(query, args.k)}
+            hits += len(truth & {job_id for job_id, _ in ivf.search(query, args.k)})
+        recall = hits / (args.k * len(queries))
+
+        extra = _embeddings(100, centres, args.spread, rng)
+        started = time.perf_counter()
+        for i, vector in enumerate(extra):
+            job_id = uuid.UUID(int=n + i)
+            ivf.add(job_id, vector)
+            ivf.remove(job_id)
+        churn_ms = (time.perf_counter() - started) * 1000 / len(extra)
+
+        print(
+            f"{n:>8}{exact_build:>13.1f}{ivf_build:>11.1f}{f'{ivf.nprobe}/{ivf.nlist}':>10}{scan_ms:>10.3f}"
+            f"{exact_ms:>10.3f}{ivf_ms:>9.3f}{recall:>9.3f}{ivf.recall:>7.3f}{churn_ms:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
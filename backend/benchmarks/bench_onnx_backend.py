@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+sentence-transformers (PyTorch) vs. onnxruntime (fp32 / int8) embedding backends.
+
+For each backend, in a fresh interpreter so imports and allocations are
+not shared:
+
+- cold start: import + model load + first encode, and RSS afterwards;
+- single-text latency (p50 / p95) over --latency-runs calls;
+- batch throughput (texts/s) encoding --n texts with --batch-size;
+
+then, in this process, cosine agreement of each ONNX variant with the
+PyTorch vectors (the documented tolerance in app.services.ai.onnx_backend).
+
+Requires an exported model (python export_onnx_model.py).
+
+Usage (from backend/):
+
+    python benchmarks/bench_onnx_backend.py --n 512 --batch-size 32
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+_WORDS = (
+    "python java react docker kubernetes aws sql lead senior design api cloud data "
+    "built deployed team pipelines microservices testing analytics customers platform"
+).split()
+
+
+def _texts(n: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    return [" ".join(rng.choice(_WORDS, size=int(rng.integers(8, 160)))) for _ in range(n)]
+
+
+def _make_backend(kind: str, batch_size: int):
+    if kind == "torch":
+        from app.services.ai.embeddings import SentenceTransformerBackend
+
+        return SentenceTransformerBackend(batch_size=batch_size)
+    from app.services.ai.onnx_backend import OnnxEmbeddingBackend
+
+    return OnnxEmbeddingBackend(batch_size=batch_size, quantized=kind == "onnx-int8")
+
+
+def _worker(kind: str, n: int, batch_size: int, latency_runs: int) -> dict:
+    from app.services.ai.embeddings import _current_rss_bytes
+
+    rss_start = _current_rss_bytes() or 0
+    started = time.perf_counter()
+    backend = _make_backend(kind, batch_size)
+    backend.embed(["warmup"])
+    cold_start = time.perf_counter() - started
+    rss_loaded = _current_rss_bytes() or 0
+
+    texts = _texts(n)
+    latencies = []
+    for text in texts[:latency_runs]:
+        t0 = time.perf_counter()
+        backend.embed([text])
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    backend.embed(texts)
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "backend": kind,
+        "cold_start_s": round(cold_start, 3),
+        "rss_mb": round(rss_loaded / 2**20, 1),
+        "rss_delta_mb": round((rss_loaded - rss_start) / 2**20, 1),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+        "texts_per_s": round(n / elapsed, 1),
+        "peak_rss_mb": round((_current_rss_bytes() or 0) / 2**20, 1),
+    }
+
+
+def _run_isolated(kind: str, args: argparse.Namespace) -> dict:
+    cmd = [
+        sys.executable,
+        __file__,
+        "--worker", kind,
+        "--n", str(args.n),
+        "--batch-size", str(args.batch_size),
+        "--latency-runs", str(args.latency_runs),
+    ]
+    out = subprocess.run(cmd, cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _agreement(kinds: list[str], n: int, batch_size: int) -> None:
+    texts = _texts(n, seed=1)
+    reference = np.asarray(_make_backend("torch", batch_size).embed(texts), dtype=np.float64)
+    for kind in kinds:
+        vectors = np.asarray(_make_backend(kind, batch_size).embed(texts), dtype=np.float64)
+        cos = (reference * vectors).sum(axis=1) / (
+            np.linalg.norm(reference, axis=1) * np.linalg.norm(vectors, axis=1)
+        )
+        print(f"{kind:<12} cosine vs torch: min={cos.min():.5f} mean={cos.mean():.5f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--latency-runs", type=int, default=100)
+    parser.add_argument("--backends", default="torch,onnx-fp32,onnx-int8")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.n, args.batch_size, args.latency_runs)))
+        return
+
+    kinds = [k.strip() for k in args.backends.split(",") if k.strip()]
+    columns = ["backend", "cold_start_s", "rss_mb", "rss_delta_mb", "p50_ms", "p95_ms", "texts_per_s", "peak_rss_mb"]
+    print(f"n={args.n} batch_size={args.batch_size}")
+    print("".join(f"{c:>14}" for c in columns))
+    for kind in kinds:
+        row = _run_isolated(kind, args)
+        print("".join(f"{row[c]!s:>14}" for c in columns))
+
+    onnx_kinds = [k for k in kinds if k != "torch"]
+    if "torch" in kinds and onnx_kinds:
+        _agreement(onnx_kinds, min(args.n, 256), args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Accuracy vs. memory / speed of compact embedding encodings.
+
+Compares the JSON float-list representation we used to persist against
+raw f32, f16 and int8 (per-vector scale) payloads from
+app.services.ai.quantization:
+
+- bytes per vector;
+- decode + similarity time for scanning N stored vectors against a query;
+- absolute cosine error and top-10 ranking overlap versus float64.
+
+Vectors are synthetic by default (anisotropic Gaussian, like sentence
+embeddings). Pass --texts-from-model to encode real text with the
+configured sentence-transformers model instead.
+
+Usage (from backend/):
+
+    python benchmarks/bench_quantization.py --n 20000 --dim 384
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.ai.quantization import decode_vector, encode_vector  # noqa: E402
+
+
+def _synthetic(n: int, dim: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    # A shared direction plus decaying per-axis variance mimics real embeddings.
+    scales = 1.0 / np.sqrt(np.arange(1, dim + 1))
+    base = rng.normal(size=dim)
+    return base * 0.5 + rng.normal(size=(n, dim)) * scales
+
+
+def _model_vectors(n: int) -> np.ndarray:
+    from app.services.ai.embeddings import SentenceTransformerBackend
+
+    words = "python java react docker kubernetes aws sql lead senior design api cloud data".split()
+    rng = np.random.default_rng(0)
+    texts = [" ".join(rng.choice(words, size=40)) for _ in range(n)]
+    return np.asarray(SentenceTransformerBackend().embed(texts), dtype=np.float64)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--texts-from-model", action="store_true")
+    args = parser.parse_args()
+
+    vectors = _model_vectors(args.n) if args.texts_from_model else _synthetic(args.n, args.dim, args.seed)
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    query = unit[0]
+    exact = unit @ query
+    exact_top = set(np.argsort(-exact)[:10])
+
+    print(f"n={len(unit)} dim={unit.shape[1]}")
+    print(f"{'format':<8}{'bytes/vec':>10}{'scan ms':>10}{'max |err|':>12}{'mean |err|':>12}{'top10':>7}")
+
+    payloads = [json.dumps(v.tolist()) for v in unit]
+    started = time.perf_counter()
+    scores = np.asarray([np.asarray(json.loads(p), dtype=np.float64) @ query for p in payloads])
+    elapsed = (time.perf_counter() - started) * 1000
+    size = sum(len(p) for p in payloads) / len(payloads)
+    print(f"{'json':<8}{size:>10.0f}{elapsed:>10.1f}{np.abs(scores - exact).max():>12.2e}"
+          f"{np.abs(scores - exact).mean():>12.2e}{len(exact_top & set(np.argsort(-scores)[:10])):>7}")
+
+    for encoding in ("f32", "f16", "i8"):
+        blobs = [encode_vector(v, encoding) for v in unit]
+        q = decode_vector(encode_vector(query, encoding)).astype(np.float32)
+        started = time.perf_counter()
+        scores = np.asarray([decode_vector(b).astype(np.float32, copy=False) @ q for b in blobs])
+        elapsed = (time.perf_counter() - started) * 1000
+        size = sum(len(b) for b in blobs) / len(blobs)
+        err = np.abs(scores - exact)
+        overlap = len(exact_top & set(np.argsort(-scores)[:10]))
+        print(f"{encoding:<8}{size:>10.0f}{elapsed:>10.1f}{err.max():>12.2e}{err.mean():>12.2e}{overlap:>7}")
+
+
+if __name__ == "__main__":
+    main()
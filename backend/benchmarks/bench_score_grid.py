@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Scalar `score_pair` loop vs. the vectorized `score_grid` over resume x job
+grids.
+
+Resumes and jobs are synthetic feature sets over a dictionary of --skills
+entries (10-40 skills each, importances from the section weights, random
+years and formatting signals) with random unit embeddings. Reports, per
+grid size:
+
+- ms for the whole grid with the scalar kernel (one similarity per pair
+  from a matrix-vector product per resume, then `score_pair`); at large
+  sizes only --scalar-pairs pairs are timed and the total extrapolated;
+- ms for `similarity_grid` + `score_grid`;
+- how many of the scalar-scored pairs got a different `ats_score`
+  (expected 0: the grid is exact).
+
+Usage (from backend/):
+
+    python benchmarks/bench_score_grid.py --sizes 10x10,50x200,200x200,1000x1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.services.ai.score_grid import score_grid, similarity_grid  # noqa: E402
+from app.services.ai.scoring import (  # noqa: E402
+    JobFeatures,
+    ResumeFeatures,
+    ScoringFeatures,
+    compute_similarity_scores,
+    score_pair,
+)
+
+_IMPORTANCE = (2.0, 1.5, 1.0, 0.5)
+
+
+def _unit(rows: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    mat = rng.standard_normal((rows, dim)).astype(np.float32)
+    return mat / np.linalg.norm(mat, axis=1, keepdims=True)
+
+
+def _features(n_resumes: int, n_jobs: int, skills: list[str], rng: random.Random):
+    resumes = [
+        ResumeFeatures(
+            skills=frozenset(rng.sample(skills, rng.randint(10, 40))),
+            years=rng.choice([None, 1.0, 2.0, 3.0, 5.0, 8.0, 12.0]),
+            length=rng.randint(1500, 9000),
+            has_bullets=rng.random() < 0.7,
+        )
+        for _ in range(n_resumes)
+    ]
+    jobs = []
+    for _ in range(n_jobs):
+        wanted = rng.sample(skills, rng.randint(10, 40))
+        jobs.append(
+            JobFeatures(
+                skills=frozenset(wanted),
+                importance={s: rng.choice(_IMPORTANCE) for s in wanted},
+                required_years=rng.choice([None, 2.0, 3.0, 5.0, 7.0]),
+                fullstack_role=rng.random() < 0.2,
+            )
+        )
+    return resumes, jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10x10,50x200,200x200,1000x1000")
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--scalar-pairs", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    skills = ["react", "node.js"] + [f"skill{i}" for i in range(args.skills - 2)]
+    print(f"{'grid':>11}{'pairs':>10}{'scalar ms':>12}{'grid ms':>10}{'speedup':>9}{'mismatches':>12}")
+    for size in args.sizes.split(","):
+        n_resumes, n_jobs = (int(n) for n in size.split("x"))
+        rng = random.Random(args.seed)
+        nrng = np.random.default_rng(args.seed)
+        resumes, jobs = _features(n_resumes, n_jobs, skills, rng)
+        resume_vecs = _unit(n_resumes, args.dim, nrng)
+        job_vecs = _unit(n_jobs, args.dim, nrng)
+
+        started = time.perf_counter()
+        similarity = similarity_grid(resume_vecs, job_vecs, normalized=True)
+        grid = score_grid(resumes, jobs, similarity)
+        grid_ms = (time.perf_counter() - started) * 1000
+
+        # Scalar: whole resume rows until --scalar-pairs pairs are scored.
+        pairs = n_resumes * n_jobs
+        rows = max(1, min(n_resumes, args.scalar_pairs // max(1, n_jobs)))
+        mismatches = 0
+        started = time.perf_counter()
+        for r in range(rows):
+            sims = compute_similarity_scores(resume_vecs[r], job_vecs, normalized=True)
+            for j, job in enumerate(jobs):
+                score_pair(ScoringFeatures.of(resumes[r], job, float(sims[j])))
+        scalar_ms = (time.perf_counter() - started) * 1000 * n_resumes / rows
+
+        # Exactness against the grid's own similarities.
+        for r in range(rows):
+            for j, job in enumerate(jobs):
+                score = score_pair(ScoringFeatures.of(resumes[r], job, float(similarity[r, j])))
+                mismatches += score.ats_score != grid.ats_score[r, j]
+
+        label = f"{n_resumes}x{n_jobs}"
+        est = "~" if rows < n_resumes else ""
+        print(
+            f"{label:>11}{pairs:>10}{est + f'{scalar_ms:.1f}':>12}{grid_ms:>10.1f}"
+            f"{scalar_ms / grid_ms:>8.1f}x{mismatches:>6}/{rows * n_jobs}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Per-skill regex loop vs. the compiled Aho-Corasick skill matcher.
+
+For each dictionary size (default 37 built-in skills, 1k and 20k), the
+dictionary is the built-in skills padded with synthetic single-token and
+multi-word entries. Reports:
+
+- compile time, automaton size and approximate memory for the matcher;
+- mean ms per document for the legacy regex loop and for the matcher;
+- whether both return identical skills on every document.
+
+The legacy loop is only timed on --legacy-docs documents at large sizes,
+since it is O(skills x text).
+
+Usage (from backend/):
+
+    python benchmarks/bench_skill_matcher.py --sizes 37,1000,20000 --docs 200
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.ai.matcher import SkillMatcher  # noqa: E402
+from app.services.ai.skills import _DEFAULT_SKILLS, _normalize_text  # noqa: E402
+
+_FILLER = (
+    "built deployed led team services platform customers data pipelines years experience "
+    "responsible designed improved latency reduced cost migrated scaled tested documented"
+).split()
+
+
+def _dictionary(size: int, rng: random.Random) -> list[str]:
+    skills = list(_DEFAULT_SKILLS)
+    seen = set(skills)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(skills) < size:
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        if rng.random() < 0.3:
+            word += " " + "".join(rng.choice(letters) for _ in range(rng.randint(3, 8)))
+        elif rng.random() < 0.1:
+            word += rng.choice([".js", "++", "#", "db"])
+        if word not in seen:
+            seen.add(word)
+            skills.append(word)
+    return skills[:size]
+
+
+def _documents(n: int, skills: list[str], rng: random.Random) -> list[str]:
+    docs = []
+    for _ in range(n):
+        words = [rng.choice(_FILLER) for _ in range(rng.randint(300, 900))]
+        for _ in range(rng.randint(5, 40)):
+            words.insert(rng.randrange(len(words)), rng.choice(skills))
+        docs.append(" ".join(words))
+    return docs
+
+
+def _legacy(skills: list[str], normalized: str) -> list[str]:
+    found = set()
+    for skill in skills:
+        s = skill.strip().lower()
+        if not s:
+            continue
+        if " " in s:
+            if s in normalized:
+                found.add(skill)
+        elif re.search(rf"\b{re.escape(s)}\b", normalized):
+            found.add(skill)
+    return sorted(found)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="37,1000,20000")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--legacy-docs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'skills':>8}{'compile ms':>12}{'states':>10}{'MB':>8}{'legacy ms/doc':>15}{'matcher ms/doc':>16}{'speedup':>9}{'same':>6}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(args.seed)
+        skills = _dictionary(size, rng)
+        docs = [_normalize_text(d) for d in _documents(args.docs, skills, rng)]
+
+        started = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        fast = [sorted(matcher.match(d)) for d in docs]
+        matcher_ms = (time.perf_counter() - started) * 1000 / len(docs)
+
+        legacy_docs = docs if size <= 1000 else docs[: args.legacy_docs]
+        started = time.perf_counter()
+        slow = [_legacy(skills, d) for d in legacy_docs]
+        legacy_ms = (time.perf_counter() - started) * 1000 / len(legacy_docs)
+
+        same = all(a == b for a, b in zip(fast, slow))
+        print(f"{size:>8}{compile_ms:>12.1f}{matcher.state_count:>10}"
+              f"{matcher.memory_bytes() / 2**20:>8.1f}{legacy_ms:>15.2f}"
+              f"{matcher_ms:>16.3f}{legacy_ms / matcher_ms:>8.1f}x{'yes' if same else 'NO':>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Bulk skill-extraction throughput: per-skill regex loop vs. the online
+Aho-Corasick extractor vs. the spaCy `nlp.pipe` pipeline.
+
+Documents are synthetic resumes (filler words with skills inserted, as in
+bench_skill_matcher.py) over a dictionary of --skills entries, published
+as the active taxonomy (with the built-in aliases) so spaCy workers use
+the same one. Reports docs/s per method and, for spaCy, how many
+documents yield exactly the same skills as the online extractor.
+
+`n_process` > 1 only pays off with spare cores: spaCy ships every
+document to a worker and back, which costs more than matching it.
+
+The regex loop is what `SkillExtractor` did before the compiled matcher;
+it is only timed on --legacy-docs documents.
+
+Usage (from backend/):
+
+    python benchmarks/bench_spacy_pipeline.py --docs 5000 --skills 1000 --n-process 1,2,4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from bench_skill_matcher import _dictionary, _documents, _legacy  # noqa: E402
+
+from app.services.ai.skills import _normalize_text  # noqa: E402
+from app.services.ai.spacy_pipeline import pipe_skill_mentions  # noqa: E402
+from app.services.ai.taxonomy import (  # noqa: E402
+    SkillEntry,
+    SkillTaxonomy,
+    builtin_taxonomy,
+    compile_taxonomy,
+    taxonomy_registry,
+    taxonomy_version,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--legacy-docs", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--n-process", default="1,2")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = _dictionary(args.skills, rng)
+    docs = _documents(args.docs, skills, rng)
+    taxonomy = SkillTaxonomy(
+        version=taxonomy_version("bench", args.skills, args.seed),
+        source="benchmark",
+        entries=tuple(SkillEntry(s) for s in skills),
+        aliases=builtin_taxonomy().aliases,
+    )
+    taxonomy_registry.publish(compile_taxonomy(taxonomy))
+    extractor = taxonomy_registry.current.extractor
+    print(f"{args.docs} documents, {len(skills)} skills, mean {sum(map(len, docs)) // len(docs)} chars\n")
+
+    print(f"{'method':<28}{'docs/s':>10}{'vs regex':>10}{'same skills':>13}")
+
+    legacy_docs = docs[: args.legacy_docs]
+    started = time.perf_counter()
+    for d in legacy_docs:
+        _legacy(skills, _normalize_text(d))
+    regex_rate = len(legacy_docs) / (time.perf_counter() - started)
+    print(f"{'regex loop':<28}{regex_rate:>10.0f}{1.0:>9.1f}x{'-':>13}")
+
+    started = time.perf_counter()
+    reference = [[m.skill for m in extractor.extract_mentions(d)] for d in docs]
+    rate = len(docs) / (time.perf_counter() - started)
+    print(f"{'aho-corasick (online)':<28}{rate:>10.0f}{rate / regex_rate:>9.1f}x{'-':>13}")
+
+    for n_process in (int(n) for n in args.n_process.split(",")):
+        rows = ((i, d, "resume", None) for i, d in enumerate(docs))
+        started = time.perf_counter()
+        out = list(
+            pipe_skill_mentions(
+                rows,
+                taxonomy_version=taxonomy.version,
+                batch_size=args.batch_size,
+                n_process=n_process,
+            )
+        )
+        rate = len(docs) / (time.perf_counter() - started)
+        same = sum(ref == [m.skill for m in mentions] for ref, (_, mentions) in zip(reference, out))
+        label = f"spacy pipe n_process={n_process}"
+        print(f"{label:<28}{rate:>10.0f}{rate / regex_rate:>9.1f}x{same:>7}/{len(docs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Loading a user's job vectors: per-row payload decode vs. the mapped
+segment store.
+
+For each size, --dim vectors are encoded the way `document_embeddings`
+stores them (`encode_vector`, --encoding) and also appended to a
+temporary `ShardStore`. Reports:
+
+- ms to turn the stored payloads into one float32 matrix (decode every
+  row, then stack), i.e. what loading from Postgres costs after the
+  rows have arrived;
+- ms for a cold `ShardStore` in a fresh object to map the shard and
+  return every vector (`get`), and to stack them;
+- ms for a top-10 scan of the mapped segments (`ShardStore.search`);
+- ms per compaction after deleting --delete-share of the rows.
+
+Usage (from backend/):
+
+    python benchmarks/bench_vector_store.py --sizes 1000,10000,50000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.services.ai.quantization import decode_vector, encode_vector  # noqa: E402
+from app.services.ai.vector_store import ShardStore  # noqa: E402
+
+
+def _ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--encoding", choices=["f16", "f32"], default="f16")
+    parser.add_argument("--delete-share", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}{'decode ms':>11}{'map+get ms':>12}{'stack ms':>10}{'scan ms':>9}{'compact ms':>12}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        rng = np.random.default_rng(args.seed)
+        vectors = rng.standard_normal((n, args.dim)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        ids = [uuid.UUID(int=i) for i in range(n)]
+        payloads = [encode_vector(v, args.encoding) for v in vectors]
+        now = datetime.now(timezone.utc)
+
+        root = Path(tempfile.mkdtemp(prefix="bench-vector-store-"))
+        try:
+            writer = ShardStore(root, dtype=args.encoding, segment_rows=1 << 20)
+            writer.upsert([(job_id, vec, now) for job_id, vec in zip(ids, vectors)])
+
+            started = time.perf_counter()
+            np.stack([np.asarray(decode_vector(p), dtype=np.float32) for p in payloads])
+            decode_ms = _ms(started)
+
+            reader = ShardStore(root, dtype=args.encoding, segment_rows=1 << 20)
+            started = time.perf_counter()
+            found = reader.get(ids)
+            get_ms = _ms(started)
+            started = time.perf_counter()
+            np.stack([vec for vec, _ in found.values()]).astype(np.float32)
+            stack_ms = _ms(started)
+
+            started = time.perf_counter()
+            reader.search(vectors[0], 10)
+            scan_ms = _ms(started)
+
+            writer.delete(ids[: int(n * args.delete_share)])
+            started = time.perf_counter()
+            writer.compact()
+            compact_ms = _ms(started)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+        print(f"{n:>8}{decode_ms:>11.1f}{get_ms:>12.1f}{stack_ms:>10.1f}{scan_ms:>9.1f}{compact_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
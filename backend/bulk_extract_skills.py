@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Re-extract skills for stored resumes and job descriptions in bulk.
+
+Rows are streamed from the database in id order (keyset pages of
+--page-size), pushed through the spaCy skill pipeline
+(app/services/ai/spacy_pipeline.py) with `nlp.pipe(batch_size,
+n_process)` on a background thread, and written back every
+--write-batch documents: one bulk insert per table plus the taxonomy
+version stamp, exactly what ingest-time extraction stores.
+
+By default only documents whose stamp differs from the active taxonomy
+version are processed, so an interrupted run can simply be restarted.
+
+Usage (from backend/):
+
+    python bulk_extract_skills.py
+    python bulk_extract_skills.py --kind resumes --n-process 4 --batch-size 512
+    python bulk_extract_skills.py --all --write-batch 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import null, select
+
+from app.core.database import AsyncSessionLocal
+from app.models.job import JobDescription
+from app.models.resume import Resume
+from app.services.ai.spacy_pipeline import build_skill_nlp, pipe_skill_mentions
+from app.services.ai.taxonomy import taxonomy_registry
+from app.services.document_skills import store_skill_mentions
+from app.services.skill_taxonomy import refresh_skill_taxonomy
+
+logger = logging.getLogger("bulk_extract_skills")
+
+_DONE = object()
+
+
+async def _stream_rows(
+    model: type[Resume] | type[JobDescription],
+    *,
+    version: str,
+    include_current: bool,
+    page_size: int,
+) -> AsyncIterator[list[tuple[Any, str, str, str | None]]]:
+    if model is Resume:
+        columns = (Resume.id, Resume.extracted_text, null().label("sections"))
+        kind = "resume"
+    else:
+        columns = (JobDescription.id, JobDescription.description_text, JobDescription.sections)
+        kind = "job"
+    last_id = None
+    async with AsyncSessionLocal() as db:
+        while True:
+            stmt = select(*columns).order_by(model.id).limit(page_size)
+            if last_id is not None:
+                stmt = stmt.where(model.id > last_id)
+            if not include_current:
+                stmt = stmt.where(model.skills_taxonomy_version.is_distinct_from(version))
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [(row_id, text or "", kind, sections) for row_id, text, sections in rows]
+
+
+async def _run_kind(
+    model: type[Resume] | type[JobDescription],
+    args: argparse.Namespace,
+    version: str,
+) -> int:
+    loop = asyncio.get_running_loop()
+    inbox: queue.Queue = queue.Queue(maxsize=4)
+    outbox: asyncio.Queue = asyncio.Queue()
+    nlp = build_skill_nlp(version, args.model)
+
+    def _pipe() -> None:
+        rows = (row for page in iter(inbox.get, _DONE) for row in page)
+        try:
+            for item in pipe_skill_mentions(
+                rows,
+                taxonomy_version=version,
+                batch_size=args.batch_size,
+                n_process=args.n_process,
+                nlp=nlp,
+            ):
+                loop.call_soon_threadsafe(outbox.put_nowait, item)
+        except BaseException as exc:  # surfaced by the writer
+            loop.call_soon_threadsafe(outbox.put_nowait, exc)
+        finally:
+            loop.call_soon_threadsafe(outbox.put_nowait, _DONE)
+
+    async def _read() -> None:
+        try:
+            async for page in _stream_rows(
+                model,
+                version=version,
+                include_current=args.all,
+                page_size=args.page_size,
+            ):
+                await asyncio.to_thread(inbox.put, page)
+        finally:
+            await asyncio.to_thread(inbox.put, _DONE)
+
+    worker = threading.Thread(target=_pipe, name="spacy-pipe", daemon=True)
+    worker.start()
+    reader = asyncio.create_task(_read())
+
+    written = 0
+    started = time.perf_counter()
+    pending: dict[Any, list] = {}
+    async with AsyncSessionLocal() as db:
+
+        async def _flush() -> None:
+            nonlocal written
+            if not pending:
+                return
+            if model is Resume:
+                await store_skill_mentions(db, resume_mentions=pending, version=version)
+            else:
+                await store_skill_mentions(db, job_mentions=pending, version=version)
+            await db.commit()
+            written += len(pending)
+            pending.clear()
+            elapsed = time.perf_counter() - started
+            logger.info("%s: %s documents, %.1f docs/s", model.__tablename__, written, written / elapsed)
+
+        while True:
+            item = await outbox.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            doc_id, mentions = item
+            pending[doc_id] = mentions
+            if len(pending) >= args.write_batch:
+                await _flush()
+        await _flush()
+    await reader
+    worker.join()
+    return written
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with AsyncSessionLocal() as db:
+        await refresh_skill_taxonomy(db)
+    version = taxonomy_registry.current.version
+    logger.info("Extracting with taxonomy %s", taxonomy_registry.current.stats())
+
+    models = {"resumes": [Resume], "jobs": [JobDescription], "all": [Resume, JobDescription]}[args.kind]
+    started = time.perf_counter()
+    total = 0
+    for model in models:
+        total += await _run_kind(model, args, version)
+    logger.info("Done: %s documents in %.1fs", total, time.perf_counter() - started)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kind", choices=("resumes", "jobs", "all"), default="all")
+    parser.add_argument("--all", action="store_true", help="also re-extract documents already on the active taxonomy")
+    parser.add_argument("--batch-size", type=int, default=256, help="nlp.pipe batch size")
+    parser.add_argument("--n-process", type=int, default=1, help="nlp.pipe worker processes")
+    parser.add_argument("--page-size", type=int, default=1000, help="rows fetched per query")
+    parser.add_argument("--write-batch", type=int, default=500, help="documents per bulk write")
+    parser.add_argument("--model", default=None, help="spaCy model to tokenize with (default: blank 'en')")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compact the memory-mapped job vector segments.
+
+Deleted and replaced vectors stay in their segment, tombstoned, until the
+shard is compacted: its live rows are rewritten into one new segment and
+the old files removed. Safe to run while the API is serving; writers wait
+on the shard's file lock and readers pick up the new segment on their
+next refresh.
+
+Usage (from backend/):
+
+    python compact_vectors.py                 # shards with >= 20% dead rows
+    python compact_vectors.py --min-dead 0    # every shard with a dead row
+    python compact_vectors.py --dry-run
+"""
+
+import argparse
+import logging
+
+from app.services.ai.vector_store import vector_store
+
+logger = logging.getLogger("compact_vectors")
+
+
+def main(args: argparse.Namespace) -> int:
+    if vector_store is None:
+        logger.error("vector_store_dir is not set; nothing to compact")
+        return 1
+
+    shards = compacted = dropped = 0
+    for path in vector_store.shard_paths():
+        shard = vector_store.open_path(path)
+        shard.refresh()
+        stats = shard.stats()
+        shards += 1
+        dead = stats["rows"] - stats["live_rows"]
+        if not dead or dead < args.min_dead * stats["rows"]:
+            continue
+        if args.dry_run:
+            logger.info("%s: %s of %s rows dead", path, dead, stats["rows"])
+            continue
+        dropped += shard.compact()
+        compacted += 1
+    logger.info("Compacted %s of %s shard(s), dropped %s row(s)", compacted, shards, dropped)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--min-dead", type=float, default=0.2, help="compact shards with at least this share of dead rows"
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    raise SystemExit(main(parser.parse_args()))
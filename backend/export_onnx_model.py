@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Export the embedding model to ONNX for the onnxruntime CPU backend.
+
+Writes model.onnx, model.int8.onnx (dynamic int8 weight quantization),
+tokenizer.json and export.json into the output directory. Exporting
+needs torch and sentence-transformers; serving with
+EMBEDDING_BACKEND=onnx only needs onnxruntime and tokenizers.
+
+Usage (from backend/):
+
+    python export_onnx_model.py
+    python export_onnx_model.py --model-name all-MiniLM-L6-v2 --output-dir storage/models/all-MiniLM-L6-v2-onnx
+"""
+
+import argparse
+import json
+import logging
+
+from app.core.config import settings
+from app.services.ai.onnx_backend import export_onnx_model
+
+logger = logging.getLogger("export_onnx_model")
+
+
+def main(args: argparse.Namespace) -> int:
+    logger.info("Exporting %s to %s", args.model_name, args.output_dir)
+    metadata = export_onnx_model(
+        args.model_name,
+        args.output_dir,
+        max_length=args.max_length,
+        quantize=not args.no_quantize,
+        opset=args.opset,
+    )
+    print(json.dumps(metadata, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-name", default=settings.embedding_model_name)
+    parser.add_argument("--output-dir", default=settings.onnx_model_dir)
+    parser.add_argument("--max-length", type=int, default=settings.onnx_max_length)
+    parser.add_argument("--opset", type=int, default=14)
+    parser.add_argument("--no-quantize", action="store_true", help="skip the int8 model")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    raise SystemExit(main(parser.parse_args()))
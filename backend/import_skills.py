@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Import a skill taxonomy data file into the `skills` table.
+
+Names are stored normalized (stripped, lowercase), as analysis does;
+existing skills keep their row and only gain a category they lacked.
+Aliases in the file are written to `skill_aliases`, creating their
+canonical skill if needed.
+Running API workers pick the new taxonomy up on their next refresh
+(SKILL_TAXONOMY_REFRESH_SECONDS) without a restart.
+
+The file format is the one accepted by SKILL_TAXONOMY_FILE: a JSON list
+of names or {"name", "category"} objects, optionally wrapped as
+{"version": ..., "skills": [...]}.
+
+Usage (from backend/):
+
+    python import_skills.py data/skills.json
+    python import_skills.py data/skills.json --batch-size 2000 --dry-run
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.database import AsyncSessionLocal
+from app.models.skill import Skill, SkillAlias
+from app.services.ai.taxonomy import (
+    SkillEntry,
+    merge_aliases,
+    merge_entries,
+    read_taxonomy_file,
+    taxonomy_registry,
+)
+from app.services.skill_taxonomy import refresh_skill_taxonomy
+
+logger = logging.getLogger("import_skills")
+
+
+async def main(args: argparse.Namespace) -> int:
+    file_version, entries, aliases = read_taxonomy_file(args.path)
+    aliases = merge_aliases(aliases)
+    entries = merge_entries(entries, (SkillEntry(a.canonical) for a in aliases))
+    logger.info(
+        "Read %s skills and %s aliases (file version %s) from %s",
+        len(entries),
+        len(aliases),
+        file_version,
+        args.path,
+    )
+    if args.dry_run:
+        return 0
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        for offset in range(0, len(entries), args.batch_size):
+            batch = entries[offset : offset + args.batch_size]
+            categories: dict[str, str | None] = {}
+            for e in batch:
+                name = e.name.strip().lower()
+                categories[name] = categories.get(name) or e.category
+            known = (
+                await db.execute(
+                    select(Skill.id, Skill.name, Skill.category).where(Skill.name.in_(categories))
+                )
+            ).all()
+            # Only unknown names are inserted: a conflicting insert still
+            # draws an ordinal, and ordinals should stay dense (see
+            # document_skills.store_skill_mentions).
+            new_names = sorted(set(categories) - {name for _, name, _ in known})
+            if new_names:
+                await db.execute(
+                    insert(Skill).on_conflict_do_nothing(index_elements=[Skill.name]),
+                    [{"name": name, "category": categories[name]} for name in new_names],
+                )
+            filled = [
+                {"id": skill_id, "category": categories[name]}
+                for skill_id, name, category in known
+                if category is None and categories[name]
+            ]
+            if filled:
+                # Bulk UPDATE by primary key; categories already set are kept.
+                await db.execute(update(Skill).execution_options(synchronize_session=False), filled)
+            await db.commit()
+            logger.info("Imported %s/%s", min(offset + args.batch_size, len(entries)), len(entries))
+
+        for offset in range(0, len(aliases), args.batch_size):
+            batch = aliases[offset : offset + args.batch_size]
+            ids = dict(
+                (
+                    await db.execute(
+                        select(Skill.name, Skill.id).where(Skill.name.in_({a.canonical for a in batch}))
+                    )
+                ).all()
+            )
+            stmt = insert(SkillAlias).values(
+                [
+                    {"alias": a.alias, "skill_id": ids[a.canonical], "match_in_text": a.match_in_text}
+                    for a in batch
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SkillAlias.alias],
+                set_={"skill_id": stmt.excluded.skill_id, "match_in_text": stmt.excluded.match_in_text},
+            )
+            await db.execute(stmt)
+            await db.commit()
+        if aliases:
+            logger.info("Imported %s aliases", len(aliases))
+
+        await refresh_skill_taxonomy(db, force=True)
+
+    logger.info(
+        "Done in %.1fs; taxonomy %s",
+        time.perf_counter() - started,
+        taxonomy_registry.current.stats(),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Re-embed resumes and job descriptions with a new embedding model version.
+
+Walks `resumes` and `job_descriptions` in keyset-paginated batches, encodes
+every row that has no vector for the target version (so the job is safe
+to interrupt and re-run), and finally flips the active version in one
+transaction. Until that flip, analyses keep using the previous version.
+
+Usage (from backend/, next to alembic.ini):
+
+    python reembed.py --model-name all-mpnet-base-v2 --model-version 1
+    python reembed.py --model-name all-mpnet-base-v2 --model-version 1 --activate
+    python reembed.py --model-name all-mpnet-base-v2 --model-version 1 --activate-only
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import and_, exists, func, select
+
+from app.core.database import AsyncSessionLocal
+from app.models.embedding import DocumentEmbedding
+from app.models.job import JobDescription
+from app.models.resume import Resume
+from app.services.ai.chunking import aembed_documents
+from app.services.ai.embedding_cache import text_hash
+from app.services.ai.executors import shutdown_executors
+from app.services.document_embeddings import (
+    EmbeddingModelSpec,
+    activate_embedding_model,
+    backend_for,
+    row_values,
+    upsert_embedding,
+)
+
+logger = logging.getLogger("reembed")
+
+_KINDS = {
+    "resumes": (Resume, Resume.extracted_text, DocumentEmbedding.resume_id, "resume_id"),
+    "jobs": (
+        JobDescription,
+        JobDescription.description_text,
+        DocumentEmbedding.job_description_id,
+        "job_description_id",
+    ),
+}
+
+
+def _has_text(text_col):
+    # Image-only PDFs leave blank text, which is never embedded.
+    return func.length(func.trim(text_col)) > 0
+
+
+def _missing_filter(model, owner_col, spec: EmbeddingModelSpec):
+    return ~exists().where(
+        and_(
+            owner_col == model.id,
+            DocumentEmbedding.model_name == spec.model_name,
+            DocumentEmbedding.model_version == spec.model_version,
+        )
+    )
+
+
+async def count_missing(kind: str, spec: EmbeddingModelSpec) -> int:
+    model, text_col, owner_col, _ = _KINDS[kind]
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(func.count())
+            .select_from(model)
+            .where(_has_text(text_col), _missing_filter(model, owner_col, spec))
+        )
+        return int(await db.scalar(stmt) or 0)
+
+
+async def reembed_kind(
+    kind: str,
+    spec: EmbeddingModelSpec,
+    *,
+    batch_size: int,
+    encode_batch_size: int,
+) -> int | None:
+    model, text_col, owner_col, owner_key = _KINDS[kind]
+    backend = backend_for(spec, batching=False, batch_size=encode_batch_size)
+    total = await count_missing(kind, spec)
+    logger.info("%s: %s rows need %s", kind, total, spec.model_id)
+
+    done = 0
+    dimension: int | None = None
+    last_id = None
+    started = time.perf_counter()
+    while True:
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(model.id, text_col)
+                .where(_has_text(text_col), _missing_filter(model, owner_col, spec))
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(model.id > last_id)
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                break
+
+            texts = [text or "" for _, text in rows]
+            docs = await aembed_documents(backend, texts)
+            for (row_id, _), text, doc in zip(rows, texts, docs):
+                if not doc.vector.size:
+                    continue
+                dimension = int(doc.vector.shape[0])
+                await upsert_embedding(
+                    db,
+                    **{owner_key: row_id},
+                    values=row_values(doc, spec=spec, content_hash=text_hash(text)),
+                )
+            await db.commit()
+
+        last_id = rows[-1][0]
+        done += len(rows)
+        elapsed = max(1e-9, time.perf_counter() - started)
+        logger.info(
+            "%s: %s/%s (%.1f%%) %.1f docs/s",
+            kind,
+            done,
+            total,
+            100.0 * done / max(1, total),
+            done / elapsed,
+        )
+    return dimension
+
+
+async def main(args: argparse.Namespace) -> int:
+    spec = EmbeddingModelSpec(args.model_name, args.model_version)
+    kinds = list(_KINDS) if args.kind == "all" else [args.kind]
+    dimension: int | None = None
+
+    try:
+        if not args.activate_only:
+            for kind in kinds:
+                dim = await reembed_kind(
+                    kind,
+                    spec,
+                    batch_size=args.batch_size,
+                    encode_batch_size=args.encode_batch_size,
+                )
+                dimension = dim or dimension
+
+        if args.activate or args.activate_only:
+            remaining = sum([await count_missing(kind, spec) for kind in _KINDS])
+            if remaining and not args.force:
+                logger.error(
+                    "Refusing to activate %s: %s rows still lack vectors (use --force)",
+                    spec.model_id,
+                    remaining,
+                )
+                return 1
+            async with AsyncSessionLocal() as db:
+                await activate_embedding_model(db, spec=spec, dimension=dimension)
+            logger.info("Activated %s", spec.model_id)
+    finally:
+        shutdown_executors()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-name", required=True)
+    parser.add_argument("--model-version", default="1")
+    parser.add_argument("--kind", choices=["all", *_KINDS], default="all")
+    parser.add_argument("--batch-size", type=int, default=256, help="rows fetched per page")
+    parser.add_argument("--encode-batch-size", type=int, default=128, help="texts per encode batch")
+    parser.add_argument("--activate", action="store_true", help="flip the active version when done")
+    parser.add_argument("--activate-only", action="store_true")
+    parser.add_argument("--force", action="store_true", help="activate even if rows are missing")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))